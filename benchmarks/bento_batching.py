@@ -0,0 +1,162 @@
+"""
+Load test of the Bento service: compares the per-request `/predict` path,
+which builds a one-row DataFrame and calls the model for every request, with
+`/predict_batch`, which lets BentoML's adaptive batching merge concurrent
+requests into one model call. A model fitted on synthetic data is saved to a
+temporary model store, the service is started with `bentoml serve`, and every
+endpoint gets the same single-row requests from concurrent clients. Reports
+throughput, p50/p99 latency and rejected requests.
+
+    python -m benchmarks.bento_batching --requests 2000 --concurrency 32
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import requests
+
+from benchmarks.streaming_training import FEATURES, reference_frame
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import ModelConfig
+from src.features.core import convert_features_type
+
+BENTO_DIR = Path(__file__).resolve().parents[1] / "services" / "backend" / "bento"
+
+
+def save_model(bento_home: Path, model: str) -> None:
+    """
+    Fits the training pipeline on synthetic data and saves it to the model
+    store in a separate process, so the server and clients start clean.
+    """
+    code = f"""
+import bentoml
+from benchmarks.bento_batching import fit_pipeline
+bentoml.sklearn.save_model("medical_regressor", fit_pipeline({model!r}))
+"""
+    env = {**os.environ, "BENTOML_HOME": str(bento_home)}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def fit_pipeline(model: str, transformation: str = "none"):
+    df = reference_frame()
+    X, y = convert_features_type(df.drop(columns="charges")), df["charges"]
+    model_cfg = ModelConfig(
+        name=model,
+        preprocess_num_features=model == "linear",
+        target_transformations=False,
+        params={},
+    )
+    return PipelineBuilder.build(model_cfg, FEATURES, transformation).fit(X, y)
+
+
+def start_server(bento_home: Path, port: int, args) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "BENTOML_HOME": str(bento_home),
+        "MAX_BATCH_SIZE": str(args.max_batch_size),
+        "MAX_LATENCY_MS": str(args.max_latency_ms),
+    }
+    server = subprocess.Popen(
+        [
+            "bentoml",
+            "serve",
+            "service:MedicalRegressorService",
+            "--port",
+            str(port),
+        ],
+        cwd=BENTO_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"http://localhost:{port}/readyz", timeout=1).ok:
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError("Bento service did not become ready")
+
+
+def load_test(url: str, payloads: list[dict], concurrency: int) -> dict[str, float]:
+    """
+    Sends the payloads from `concurrency` client threads and returns the
+    throughput and latency percentiles of successful requests and the number
+    of requests rejected with 503, which BentoML returns when a batch cannot
+    be served within the latency budget.
+    """
+    sessions: dict[int, requests.Session] = {}
+
+    def send(payload: dict) -> tuple[float, int]:
+        session = sessions.setdefault(threading.get_ident(), requests.Session())
+        start = time.perf_counter()
+        response = session.post(url, json=payload, timeout=60)
+        if response.status_code != 503:
+            response.raise_for_status()
+        return time.perf_counter() - start, response.status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, payloads))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, status in results if status == 200])
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": float(np.percentile(latencies, 50) * 1000),
+        "p99": float(np.percentile(latencies, 99) * 1000),
+        "rejected": len(results) - len(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--model", choices=["linear", "rf"], default="rf")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-latency-ms", type=int, default=200)
+    parser.add_argument("--port", type=int, default=3456)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BENTO_DIR))
+    from service import synthetic_rows
+
+    rows = synthetic_rows(args.requests, seed=1)
+    endpoints = {
+        "/predict": [{"input_data": row} for row in rows],
+        "/predict_batch": [{"input_data": [row]} for row in rows],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bento_home = Path(tmp_dir)
+        save_model(bento_home, args.model)
+        server = start_server(bento_home, args.port, args)
+        try:
+            for endpoint, payloads in endpoints.items():
+                url = f"http://localhost:{args.port}{endpoint}"
+                load_test(url, payloads[: args.concurrency * 4], args.concurrency)
+                stats = load_test(url, payloads, args.concurrency)
+                print(
+                    f"{endpoint:<15} {stats['throughput']:8.1f} req/s  "
+                    f"p50 {stats['p50']:7.1f} ms  p99 {stats['p99']:7.1f} ms  "
+                    f"rejected {stats['rejected']}"
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
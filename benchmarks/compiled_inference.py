@@ -0,0 +1,59 @@
+"""
+Microbenchmark of the compiled inference path of the Bento service against
+the sklearn pipeline. For every model and batch size it times the current
+path (DataFrame from request rows, then `pipeline.predict`), the compiled
+path from request rows and the compiled path on a pre-laid-out float array.
+
+    python -m benchmarks.compiled_inference --models linear rf
+"""
+
+import argparse
+import sys
+import timeit
+
+import pandas as pd
+
+from benchmarks.bento_batching import BENTO_DIR, fit_pipeline
+
+BATCH_SIZES = (1, 100, 100_000)
+
+
+def best_time(func, budget: float = 1.0) -> float:
+    """
+    Returns the best time per call in seconds, over repeats within `budget`.
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    repeats = max(int(budget / elapsed), 3)
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", nargs="+", default=["linear", "rf"])
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BENTO_DIR))
+    from compiled import compile_pipeline
+    from service import synthetic_rows
+
+    print(f"{'model':<8} {'rows':>7} {'pipeline':>12} {'compiled':>12} {'array':>12}")
+    for model in args.models:
+        pipeline = fit_pipeline(model)
+        compiled = compile_pipeline(pipeline)
+        for size in BATCH_SIZES:
+            rows = synthetic_rows(size, seed=1)
+            X = compiled.encode(rows)
+            timings = [
+                best_time(lambda: pipeline.predict(pd.DataFrame(rows))),
+                best_time(lambda: compiled.predict(rows)),
+                best_time(lambda: compiled.predict_array(X)),
+            ]
+            print(
+                f"{model:<8} {size:>7} "
+                + " ".join(f"{t * 1e6:>9.1f} us" for t in timings)
+            )
+
+
+if __name__ == "__main__":
+    main()
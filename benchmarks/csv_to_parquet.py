@@ -0,0 +1,107 @@
+"""
+Compares the in-memory pandas converter with the streaming pyarrow converter on
+a generated insurance-like CSV: conversion time, peak RSS growth and output
+size. Each converter runs in a fresh process so peak RSS is measured
+independently.
+
+    python -m benchmarks.csv_to_parquet --rows 5000000
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data.converters import (CSVToParquetConverter,
+                                 StreamingCSVToParquetConverter)
+from src.io.readers import CSVReader
+from src.io.writers import ParquetWriter
+
+COLUMN_TYPES = {
+    "age": "int64",
+    "sex": "string",
+    "bmi": "float64",
+    "children": "int64",
+    "smoker": "string",
+    "region": "string",
+    "charges": "float64",
+}
+
+
+def write_csv(path: Path, rows: int, chunk: int = 500_000) -> None:
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        pd.DataFrame(
+            {
+                "age": rng.integers(18, 65, n),
+                "sex": rng.choice(["female", "male"], n),
+                "bmi": rng.normal(30.0, 6.0, n).round(3),
+                "children": rng.integers(0, 5, n),
+                "smoker": rng.choice(["yes", "no"], n),
+                "region": rng.choice(
+                    ["northeast", "northwest", "southeast", "southwest"], n
+                ),
+                "charges": rng.normal(13000.0, 5000.0, n).round(4),
+            }
+        ).to_csv(path, mode="a", header=start == 0, index=False)
+
+
+def peak_memory() -> float:
+    """
+    Reads the peak RSS of this process from /proc/self/status (Linux) in MiB.
+    """
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def convert(name: str, csv_path: Path, parquet_path: Path, queue: mp.Queue) -> None:
+    converters = {
+        "pandas": CSVToParquetConverter(CSVReader(), ParquetWriter()),
+        "streaming": StreamingCSVToParquetConverter(
+            column_types=COLUMN_TYPES, categorical=["sex", "smoker", "region"]
+        ),
+    }
+    baseline = peak_memory()
+    start = time.perf_counter()
+    converters[name].convert(csv_path, parquet_path)
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, peak_memory() - baseline))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "insurance.csv"
+        write_csv(csv_path, args.rows)
+        print(f"{args.rows} rows, CSV {csv_path.stat().st_size / 2**20:.1f} MiB")
+
+        for name in ("pandas", "streaming"):
+            parquet_path = Path(tmp_dir) / f"{name}.parquet"
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=convert, args=(name, csv_path, parquet_path, queue)
+            )
+            process.start()
+            elapsed, peak = queue.get()
+            process.join()
+            size = parquet_path.stat().st_size / 2**20
+            print(
+                f"{name:<10} {elapsed:7.2f}s  peak RSS +{peak:8.1f} MiB  "
+                f"parquet {size:6.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares joblib artifact modes of `JoblibWriter`/`JoblibReader`: file size,
+save time and load time (plus memory-mapped load for uncompressed files) of a
+RandomForest and a KNN pipeline.
+
+    python -m benchmarks.joblib_modes --rows 20000
+"""
+
+import argparse
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+from sklearn.base import BaseEstimator
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.neighbors import KNeighborsRegressor
+
+from src.containers.types import CompressionType
+from src.io.readers import JoblibReader
+from src.io.writers import JoblibWriter
+
+MODES: list[CompressionType] = [None, "zlib:1", "zlib:3", "gzip:3", "lzma:1", "lz4"]
+
+
+def timed(fn, repeat: int = 3) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench(name: str, model: BaseEstimator, tmp_dir: Path) -> None:
+    writer, reader = JoblibWriter(), JoblibReader()
+    print(f"\n{name}")
+    print(f"{'mode':<8} {'size MiB':>9} {'save s':>8} {'load s':>8} {'mmap s':>8}")
+
+    for mode in MODES:
+        path = tmp_dir / f"{name}_{mode}.pkl"
+        try:
+            save_time, _ = timed(lambda: writer.write(model, path, compress=mode))
+        except ValueError as exc:
+            print(f"{str(mode):<8} skipped: {exc}")
+            continue
+
+        load_time, _ = timed(lambda: reader.read(path))
+        mmap_time = "-"
+        if mode is None:
+            mmap_time = f"{timed(lambda: reader.read(path, mmap_mode='r'))[0]:8.3f}"
+
+        size = path.stat().st_size / 2**20
+        print(
+            f"{str(mode):<8} {size:9.2f} {save_time:8.3f} {load_time:8.3f} "
+            f"{mmap_time:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(args.rows, 8)), rng.normal(size=args.rows)
+    models = {
+        f"RandomForestRegressor({args.n_estimators})": RandomForestRegressor(
+            n_estimators=args.n_estimators, n_jobs=-1, random_state=0
+        ).fit(X, y),
+        "KNeighborsRegressor": KNeighborsRegressor().fit(X, y),
+    }
+
+    warnings.simplefilter("ignore")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, model in models.items():
+            bench(name, model, Path(tmp_dir))
+
+
+if __name__ == "__main__":
+    main()
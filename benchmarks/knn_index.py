@@ -0,0 +1,83 @@
+"""
+Benchmark of the neighbor search of the KNN model as the training set grows:
+KD-tree and Ball-tree indexes built at fit time and persisted with the model,
+sklearn's brute-force search and the float32 brute-force search used in
+serving for KNN models on small training sets. Reports the build time, the
+size and load time of the pickled model and the latency of batches of 1 and
+100 queries on preprocessed features.
+
+    python -m benchmarks.knn_index --sizes 1338 10000 100000 1000000
+"""
+
+import argparse
+import pickle
+import sys
+import time
+
+import pandas as pd
+from sklearn.neighbors import KNeighborsRegressor
+
+from benchmarks.bento_batching import BENTO_DIR
+from benchmarks.compiled_inference import best_time
+from benchmarks.streaming_training import FEATURES, reference_frame
+from src.builders.pipeline.preprocessor_builder import PreprocessorBuilder
+from src.features.core import convert_features_type
+
+QUERY_BATCHES = (1, 100)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1338, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--leaf-sizes", nargs="+", type=int, default=[10, 30, 100])
+    parser.add_argument("--n-neighbors", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BENTO_DIR))
+    from compiled import build_neighbors
+    from service import synthetic_rows
+
+    indexes = [
+        (f"{algorithm} leaf={leaf_size}", algorithm, leaf_size)
+        for algorithm in ("kd_tree", "ball_tree")
+        for leaf_size in args.leaf_sizes
+    ] + [("brute", "brute", 30), ("brute float32", "brute", 30)]
+
+    queries = pd.DataFrame(synthetic_rows(max(QUERY_BATCHES), seed=1))
+    print(
+        f"{'rows':>8} {'index':<18} {'build':>9} {'pickle':>9} {'load':>9} "
+        + " ".join(f"{f'{n} query':>11}" for n in QUERY_BATCHES)
+    )
+    for size in args.sizes:
+        df = reference_frame(size)
+        X, y = convert_features_type(df.drop(columns="charges")), df["charges"]
+        preprocessor = PreprocessorBuilder.build(True, FEATURES).fit(X)
+        X, Q = preprocessor.transform(X), preprocessor.transform(queries)
+
+        for name, algorithm, leaf_size in indexes:
+            model = KNeighborsRegressor(
+                n_neighbors=args.n_neighbors, algorithm=algorithm, leaf_size=leaf_size
+            )
+            start = time.perf_counter()
+            model.fit(X, y)
+            predict = model.predict
+            if name == "brute float32":
+                predict = build_neighbors(model).predict
+            build = time.perf_counter() - start
+
+            dumped = pickle.dumps(model)
+            load = best_time(lambda: pickle.loads(dumped), budget=0.2)
+            latencies = [
+                best_time(lambda: predict(Q[:n]), budget=0.5) for n in QUERY_BATCHES
+            ]
+            print(
+                f"{size:>8} {name:<18} {build * 1e3:>7.1f}ms "
+                f"{len(dumped) / 2**20:>7.1f}MB {load * 1e3:>7.1f}ms "
+                + " ".join(f"{t * 1e6:>9.0f}us" for t in latencies)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark of the closed-form linear predictor exported from a linear pipeline
+with a log target. Compares load time and prediction time for 1, 100 and 100k
+rows against the pickled sklearn pipeline and its compiled version, and the
+cold start of a fresh interpreter that loads a model and predicts one row.
+
+    python -m benchmarks.linear_predictor
+"""
+
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.bento_batching import BENTO_DIR, fit_pipeline
+from benchmarks.compiled_inference import BATCH_SIZES, best_time
+
+COLD_START = {
+    "pipeline": """
+import pickle
+import pandas as pd
+with open({path!r}, "rb") as f:
+    model = pickle.load(f)
+model.predict(pd.DataFrame({rows!r}))
+""",
+    "linear": """
+from linear_predictor import LinearPredictor
+LinearPredictor.load({path!r}).predict({rows!r})
+""",
+}
+
+
+def cold_start(code: str) -> float:
+    """
+    Returns the best wall time of a fresh interpreter running `code`.
+    """
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=BENTO_DIR, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    sys.path.insert(0, str(BENTO_DIR))
+    from compiled import compile_pipeline, export_linear
+    from linear_predictor import LinearPredictor
+    from service import synthetic_rows
+
+    pipeline = fit_pipeline("linear", transformation="log")
+    compiled = compile_pipeline(pipeline)
+    predictor = LinearPredictor(**export_linear(pipeline))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {
+            "pipeline": Path(tmp_dir) / "pipeline.pkl",
+            "linear": Path(tmp_dir) / "predictor.json",
+        }
+        with open(paths["pipeline"], "wb") as f:
+            pickle.dump(pipeline, f)
+        predictor.save(paths["linear"])
+
+        def load_pipeline():
+            with open(paths["pipeline"], "rb") as f:
+                return pickle.load(f)
+
+        print(
+            f"size: pipeline {paths['pipeline'].stat().st_size} B, "
+            f"linear {paths['linear'].stat().st_size} B"
+        )
+        load_times = [
+            best_time(load_pipeline),
+            best_time(lambda: LinearPredictor.load(paths["linear"])),
+        ]
+        print(
+            f"load: pipeline {load_times[0] * 1e6:.1f} us, "
+            f"linear {load_times[1] * 1e6:.1f} us"
+        )
+        rows = synthetic_rows(1)
+        for name, path in paths.items():
+            code = COLD_START[name].format(path=str(path), rows=rows)
+            print(f"cold start {name}: {cold_start(code) * 1000:.0f} ms")
+
+    print(f"{'rows':>7} {'pipeline':>12} {'compiled':>12} {'linear':>12}")
+    for size in BATCH_SIZES:
+        rows = synthetic_rows(size, seed=1)
+        timings = [
+            best_time(lambda: pipeline.predict(pd.DataFrame(rows))),
+            best_time(lambda: compiled.predict(rows)),
+            best_time(lambda: predictor.predict(rows)),
+        ]
+        print(f"{size:>7} " + " ".join(f"{t * 1e6:>9.1f} us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares metrics file formats of `DataSaver.save_metrics`/`DataLoader.load_metrics`
+by scanning many run directories, as the optuna stage does when (re)building the
+run index.
+
+    python -m benchmarks.metrics_formats --runs 1000
+"""
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from pathlib import Path
+
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+
+FILES = ["metrics.yaml", "metrics.json", "metrics.msgpack"]
+
+
+def make_metrics(idx: int) -> dict:
+    return {
+        "model_name": "RandomForestRegressor",
+        "params": {"model__max_depth": 10, "model__n_estimators": 200},
+        "param_grid": {
+            "model__max_depth": [5, 10, 15, None],
+            "model__n_estimators": [100, 200, 300],
+            "model__min_samples_split": [2, 5, 10],
+        },
+        "folds_scores": [0.8 + idx * 1e-6 + fold * 1e-3 for fold in range(5)],
+        "folds_scores_mean": 0.802,
+        "metrics": {
+            f"{split}_{name}": 0.5 + idx * 1e-6
+            for split in ("train", "test")
+            for name in ("r2", "mse", "rmse", "mae", "mape")
+        },
+        "transformation": "log",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=1000)
+    args = parser.parse_args()
+
+    data_saver = DataSaver(IOFactory.create_writers())
+    data_loader = DataLoader(IOFactory.create_readers())
+    files = [
+        file
+        for file in FILES
+        if not file.endswith(".msgpack") or importlib.util.find_spec("msgpack")
+    ]
+
+    print(f"{args.runs} run directories")
+    print(f"{'format':<16} {'write s':>8} {'scan s':>8} {'size KiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        for file in files:
+            paths = [root / f"{idx:05d}" / file for idx in range(args.runs)]
+
+            start = time.perf_counter()
+            for idx, path in enumerate(paths):
+                path.parent.mkdir(exist_ok=True)
+                data_saver.save_metrics(make_metrics(idx), path)
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for run_dir in sorted(root.iterdir()):
+                data_loader.load_metrics(run_dir / file)
+            scan_time = time.perf_counter() - start
+
+            size = sum(path.stat().st_size for path in paths) / 1024
+            print(f"{file:<16} {write_time:8.3f} {scan_time:8.3f} {size:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Per-trial time of the Optuna wrapper objective: building the experiment from
+the config on every trial against building it once with
+`WrapperOptunaRunner.compile` and only setting the trial params. Both score
+the same linear pipeline with a log target transformation.
+
+    python -m benchmarks.optuna_objective --trials 30
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from optuna.trial import FixedTrial
+from sklearn.model_selection import KFold
+
+from src.builders.optuna.optuna_experiment_builder import \
+    OptunaExperimentBuilder
+from src.conf.schema import (FeaturesConfig, ModelConfig, OptunaModelConfig,
+                             SingleTransformerConfig, TransformersConfig)
+from src.containers.experiment import ExperimentContext
+from src.optuna.runners import WrapperOptunaRunner
+from src.serializers.experiment import ExperimentSerializer
+from src.tuning.runners import CrossValidationRunner
+
+TRIAL = {"transformation": "log", "transformer__validate": True}
+
+
+def make_context(rows: int) -> ExperimentContext:
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, rows).astype(float),
+            "sex": rng.integers(0, 2, rows).astype(float),
+            "bmi": rng.normal(30.0, 6.0, rows),
+            "children": rng.integers(0, 5, rows).astype(float),
+            "smoker": rng.integers(0, 2, rows).astype(float),
+            "region": rng.choice(["northeast", "northwest", "southeast"], rows),
+        }
+    )
+    y = pd.Series(
+        np.exp(8 + 0.02 * X["age"] + X["smoker"] + rng.normal(0, 0.2, rows))
+    )
+    return ExperimentContext(
+        model_cfg=ModelConfig("linear", True, True, {}),
+        features_cfg=FeaturesConfig(
+            categorical=["children", "region"],
+            numeric=["age", "bmi"],
+            binary=["sex", "smoker"],
+        ),
+        optuna_model_cfg=OptunaModelConfig(name="linear", params={}),
+        transformers_cfg=TransformersConfig(
+            log=SingleTransformerConfig(params={"validate": [True, False]}),
+            power=SingleTransformerConfig(
+                params={"method": ["box-cox", "yeo-johnson"]}
+            ),
+            none=SingleTransformerConfig(params={}),
+        ),
+        X_train=X,
+        X_test=X,
+        y_train=y,
+    )
+
+
+def median_time(objective, trials: int) -> float:
+    objective(FixedTrial(TRIAL))  # warm-up
+    timings = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        objective(FixedTrial(TRIAL))
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=400)
+    args = parser.parse_args()
+
+    context = make_context(args.rows)
+    cross_runner = CrossValidationRunner(
+        cv=KFold(n_splits=5, shuffle=True, random_state=42)
+    )
+    runner = WrapperOptunaRunner(optimizer=None, runner=cross_runner)
+    exp_config = ExperimentSerializer.to_experiment_config(context)
+
+    def legacy_objective(trial):
+        exp_setup = OptunaExperimentBuilder.build(exp_config, trial=trial)
+        exp_setup.pipeline.set_params(**exp_setup.params)
+        return cross_runner.run(
+            estimator=exp_setup.pipeline,
+            X_train=context.X_train,
+            X_test=context.X_test,
+            y_train=context.y_train,
+        ).folds_scores_mean
+
+    compiled = runner.compile(exp_config)
+    legacy = median_time(legacy_objective, args.trials)
+    fast = median_time(
+        lambda trial: runner.objective(trial, context, compiled), args.trials
+    )
+    print(f"per-trial time over {args.trials} trials of {args.rows} rows")
+    print(f"legacy   {legacy * 1e3:8.2f}ms")
+    print(f"compiled {fast * 1e3:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
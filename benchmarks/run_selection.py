@@ -0,0 +1,115 @@
+"""
+Measures time and peak memory of selecting the best training run over many
+saved runs: the run index, lazy estimator handles and eager unpickling of every
+pipeline. Modes run from the cheapest to the most expensive, so the growth of
+the process peak RSS is attributable to each mode.
+
+    python -m benchmarks.run_selection --runs 500
+"""
+
+import argparse
+import tempfile
+import time
+import resource
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+import numpy as np
+from omegaconf import OmegaConf
+from sklearn.ensemble import RandomForestRegressor
+
+from src.conf.schema import TrainingDir
+from src.containers.results import StageResult
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+from src.models.loaders.run_loader import RunLoader
+from src.models.savers.run_saver import RunSaver
+from src.optuna.base import OptunaBasePipeline
+
+
+def save_runs(training_dir: TrainingDir, runs: int, n_estimators: int) -> None:
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(1000, 6)), rng.normal(size=1000)
+    estimator = RandomForestRegressor(
+        n_estimators=n_estimators, max_depth=8, random_state=0
+    ).fit(X, y)
+
+    saver = RunSaver(training_dir, DataSaver(IOFactory.create_writers()))
+    with mock.patch("src.models.savers.run_saver.datetime") as mock_datetime:
+        for idx in range(runs):
+            mock_datetime.now.return_value.strftime.return_value = f"run_{idx:05d}"
+            score = float(rng.random())
+            saver.save(
+                StageResult(
+                    model_name="RandomForestRegressor",
+                    estimator=estimator,
+                    params={},
+                    param_grid={},
+                    folds_scores=[score],
+                    folds_scores_mean=score,
+                    metrics={"test_r2": score},
+                    transformation="none",
+                )
+            )
+
+
+def load_all_runs(run_loader: RunLoader) -> list[StageResult]:
+    """
+    Loads every saved run, as run selection did before the run index.
+    """
+    run_dirs = run_loader.training_dir.output_dir.iterdir()
+    return [run_loader.load(run_dir) for run_dir in run_dirs if run_dir.is_dir()]
+
+
+def best_run(runs: list[StageResult]) -> StageResult:
+    return max(runs, key=lambda run: run.metrics.get("test_r2", float("-inf")))
+
+
+def measure(name: str, fn: Callable[[], StageResult]) -> None:
+    peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    best = fn()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak_before
+    print(
+        f"{name:<8} {elapsed:8.3f}s  peak RSS +{peak / 1024:8.1f} MiB  "
+        f"best test_r2={best.metrics['test_r2']:.4f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument("--n-estimators", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        training_dir = TrainingDir(
+            output_dir=Path(tmp_dir),
+            model_file="pipeline.pkl",
+            metrics_file="metrics.yaml",
+        )
+        save_runs(training_dir, args.runs, args.n_estimators)
+        base = OptunaBasePipeline(
+            dynamic_cfg=OmegaConf.create({"training": {"output_dir": tmp_dir}})
+        )
+        run_loader = RunLoader(training_dir, DataLoader(IOFactory.create_readers()))
+
+        def eager() -> StageResult:
+            runs = load_all_runs(run_loader)
+            for run in runs:
+                run.estimator
+            return best_run(runs)
+
+        def lazy() -> StageResult:
+            return best_run(load_all_runs(run_loader))
+
+        print(f"{args.runs} runs of RandomForestRegressor({args.n_estimators})")
+        measure("index", lambda: base.select_best_run(run_loader))
+        measure("lazy", lazy)
+        measure("eager", eager)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Compares loading the train/test splits with pandas (all columns), the Arrow path
+(memory-mapped Parquet with column projection) and the shared store (zero-copy
+memory-mapped Arrow files). Each mode runs in a fresh process; the peak RSS
+growth and the private (anonymous) memory held after loading are reported.
+
+    python -m benchmarks.split_loading --rows 2000000
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.conf.schema import FeaturesConfig
+from src.data.constants import SPLIT_FILES
+from src.data.core import DataLoader, DataSaver
+from src.data.shared import SharedSplitStore
+from src.factories.io_factory import IOFactory
+from src.io.writers import ArrowWriter
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+def write_splits(processed_dir: Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+
+    def features(n: int) -> pd.DataFrame:
+        df = pd.DataFrame(
+            {
+                "age": rng.integers(18, 65, n).astype(float),
+                "sex": rng.integers(0, 2, n).astype(float),
+                "bmi": rng.normal(30.0, 6.0, n),
+                "children": rng.integers(0, 5, n).astype(float),
+                "smoker": rng.integers(0, 2, n).astype(float),
+                "region": rng.choice(["northeast", "northwest", "southeast"], n),
+            }
+        )
+        for idx in range(6):
+            df[f"claim_{idx}"] = rng.normal(size=n)
+        return df
+
+    n_test = rows // 5
+    DataSaver(IOFactory.create_writers()).save_splitted_data(
+        {
+            "X_train": features(rows - n_test),
+            "X_test": features(n_test),
+            "y_train": pd.DataFrame({"charges": rng.normal(size=rows - n_test)}),
+            "y_test": pd.DataFrame({"charges": rng.normal(size=n_test)}),
+        },
+        processed_dir,
+    )
+
+
+def memory_status(field: str) -> float:
+    """
+    Reads a memory field of /proc/self/status (Linux) in MiB.
+    """
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def load(mode: str, processed_dir: Path, shared_dir: Path, queue: mp.Queue) -> None:
+    readers = IOFactory.create_readers()
+    columns = FEATURES.numeric + FEATURES.binary + FEATURES.categorical
+    baseline = memory_status("VmHWM")
+    anon_baseline = memory_status("RssAnon")
+
+    if mode == "pandas":
+        data = [
+            pd.read_parquet(processed_dir / f"{file}.parquet") for file in SPLIT_FILES
+        ]
+    elif mode == "arrow":
+        data = DataLoader(readers).load_splitted_data(
+            processed_dir, columns=columns, memory_map=True
+        )
+    else:
+        data = SharedSplitStore(shared_dir, readers, ArrowWriter()).load(
+            processed_dir, columns=columns
+        )
+
+    peak = memory_status("VmHWM") - baseline
+    queue.put((peak, memory_status("RssAnon") - anon_baseline))
+    del data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processed_dir = Path(tmp_dir) / "processed"
+        shared_dir = Path(tmp_dir) / "shared"
+        processed_dir.mkdir()
+        write_splits(processed_dir, args.rows)
+        store = SharedSplitStore(shared_dir, IOFactory.create_readers(), ArrowWriter())
+        store.publish(processed_dir)
+
+        print(f"{args.rows} rows, 12 feature columns, 6 used")
+        for mode in ("pandas", "arrow", "shared"):
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=load, args=(mode, processed_dir, shared_dir, queue)
+            )
+            process.start()
+            peak, private = queue.get()
+            process.join()
+            print(f"{mode:<8} peak RSS +{peak:8.1f} MiB  private +{private:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Compares in-memory cross-validated training of the linear pipeline with the
+out-of-core runner, which streams Parquet batches through the preprocessor and
+accumulates the normal equations. Synthetic insurance data is generated chunk
+by chunk and split by hashed row id, so the splits never have to fit in memory
+either. Each mode runs in a fresh process; wall time and peak RSS growth are
+reported. The in-memory mode is skipped above `--max-in-memory-rows`.
+
+    python -m benchmarks.streaming_training --rows 50000000
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import KFold
+
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+from src.data.constants import TARGET_COLUMN, TEST_SIZE
+from src.data.core import DataLoader
+from src.data.ingest import assign_test
+from src.data.synthetic import InsuranceSynthesizer
+from src.factories.io_factory import IOFactory
+from src.features.core import convert_features_type, optimize_dtypes
+from src.tuning.runners import CrossValidationRunner, StreamingLinearRunner
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+CHUNK_ROWS = 1_000_000
+
+
+def reference_frame(n: int = 1338) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.normal(30.7, 6.1, n).clip(16, 53).round(3),
+            "children": rng.choice(6, n, p=[0.43, 0.24, 0.18, 0.12, 0.02, 0.01]),
+            "smoker": rng.choice(["yes", "no"], n, p=[0.2, 0.8]),
+            "region": rng.choice(
+                ["northeast", "northwest", "southeast", "southwest"], n
+            ),
+        }
+    )
+    smoker = df["smoker"] == "yes"
+    df["charges"] = (
+        250 * df["age"]
+        + np.where(smoker, 20000 + np.where(df["bmi"] >= 30, 20000, 0), 0)
+        + np.random.default_rng(2).gamma(2.0, 1500.0, n)
+    )
+    return df
+
+
+def write_splits(processed_dir: Path, rows: int) -> None:
+    """
+    Generates, transforms and splits synthetic rows chunk by chunk, appending
+    each split to its own Parquet file.
+    """
+    synthesizer = InsuranceSynthesizer().fit(reference_frame())
+    rng = np.random.default_rng(42)
+    writers: dict[str, pq.ParquetWriter] = {}
+    try:
+        for start in range(0, rows, CHUNK_ROWS):
+            n = min(CHUNK_ROWS, rows - start)
+            df = synthesizer.sample(n, rng).to_pandas()
+            df = optimize_dtypes(convert_features_type(df), exclude=[TARGET_COLUMN])
+            test = assign_test(np.arange(start, start + n, dtype=np.uint64), TEST_SIZE)
+            X, y = df.drop(columns=TARGET_COLUMN), df[[TARGET_COLUMN]]
+            splits = {
+                "X_train": X[~test],
+                "X_test": X[test],
+                "y_train": y[~test],
+                "y_test": y[test],
+            }
+            for name, split in splits.items():
+                table = pa.Table.from_pandas(split, preserve_index=False)
+                if name not in writers:
+                    writers[name] = pq.ParquetWriter(
+                        processed_dir / f"{name}.parquet", table.schema
+                    )
+                writers[name].write_table(table.cast(writers[name].schema))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+
+def memory_status(field: str) -> float:
+    """
+    Reads a memory field of /proc/self/status (Linux) in MiB.
+    """
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def train(mode: str, processed_dir: Path, batch_size: int, queue: mp.Queue) -> None:
+    loader = DataLoader(IOFactory.create_readers())
+    columns = FEATURES.numeric + FEATURES.binary + FEATURES.categorical
+    pipeline = PipelineBuilder.build(
+        model_cfg=ModelConfig(
+            name="linear",
+            preprocess_num_features=True,
+            target_transformations=False,
+            params={},
+            model_class=LinearRegression,
+        ),
+        features_cfg=FEATURES,
+    )
+    baseline = memory_status("VmHWM")
+    start = time.perf_counter()
+
+    if mode == "in-memory":
+        data = loader.load_splitted_data(processed_dir, columns=columns)
+        runner = CrossValidationRunner(cv=KFold(5, shuffle=True, random_state=42))
+    else:
+        data = loader.load_streaming_data(
+            processed_dir, columns=columns, batch_size=batch_size
+        )
+        runner = StreamingLinearRunner(FEATURES, n_splits=5, random_state=42)
+    result = runner.run(pipeline, data.X_train, data.X_test, data.y_train)
+
+    elapsed = time.perf_counter() - start
+    queue.put(
+        (elapsed, memory_status("VmHWM") - baseline, result.folds_scores_mean)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--batch-size", type=int, default=1 << 20)
+    parser.add_argument("--max-in-memory-rows", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processed_dir = Path(tmp_dir)
+        start = time.perf_counter()
+        write_splits(processed_dir, args.rows)
+        size = sum(p.stat().st_size for p in processed_dir.glob("*.parquet"))
+        print(
+            f"{args.rows} rows generated in {time.perf_counter() - start:.1f}s "
+            f"({size / 2**20:.0f} MiB of Parquet)"
+        )
+
+        modes = ["streaming"]
+        if args.rows <= args.max_in_memory_rows:
+            modes.insert(0, "in-memory")
+        for mode in modes:
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=train, args=(mode, processed_dir, args.batch_size, queue)
+            )
+            process.start()
+            elapsed, peak, score = queue.get()
+            process.join()
+            print(
+                f"{mode:<10} {elapsed:8.1f}s  peak RSS +{peak:8.1f} MiB  "
+                f"CV R2 {score:.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
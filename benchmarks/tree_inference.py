@@ -0,0 +1,52 @@
+"""
+Throughput benchmark of packed trees against sklearn's per-tree traversal for
+the forest of the serving pipeline, on preprocessed features. Also reports
+the end-to-end service path (request rows to predictions) of the pipeline and
+of the compiled pipeline, which switches to sklearn above
+TREE_TRAVERSAL_MAX_ROWS.
+
+    python -m benchmarks.tree_inference
+"""
+
+import sys
+
+import pandas as pd
+
+from benchmarks.bento_batching import BENTO_DIR, fit_pipeline
+from benchmarks.compiled_inference import best_time
+
+BATCH_SIZES = (1, 100, 1000, 10_000, 100_000)
+
+
+def main() -> None:
+    sys.path.insert(0, str(BENTO_DIR))
+    from compiled import compile_pipeline, pack_trees
+    from service import synthetic_rows
+
+    pipeline = fit_pipeline("rf")
+    preprocessor, model = pipeline.steps[0][1], pipeline.steps[1][1]
+    compiled = compile_pipeline(pipeline)
+    trees = pack_trees(model)
+    print(
+        f"{len(model.estimators_)} trees, {len(trees.value)} nodes, "
+        f"max depth {max(e.tree_.max_depth for e in model.estimators_)}"
+    )
+
+    print(
+        f"{'rows':>7} {'sklearn':>14} {'packed':>14} "
+        f"{'pipeline':>14} {'compiled':>14}   (rows/s)"
+    )
+    for size in BATCH_SIZES:
+        rows = synthetic_rows(size, seed=1)
+        X = preprocessor.transform(pd.DataFrame(rows))
+        timings = [
+            best_time(lambda: model.predict(X)),
+            best_time(lambda: trees.predict(X)),
+            best_time(lambda: pipeline.predict(pd.DataFrame(rows))),
+            best_time(lambda: compiled.predict(rows)),
+        ]
+        print(f"{size:>7} " + " ".join(f"{size / t:>14,.0f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+from functools import partial
+from typing import Any, Callable, Protocol
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer, TransformedTargetRegressor
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+from sklearn.linear_model._base import LinearModel
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import (FunctionTransformer, OneHotEncoder,
+                                   StandardScaler)
+from sklearn.tree import DecisionTreeRegressor
+
+from src.tuning.transformers.identity import IdentityTransformer
+
+try:
+    from neighbors import NeighborsPredictor
+    from trees import TreeEnsemblePredictor
+except ImportError:  # imported as part of the services package
+    from .neighbors import NeighborsPredictor
+    from .trees import TreeEnsemblePredictor
+
+Transform = Callable[[np.ndarray], np.ndarray]
+
+# packed trees skip sklearn's per-tree dispatch, which dominates small batches
+# of forests; above this many rows sklearn's compiled traversal is faster
+TREE_TRAVERSAL_MAX_ROWS = 2048
+
+# above this many query rows sklearn's search of the fitted index is faster
+# than the float32 search
+NEIGHBORS_MAX_ROWS = 64
+
+# above this many training rows a query of the KD-tree index is faster than a
+# float32 scan of every training row, see benchmarks/knn_index.py
+NEIGHBORS_MAX_FIT_ROWS = 50_000
+
+
+class Predictor(Protocol):
+    def predict(self, rows: list[dict]) -> np.ndarray: ...
+
+
+class CompiledPipeline:
+    """
+    NumPy version of a fitted preprocessing and model pipeline. Rows are laid
+    out as a float array in the column order the pipeline was fitted on, with
+    categorical values replaced by their index in the encoder categories
+    (-1 for unknown values), so prediction skips DataFrame construction and
+    column selection by name.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        codes: dict[str, dict[Any, int]],
+        transforms: list[Transform],
+        model: Transform,
+        inverse: Transform | None = None,
+    ):
+        self.columns = columns
+        self.codes = codes
+        self.transforms = transforms
+        self.model = model
+        self.inverse = inverse
+
+    def encode(self, rows: list[dict]) -> np.ndarray:
+        """
+        Lays out request rows as the float array taken by `predict_array`.
+        """
+        X = np.empty((len(rows), len(self.columns)))
+        for j, column in enumerate(self.columns):
+            codes = self.codes.get(column)
+            if codes is None:
+                X[:, j] = [row[column] for row in rows]
+            else:
+                X[:, j] = [codes.get(row[column], -1) for row in rows]
+        return X
+
+    def encode_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Lays out a DataFrame as the float array taken by `predict_array`.
+        Categorical columns, as read from dictionary-encoded Parquet, are
+        mapped by value like any other.
+        """
+        X = np.empty((len(df), len(self.columns)))
+        for j, column in enumerate(self.columns):
+            codes = self.codes.get(column)
+            if codes is None:
+                X[:, j] = df[column].to_numpy(dtype=float)
+            else:
+                values = df[column].astype(object).map(codes)
+                X[:, j] = values.fillna(-1).to_numpy(dtype=float)
+        return X
+
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        features = np.hstack([transform(X) for transform in self.transforms])
+        y = self.model(features)
+        return y if self.inverse is None else self.inverse(y)
+
+    def predict(self, rows: list[dict]) -> np.ndarray:
+        return self.predict_array(self.encode(rows))
+
+
+def _compile_scaler(scaler: StandardScaler, idx: np.ndarray) -> Transform:
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(len(idx))
+    scale = scaler.scale_ if scaler.with_std else np.ones(len(idx))
+    return lambda X: (X[:, idx] - mean) / scale
+
+
+def _compile_one_hot(encoder: OneHotEncoder, idx: np.ndarray) -> Transform:
+    """
+    Compiles an encoder into a single comparison of the category codes with
+    the code of every output column, dropped categories excluded.
+    """
+    if getattr(encoder, "infrequent_categories_", None) is not None:
+        raise ValueError("Cannot compile OneHotEncoder with infrequent categories")
+
+    inputs, codes = [], []
+    for j, categories in enumerate(encoder.categories_):
+        kept = np.arange(len(categories))
+        if encoder.drop_idx_ is not None and encoder.drop_idx_[j] is not None:
+            kept = np.delete(kept, encoder.drop_idx_[j])
+        inputs.extend([idx[j]] * len(kept))
+        codes.extend(kept)
+    inputs, codes = np.array(inputs, dtype=int), np.array(codes, dtype=float)
+    return lambda X: (X[:, inputs] == codes).astype(float)
+
+
+def _compile_preprocessor(
+    preprocessor: ColumnTransformer,
+) -> tuple[list[str], dict[str, dict[Any, int]], list[Transform]]:
+    """
+    Compiles the fitted transformers of a ColumnTransformer in output order and
+    collects the category codes of the one-hot encoded columns.
+    """
+    columns = list(preprocessor.feature_names_in_)
+    codes, transforms, numeric = {}, [], set()
+    for _, transformer, selected in preprocessor.transformers_:
+        if transformer == "drop" or len(selected) == 0:
+            continue
+        names = [columns[c] if isinstance(c, int) else c for c in selected]
+        idx = np.array([columns.index(name) for name in names])
+
+        if not isinstance(transformer, OneHotEncoder):
+            numeric.update(names)
+
+        if transformer == "passthrough" or (
+            # fitted passthrough columns are stored as identity transformers
+            isinstance(transformer, FunctionTransformer)
+            and transformer.func is None
+        ):
+            transforms.append(lambda X, idx=idx: X[:, idx])
+        elif isinstance(transformer, StandardScaler):
+            transforms.append(_compile_scaler(transformer, idx))
+        elif isinstance(transformer, OneHotEncoder):
+            for name, categories in zip(names, transformer.categories_):
+                codes[name] = {value: i for i, value in enumerate(categories)}
+            transforms.append(_compile_one_hot(transformer, idx))
+        else:
+            raise ValueError(f"Cannot compile {type(transformer).__name__}")
+
+    if numeric & codes.keys():
+        raise ValueError("Cannot compile columns both one-hot encoded and numeric")
+    return columns, codes, transforms
+
+
+def pack_trees(model: Any) -> TreeEnsemblePredictor:
+    """
+    Packs the trees of a fitted decision tree or forest regressor into arrays.
+    """
+    if isinstance(model, DecisionTreeRegressor):
+        return TreeEnsemblePredictor.from_trees([model.tree_])
+    if isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)):
+        return TreeEnsemblePredictor.from_trees(
+            [estimator.tree_ for estimator in model.estimators_]
+        )
+    raise ValueError(f"Cannot pack {type(model).__name__} as trees")
+
+
+def build_neighbors(model: Any) -> NeighborsPredictor:
+    """
+    Builds the float32 brute-force search of a fitted Euclidean KNN regressor.
+    """
+    if not (
+        isinstance(model, KNeighborsRegressor)
+        and model.effective_metric_ == "euclidean"
+        and np.ndim(model._y) == 1
+    ):
+        raise ValueError(f"Cannot search {type(model).__name__} by Euclidean distance")
+    return NeighborsPredictor(model._fit_X, model._y, model.n_neighbors, model.weights)
+
+
+def _compile_model(model: Any) -> Transform:
+    """
+    Compiles linear models into a dot product, forests into packed trees for
+    batches of up to TREE_TRAVERSAL_MAX_ROWS and Euclidean KNN models fitted on
+    up to NEIGHBORS_MAX_FIT_ROWS rows into the float32 brute-force search for
+    batches of up to NEIGHBORS_MAX_ROWS. Other models, including single trees
+    and KNN models on larger training sets, are called on the preprocessed
+    array, which queries their fitted index.
+    """
+    if isinstance(model, LinearModel) and np.ndim(model.coef_) == 1:
+        coef, intercept = model.coef_, model.intercept_
+        return lambda X: X @ coef + intercept
+    if isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)):
+        trees = pack_trees(model)
+        return lambda X: (
+            trees.predict(X) if len(X) <= TREE_TRAVERSAL_MAX_ROWS else model.predict(X)
+        )
+    if (
+        isinstance(model, KNeighborsRegressor)
+        and model.effective_metric_ == "euclidean"
+        and model.n_samples_fit_ <= NEIGHBORS_MAX_FIT_ROWS
+    ):
+        neighbors = build_neighbors(model)
+        return lambda X: (
+            neighbors.predict(X) if len(X) <= NEIGHBORS_MAX_ROWS else model.predict(X)
+        )
+    return model.predict
+
+
+def _is_identity(transformer: Any) -> bool:
+    if isinstance(transformer, FunctionTransformer):
+        return transformer.inverse_func is None
+    return isinstance(transformer, IdentityTransformer)
+
+
+def _compile_inverse(transformer: Any) -> Transform:
+    if _is_identity(transformer):
+        return lambda y: y
+    if isinstance(transformer, FunctionTransformer):
+        return partial(transformer.inverse_func, **(transformer.inv_kw_args or {}))
+    return lambda y: transformer.inverse_transform(y.reshape(-1, 1)).ravel()
+
+
+def _unwrap(estimator: Any) -> tuple[Any, ColumnTransformer, Any]:
+    """
+    Splits a fitted pipeline into the target transformer (None if the target is
+    not transformed), the preprocessor and the model.
+    """
+    transformer = None
+    if isinstance(estimator, TransformedTargetRegressor):
+        transformer = estimator.transformer_
+        estimator = estimator.regressor_
+
+    if not (
+        isinstance(estimator, Pipeline)
+        and len(estimator.steps) == 2
+        and isinstance(estimator.steps[0][1], ColumnTransformer)
+    ):
+        raise ValueError("Only a ColumnTransformer followed by a model can be compiled")
+    return transformer, estimator.steps[0][1], estimator.steps[1][1]
+
+
+def compile_pipeline(estimator: Any) -> CompiledPipeline:
+    """
+    Compiles a fitted pipeline of a ColumnTransformer and a model, optionally
+    wrapped in a TransformedTargetRegressor. Raises ValueError for steps that
+    cannot be compiled.
+    """
+    transformer, preprocessor, model = _unwrap(estimator)
+    columns, codes, transforms = _compile_preprocessor(preprocessor)
+    inverse = None if transformer is None else _compile_inverse(transformer)
+    return CompiledPipeline(columns, codes, transforms, _compile_model(model), inverse)
+
+
+def _python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def export_linear(estimator: Any) -> dict[str, Any]:
+    """
+    Folds a fitted linear pipeline into the arguments of a LinearPredictor:
+    scaler statistics into the intercept and per-column weights, and one-hot
+    columns into per-category contributions. Only identity and log target
+    transformations are supported. Raises ValueError for other pipelines.
+    """
+    transformer, preprocessor, model = _unwrap(estimator)
+    if not (isinstance(model, LinearModel) and np.ndim(model.coef_) == 1):
+        raise ValueError(f"Cannot export {type(model).__name__} as a linear model")
+
+    inverse = "identity"
+    if transformer is not None and not _is_identity(transformer):
+        if not (
+            isinstance(transformer, FunctionTransformer)
+            and transformer.inverse_func is np.exp
+            and not transformer.inv_kw_args
+        ):
+            raise ValueError(
+                "Only identity and log target transformations can be exported"
+            )
+        inverse = "exp"
+
+    columns = list(preprocessor.feature_names_in_)
+    coef = iter(model.coef_)
+    intercept = float(model.intercept_)
+    weights, tables = {}, {}
+    for _, step, selected in preprocessor.transformers_:
+        if step == "drop" or len(selected) == 0:
+            continue
+        names = [columns[c] if isinstance(c, int) else c for c in selected]
+
+        if isinstance(step, OneHotEncoder):
+            if getattr(step, "infrequent_categories_", None) is not None:
+                raise ValueError("Cannot export infrequent categories")
+            for j, (name, categories) in enumerate(zip(names, step.categories_)):
+                dropped = None if step.drop_idx_ is None else step.drop_idx_[j]
+                tables[name] = {
+                    _python(value): 0.0 if code == dropped else float(next(coef))
+                    for code, value in enumerate(categories)
+                }
+        elif isinstance(step, StandardScaler):
+            mean = step.mean_ if step.with_mean else np.zeros(len(names))
+            scale = step.scale_ if step.with_std else np.ones(len(names))
+            for name, m, sd in zip(names, mean, scale):
+                weight = next(coef) / sd
+                weights[name] = weights.get(name, 0.0) + float(weight)
+                intercept -= float(weight * m)
+        elif step == "passthrough" or (
+            isinstance(step, FunctionTransformer) and step.func is None
+        ):
+            for name in names:
+                weights[name] = weights.get(name, 0.0) + float(next(coef))
+        else:
+            raise ValueError(f"Cannot export {type(step).__name__}")
+
+    if weights.keys() & tables.keys():
+        raise ValueError("Cannot export columns both one-hot encoded and numeric")
+    return {
+        "intercept": intercept,
+        "weights": weights,
+        "tables": tables,
+        "inverse": inverse,
+    }
+
+
+def validate(
+    compiled: Predictor,
+    predict: Callable[[list[dict]], np.ndarray],
+    rows: list[dict],
+    rtol: float = 1e-9,
+) -> float:
+    """
+    Checks that a compiled predictor matches the reference predictions on
+    `rows` to a relative tolerance. Returns the largest relative difference.
+    """
+    expected = predict(rows)
+    actual = compiled.predict(rows)
+    error = float(
+        np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1.0))
+    )
+    if not error <= rtol:
+        raise ValueError(f"Compiled pipeline differs from the model by {error:.3g}")
+    return error
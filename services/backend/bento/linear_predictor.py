@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+FORMAT = "linear-v1"
+
+INVERSES = {"identity": lambda y: y, "exp": np.exp}
+
+
+class LinearPredictor:
+    """
+    Closed-form predictor of a linear pipeline: an intercept, a weight per
+    numeric column and a lookup table of contributions per categorical column,
+    with feature scaling already folded into the weights. Unknown categories
+    contribute nothing. Loads from a small JSON spec and predicts without
+    sklearn.
+    """
+
+    def __init__(
+        self,
+        intercept: float,
+        weights: dict[str, float],
+        tables: dict[str, dict[Any, float]],
+        inverse: str = "identity",
+    ):
+        if inverse not in INVERSES:
+            raise ValueError(f"Unknown inverse transform '{inverse}'")
+        self.intercept = intercept
+        self.weights = weights
+        self.tables = tables
+        self.inverse = inverse
+
+    @classmethod
+    def from_dict(cls, spec: dict) -> "LinearPredictor":
+        if spec.get("format") != FORMAT:
+            raise ValueError(f"Unsupported predictor format '{spec.get('format')}'")
+        return cls(
+            intercept=spec["intercept"],
+            weights=spec["weights"],
+            tables={
+                name: {value: weight for value, weight in pairs}
+                for name, pairs in spec["tables"].items()
+            },
+            inverse=spec["inverse"],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "format": FORMAT,
+            "intercept": self.intercept,
+            "weights": self.weights,
+            # JSON keys are strings, so categories are kept as [value, weight]
+            "tables": {
+                name: [[value, weight] for value, weight in table.items()]
+                for name, table in self.tables.items()
+            },
+            "inverse": self.inverse,
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "LinearPredictor":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def predict(self, rows: list[dict]) -> np.ndarray:
+        y = np.full(len(rows), float(self.intercept))
+        for name, weight in self.weights.items():
+            y += weight * np.array([row[name] for row in rows], dtype=float)
+        for name, table in self.tables.items():
+            y += np.array([table.get(row[name], 0.0) for row in rows])
+        return INVERSES[self.inverse](y)
@@ -0,0 +1,103 @@
+import numpy as np
+
+# candidates beyond the k nearest kept from the float32 search for re-ranking
+CANDIDATE_MARGIN = 8
+
+# float32 distances computed per block of queries
+CHUNK_DISTANCES = 1 << 22
+
+EPS32 = float(np.finfo(np.float32).eps)
+
+
+class NeighborsPredictor:
+    """
+    Exact brute-force k-nearest-neighbors regression on Euclidean distance.
+    Squared distances to the training rows are computed in float32 with one
+    matrix product per block of queries, the closest candidates are re-ranked
+    with float64 distances, and queries where float32 rounding could have left
+    out a true neighbor are searched again in float64.
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        n_neighbors: int,
+        weights: str = "uniform",
+    ):
+        if weights not in ("uniform", "distance"):
+            raise ValueError(f"Unsupported weights '{weights}'")
+        if not 0 < n_neighbors <= len(X):
+            raise ValueError(f"Cannot search {n_neighbors} neighbors in {len(X)} rows")
+        self.X = np.ascontiguousarray(X, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.X32 = self.X.astype(np.float32)
+        self.norms32 = np.einsum("ij,ij->i", self.X32, self.X32)
+        self.max_norm = float(np.sqrt(np.max(np.einsum("ij,ij->i", self.X, self.X))))
+
+    def _search_exact(self, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        distances = np.einsum("ij,ij->i", self.X - q, self.X - q)
+        idx = np.argpartition(distances, self.n_neighbors - 1)[: self.n_neighbors]
+        idx = idx[np.argsort(distances[idx], kind="stable")]
+        return distances[idx], idx
+
+    def _search(self, Q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n_fit, n_features = self.X.shape
+        k = self.n_neighbors
+        Q32 = Q.astype(np.float32)
+        q_norms = np.einsum("ij,ij->i", Q, Q)
+        approx = Q32 @ self.X32.T
+        approx *= -2
+        approx += self.norms32
+        approx += np.einsum("ij,ij->i", Q32, Q32)[:, None]
+
+        n_candidates = min(n_fit, k + CANDIDATE_MARGIN)
+        if n_candidates < n_fit:
+            part = np.argpartition(approx, n_candidates, axis=1)
+            candidates = part[:, :n_candidates]
+            # the closest row left out of the candidates
+            excluded = approx[np.arange(len(Q)), part[:, n_candidates]]
+        else:
+            candidates = np.broadcast_to(np.arange(n_fit), (len(Q), n_fit))
+            excluded = np.full(len(Q), np.inf)
+
+        diff = self.X[candidates] - Q[:, None, :]
+        exact = np.einsum("ijk,ijk->ij", diff, diff)
+        order = np.argsort(exact, axis=1, kind="stable")[:, :k]
+        idx = np.take_along_axis(candidates, order, 1)
+        distances = np.take_along_axis(exact, order, 1)
+
+        # bound of the float32 rounding error of a squared distance
+        error = (n_features + 4) * EPS32 * (np.sqrt(q_norms) + self.max_norm) ** 2
+        for i in np.flatnonzero(excluded - error <= distances[:, -1]):
+            distances[i], idx[i] = self._search_exact(Q[i])
+        return distances, idx
+
+    def kneighbors(self, Q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the distances and indices of the nearest training rows of every
+        query, closest first.
+        """
+        Q = np.ascontiguousarray(Q, dtype=np.float64)
+        rows = max(CHUNK_DISTANCES // len(self.X), 1)
+        distances = np.empty((len(Q), self.n_neighbors))
+        idx = np.empty((len(Q), self.n_neighbors), dtype=np.intp)
+        for start in range(0, len(Q), rows):
+            chunk = slice(start, start + rows)
+            distances[chunk], idx[chunk] = self._search(Q[chunk])
+        return np.sqrt(distances), idx
+
+    def predict(self, Q: np.ndarray) -> np.ndarray:
+        distances, idx = self.kneighbors(Q)
+        if self.weights == "uniform":
+            return self.y[idx].mean(axis=1)
+
+        # as in sklearn, queries matching training rows use those rows only
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / distances
+        matches = np.isinf(weights)
+        exact_rows = matches.any(axis=1)
+        weights[exact_rows] = matches[exact_rows]
+        return (self.y[idx] * weights).sum(axis=1) / weights.sum(axis=1)
@@ -3,11 +3,18 @@ from datetime import datetime
 import bentoml
 from sklearn.base import BaseEstimator
 
-from src.mlflow.service import MLFLOW_REGISTER_NAME, MLflowService
 from src.logger.setup import logger
+from src.mlflow.cache import ModelCache
+from src.mlflow.service import MLFLOW_REGISTER_NAME, MLflowService
+from src.settings import Settings
+
+from .compiled import export_linear
+from .linear_predictor import LinearPredictor
 
 BENTO_MODEL_NAME = "medical_regressor"
 
+LINEAR_PREDICTOR_KEY = "linear_predictor"
+
 
 def load_latest_model(model_name: str, service: MLflowService) -> BaseEstimator:
     """
@@ -25,22 +32,30 @@ def register_bento_model(
     """
     timestamp_tag = datetime.now().strftime("%Y%m%d%H%M%S")
     model = load_latest_model(model_name, service)
+    metadata = {
+        "description": f"Model {model_name} for medical cost prediction",
+        "source": "MLflow Registry",
+        "model_name": model_name,
+    }
+    try:
+        predictor = LinearPredictor(**export_linear(model))
+        metadata[LINEAR_PREDICTOR_KEY] = predictor.to_dict()
+    except ValueError as e:
+        logger.info(f"Model is not exported as a linear predictor: {e}")
 
     bento_model = bentoml.sklearn.save_model(
         name=f"{bento_name}:{timestamp_tag}",
         model=model,
         signatures={"predict": {"batchable": True, "batch_dim": 0}},
-        metadata={
-            "description": f"Model {model_name} for medical cost prediction",
-            "source": "MLflow Registry",
-            "model_name": model_name,
-        },
+        metadata=metadata,
     )
     logger.info(f"Model registered in BentoML: {bento_model.tag}")
 
 
 if __name__ == "__main__":
-    service = MLflowService()
+    service = MLflowService(
+        cache=ModelCache(Settings.model_cache_dir(), Settings.MODEL_CACHE_SIZE)
+    )
     service.setup(create_experiment=False)
     register_bento_model(
         model_name=MLFLOW_REGISTER_NAME, bento_name=BENTO_MODEL_NAME, service=service
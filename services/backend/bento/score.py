@@ -0,0 +1,78 @@
+import argparse
+from pathlib import Path
+from typing import Any, Callable
+
+import bentoml
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.features.core import convert_features_type
+from src.io.readers import ParquetReader
+from src.logger.setup import logger
+
+from .compiled import compile_pipeline, validate
+from .register import BENTO_MODEL_NAME
+
+PREDICTION_COLUMN = "prediction"
+
+VALIDATION_ROWS = 256
+
+
+def make_predict(
+    model: Any, sample: pd.DataFrame
+) -> Callable[[pd.DataFrame], np.ndarray]:
+    """
+    Returns the compiled pipeline if it compiles and matches the model on the
+    sample, else the pipeline.
+    """
+    try:
+        compiled = compile_pipeline(model)
+        validate(
+            compiled,
+            lambda rows: model.predict(pd.DataFrame(rows)),
+            sample.head(VALIDATION_ROWS).to_dict(orient="records"),
+        )
+    except ValueError as e:
+        logger.warning(f"Scoring with the pipeline, model cannot be compiled: {e}")
+        return model.predict
+    return lambda df: compiled.predict_array(compiled.encode_frame(df))
+
+
+def score(model: Any, input_path: Path, output_path: Path, batch_size: int) -> int:
+    """
+    Scores a Parquet file of raw features batch by batch and writes it with a
+    prediction column, so memory is bounded by the batch size. Returns the
+    number of rows scored.
+    """
+    rows, predict, writer = 0, None, None
+    try:
+        for batch in ParquetReader().iter_batches(input_path, batch_size=batch_size):
+            features = convert_features_type(batch)
+            if predict is None:
+                predict = make_predict(model, features)
+            batch[PREDICTION_COLUMN] = predict(features)
+
+            table = pa.Table.from_pandas(batch, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            rows += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch scoring of a Parquet file")
+    parser.add_argument("input", type=Path)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--model", default=f"{BENTO_MODEL_NAME}:latest")
+    parser.add_argument("--batch-size", type=int, default=1 << 16)
+    args = parser.parse_args()
+
+    bento_model = bentoml.models.get(args.model)
+    rows = score(bento_model.load_model(), args.input, args.output, args.batch_size)
+    logger.info(f"Scored {rows} rows with {bento_model.tag} into {args.output}")
@@ -1,23 +1,293 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
 import bentoml
+import numpy as np
 import pandas as pd
+from bentoml.exceptions import ServiceUnavailable
+
+from compiled import Predictor, compile_pipeline, validate
+from linear_predictor import LinearPredictor
+
+logger = logging.getLogger("bentoml.medical_regressor_service")
+
+BENTO_MODEL_NAME = "medical_regressor"
+
+LINEAR_PREDICTOR_KEY = "linear_predictor"
+
+MODEL_POLL_INTERVAL = float(os.getenv("MODEL_POLL_INTERVAL", "30"))
+
+# adaptive batching of /predict_batch: requests are merged into batches of up
+# to MAX_BATCH_SIZE rows; requests that cannot be served within MAX_LATENCY_MS
+# are rejected with 503
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "256"))
+MAX_LATENCY_MS = int(os.getenv("MAX_LATENCY_MS", "200"))
+
+# predict with the linear predictor exported at registration or the NumPy
+# version of the pipeline when it matches the model; set to "false" to always
+# predict with the pipeline
+COMPILED_INFERENCE = os.getenv("COMPILED_INFERENCE", "true").lower() == "true"
+
+VALIDATION_ROWS = 256
+
+WARM_UP_BATCH_SIZES = (1, 16, 256)
+
+WARM_UP_REPEATS = 3
+
+REGIONS = ["northeast", "northwest", "southeast", "southwest"]
+
+
+def synthetic_rows(n: int, seed: int = 0) -> list[dict]:
+    """
+    Generates valid request rows, in the encoding sent by the backend, covering
+    every category.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n).astype(float),
+            "sex": (np.arange(n) % 2).astype(float),
+            "bmi": rng.uniform(16.0, 50.0, n).round(2),
+            "children": rng.integers(0, 6, n).astype(float),
+            "smoker": (np.arange(n) // 2 % 2).astype(float),
+            "region": np.resize(REGIONS, n),
+        }
+    ).to_dict(orient="records")
+
+
+def warm_up(model: Any) -> None:
+    """
+    Runs synthetic batches of several sizes through the prediction path, so
+    requests do not pay for lazy imports, input validation and first-call
+    dispatch. Logs the first and last timing of every size.
+    """
+    for size in WARM_UP_BATCH_SIZES:
+        rows = synthetic_rows(size)
+        timings = []
+        for _ in range(WARM_UP_REPEATS):
+            start = time.perf_counter()
+            model.predict(rows)
+            timings.append((time.perf_counter() - start) * 1000)
+        logger.info(
+            f"Warm-up batch of {size}: first {timings[0]:.1f} ms, "
+            f"last {timings[-1]:.1f} ms"
+        )
+
+
+def predict_frame(model: Any, rows: list[dict]) -> np.ndarray:
+    return model.predict(pd.DataFrame(rows))
+
+
+def try_compile(model: Any, metadata: dict) -> Predictor | None:
+    """
+    Loads the linear predictor exported with the model, or compiles the model,
+    and checks it against the pipeline on synthetic rows. Returns None if the
+    model cannot be compiled or does not match.
+    """
+    try:
+        if LINEAR_PREDICTOR_KEY in metadata:
+            compiled = LinearPredictor.from_dict(metadata[LINEAR_PREDICTOR_KEY])
+        else:
+            compiled = compile_pipeline(model)
+        error = validate(
+            compiled,
+            lambda rows: predict_frame(model, rows),
+            synthetic_rows(VALIDATION_ROWS),
+        )
+    except Exception as e:
+        logger.warning(f"Predicting with the pipeline, model cannot be compiled: {e}")
+        return None
+    logger.info(f"{type(compiled).__name__} matches the pipeline to {error:.1e}")
+    return compiled
+
+
+@dataclass(frozen=True)
+class ActiveModel:
+    tag: str
+    version: str
+    model: Any
+    loaded_at: datetime
+    compiled: Predictor | None = None
+
+    def predict(self, rows: list[dict]) -> np.ndarray:
+        if self.compiled is not None:
+            return self.compiled.predict(rows)
+        return predict_frame(self.model, rows)
+
+
+class ModelWatcher:
+    """
+    Polls the BentoML model store for a newer version of a model. A new version
+    is loaded and warmed up in a background thread and then swapped in with a
+    single reference assignment, so requests in flight finish on the model they
+    started with and no request waits for a load. `loaded` is set once the
+    first model is warm.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        warm_up: Callable[[ActiveModel], None],
+        interval: float = 30.0,
+    ):
+        self.name = name
+        self.warm_up = warm_up
+        self.interval = interval
+        self.last_checked: datetime | None = None
+        self.last_error: str | None = None
+        self.active: ActiveModel | None = None
+        self.loaded = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _load(self, bento_model: bentoml.Model) -> ActiveModel:
+        """
+        Loads, compiles and warms up a model from the store.
+        """
+        model = bento_model.load_model()
+        active = ActiveModel(
+            tag=str(bento_model.tag),
+            version=bento_model.tag.version,
+            model=model,
+            loaded_at=datetime.now(timezone.utc),
+            compiled=(
+                try_compile(model, bento_model.info.metadata)
+                if COMPILED_INFERENCE
+                else None
+            ),
+        )
+        self.warm_up(active)
+        return active
+
+    def check(self) -> bool:
+        """
+        Loads the latest model version if it differs from the active one.
+        Returns True if the model was swapped.
+        """
+        bento_model = bentoml.models.get(f"{self.name}:latest")
+        self.last_checked = datetime.now(timezone.utc)
+        previous = self.active
+        if previous is not None and bento_model.tag.version == previous.version:
+            return False
+
+        logger.info(f"Loading model version {bento_model.tag}")
+        self.active = self._load(bento_model)
+        self.loaded.set()
+        if previous is not None:
+            logger.info(f"Swapped model {previous.tag} for {self.active.tag}")
+        return True
+
+    def poll(self) -> None:
+        """
+        Runs a check, recording errors instead of raising them, so a broken
+        model version never replaces the active one.
+        """
+        try:
+            self.check()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            active = self.active.version if self.active else None
+            logger.exception(f"Model update failed, keeping version {active}")
+
+    def _watch(self) -> None:
+        self.poll()
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self) -> None:
+        """
+        Loads the first model and then polls the model store, in a daemon
+        thread.
+        """
+        self._thread = threading.Thread(
+            target=self._watch, name="model-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops polling and waits for a check in progress to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def status(self) -> dict[str, Any]:
+        """
+        Returns the active model version and the state of the watcher.
+        """
+        active = self.active
+        return {
+            "ready": active is not None,
+            "model": active and active.tag,
+            "model_version": active and active.version,
+            "loaded_at": active and active.loaded_at.isoformat(),
+            "predictor": active and type(active.compiled or active.model).__name__,
+            "last_checked": self.last_checked and self.last_checked.isoformat(),
+            "last_error": self.last_error,
+        }
 
 
 @bentoml.service(name="medical_regressor_service")
 class MedicalRegressorService:
 
     def __init__(self):
-        self.model = bentoml.models.get("medical_regressor:latest").load_model()
+        self.watcher = ModelWatcher(
+            BENTO_MODEL_NAME, warm_up=warm_up, interval=MODEL_POLL_INTERVAL
+        )
+        self.watcher.start()
+
+    def __is_ready__(self) -> bool:
+        """
+        Reports ready on /readyz once the model is loaded and warmed up.
+        """
+        return self.watcher.loaded.is_set()
+
+    @bentoml.on_shutdown
+    def shutdown(self) -> None:
+        self.watcher.stop()
+
+    def _active_model(self) -> ActiveModel:
+        active = self.watcher.active
+        if active is None:
+            raise ServiceUnavailable("Model is still loading")
+        return active
 
     @bentoml.api()
     def predict(self, input_data: dict):
-        df = pd.DataFrame([input_data])
-        prediction = self.model.predict(df)
+        active = self._active_model()
+        prediction = active.predict([input_data])
 
-        return {"charges": prediction[0]}
+        return {"charges": prediction[0], "model_version": active.version}
 
     @bentoml.api()
     def predict_multiple(self, input_data: list[dict]):
-        df = pd.DataFrame(input_data)
-        predictions = self.model.predict(df)
+        active = self._active_model()
+        predictions = active.predict(input_data)
+
+        return {"charges": predictions.tolist(), "model_version": active.version}
 
-        return {"charges": predictions.tolist()}
+    @bentoml.api(
+        batchable=True,
+        batch_dim=0,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_latency_ms=MAX_LATENCY_MS,
+    )
+    def predict_batch(self, input_data: list[dict]) -> list[float]:
+        """
+        Predicts charges for a list of rows. Concurrent requests are merged by
+        BentoML's adaptive batching into a single model call and the predictions
+        are split back per request, so responses carry predictions only; the
+        model version is reported on /status.
+        """
+        return self._active_model().predict(input_data).tolist()
+
+    @bentoml.api()
+    def status(self) -> dict:
+        return self.watcher.status()
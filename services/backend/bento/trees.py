@@ -0,0 +1,114 @@
+from typing import Any
+
+import numpy as np
+
+# (row, tree) paths traversed together; keeps the working arrays in cache
+CHUNK_PATHS = 1 << 18
+
+# paths that reached a leaf are dropped every few levels rather than every
+# level, since compacting the working arrays costs more than a level
+COMPACT_EVERY = 4
+
+
+class TreeEnsemblePredictor:
+    """
+    Regression trees packed into contiguous arrays indexed by node: the split
+    feature and threshold, the children and the leaf value. Leaves point to
+    themselves with an infinite threshold, so a path that reaches a leaf stays
+    there. Every (row, tree) path is advanced one level at a time with NumPy
+    gathers, and tree predictions are averaged as in a random forest.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        children: np.ndarray,
+        value: np.ndarray,
+        is_leaf: np.ndarray,
+        roots: np.ndarray,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.is_leaf = is_leaf
+        self.roots = roots
+
+    @classmethod
+    def from_trees(cls, trees: list[Any]) -> "TreeEnsemblePredictor":
+        """
+        Packs fitted sklearn `tree_` objects of single-output regressors.
+        """
+        if any(tree.n_outputs != 1 for tree in trees):
+            raise ValueError("Only single-output trees can be packed")
+
+        sizes = [tree.node_count for tree in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        is_leaf = np.concatenate([tree.children_left < 0 for tree in trees])
+        nodes = np.arange(len(is_leaf))
+        left = np.concatenate(
+            [tree.children_left + offset for tree, offset in zip(trees, offsets)]
+        )
+        right = np.concatenate(
+            [tree.children_right + offset for tree, offset in zip(trees, offsets)]
+        )
+        feature = np.concatenate([tree.feature for tree in trees])
+        threshold = np.concatenate([tree.threshold for tree in trees])
+        return cls(
+            feature=np.where(is_leaf, 0, feature).astype(np.int32),
+            threshold=np.where(is_leaf, np.inf, threshold),
+            # children[2 * node + goes_right]
+            children=np.stack(
+                [np.where(is_leaf, nodes, left), np.where(is_leaf, nodes, right)],
+                axis=1,
+            )
+            .ravel()
+            .astype(np.int32),
+            value=np.concatenate([tree.value[:, 0, 0] for tree in trees]),
+            is_leaf=is_leaf,
+            roots=offsets.astype(np.int32),
+        )
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """
+        Returns the leaf reached by every (row, tree) path, rows first.
+        """
+        n_rows, n_features = X.shape
+        X = X.ravel()
+        node = np.tile(self.roots, n_rows)
+        offset = np.repeat(
+            np.arange(n_rows, dtype=np.int32) * n_features, len(self.roots)
+        )
+        path = np.arange(len(node))
+        leaves = np.empty(len(node), dtype=np.int32)
+
+        level = 0
+        while len(path):
+            level += 1
+            if level % COMPACT_EVERY == 0:
+                done = np.take(self.is_leaf, node)
+                if 4 * np.count_nonzero(done) >= len(node):
+                    leaves[path[done]] = node[done]
+                    active = ~done
+                    node, offset, path = node[active], offset[active], path[active]
+                    if not len(path):
+                        break
+            x = np.take(X, offset + np.take(self.feature, node))
+            goes_right = x > np.take(self.threshold, node)
+            node = np.take(self.children, 2 * node + goes_right)
+        return leaves
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predicts an array of preprocessed features. Features are compared as
+        float32, as sklearn does.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_trees = len(self.roots)
+        rows = max(CHUNK_PATHS // n_trees, 1)
+        y = np.empty(len(X))
+        for start in range(0, len(X), rows):
+            values = self.value[self._leaves(X[start : start + rows])]
+            y[start : start + rows] = values.reshape(-1, n_trees).mean(axis=1)
+        return y
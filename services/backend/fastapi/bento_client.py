@@ -7,6 +7,16 @@ class BentoClient:
     def __init__(self, bento_url: str):
         self.bento_url = bento_url
 
+    def is_ready(self) -> bool:
+        """
+        Checks whether the BentoML service has loaded and warmed up its model.
+        """
+        try:
+            response = requests.get(f"{self.bento_url}/readyz", timeout=2)
+        except requests.RequestException:
+            return False
+        return response.ok
+
     def predict(self, data: dict) -> float:
         """
         Sends a single input data dictionary to the BentoML service for prediction.
@@ -1,13 +1,40 @@
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Annotated
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, HTTPException
 
+from .bento_client import bento_client
 from .prediction import get_prediction_service
 from .prediction_service import PredictionService
 from .schemas import (MedicalCostFeatures, PredictionManyResponse,
                       PredictionResponse)
+from .warmup import warm_up_in_background
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warms up the request path in the background; /readyz reports ready once it
+    has finished or failed.
+    """
+    app.state.warm = asyncio.Event()
+
+    task = asyncio.create_task(warm_up_in_background(app.state.warm))
+    yield
+    task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.get("/readyz")
+def readyz() -> dict[str, str]:
+    if not app.state.warm.is_set():
+        raise HTTPException(status_code=503, detail="Warming up")
+    if not bento_client.is_ready():
+        raise HTTPException(status_code=503, detail="Model service is not ready")
+    return {"status": "ready"}
 
 
 @app.post("/predict", response_model=PredictionResponse)
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.features.core import convert_features_type
+
+from .schemas import (MedicalCostFeatures, PredictionManyResponse,
+                      RegionEnum, SexEnum, SmokerEnum)
+
+logger = logging.getLogger(__name__)
+
+WARM_UP_BATCH_SIZES = (1, 16, 256)
+
+WARM_UP_REPEATS = 3
+
+
+def synthetic_features(n: int, seed: int = 0) -> list[MedicalCostFeatures]:
+    """
+    Generates valid request features covering every category.
+    """
+    rng = np.random.default_rng(seed)
+    sexes, smokers, regions = list(SexEnum), list(SmokerEnum), list(RegionEnum)
+    return [
+        MedicalCostFeatures(
+            age=int(rng.integers(18, 65)),
+            sex=sexes[idx % len(sexes)],
+            bmi=round(float(rng.uniform(16.0, 50.0)), 2),
+            children=int(rng.integers(0, 6)),
+            smoker=smokers[idx // 2 % len(smokers)],
+            region=regions[idx % len(regions)],
+        )
+        for idx in range(n)
+    ]
+
+
+def run_request_path(payload: list[dict]) -> None:
+    """
+    Runs the backend side of a prediction request without calling the model
+    service or the database: request validation, feature conversion and
+    response validation.
+    """
+    features = [MedicalCostFeatures.model_validate(row) for row in payload]
+    converted = convert_features_type(
+        pd.DataFrame([f.model_dump() for f in features])
+    ).to_dict(orient="records")
+    PredictionManyResponse(charges=[0.0] * len(converted))
+
+
+def warm_up(
+    batch_sizes: tuple[int, ...] = WARM_UP_BATCH_SIZES,
+    repeats: int = WARM_UP_REPEATS,
+) -> dict[int, list[float]]:
+    """
+    Runs synthetic batches of several sizes through the request path, so the
+    first requests do not pay for lazy imports and first-call costs. Returns
+    and logs the timings in milliseconds of every size.
+    """
+    timings = {}
+    for size in batch_sizes:
+        payload = [f.model_dump(mode="json") for f in synthetic_features(size)]
+        timings[size] = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run_request_path(payload)
+            timings[size].append((time.perf_counter() - start) * 1000)
+        logger.info(
+            f"Warm-up batch of {size}: first {timings[size][0]:.1f} ms, "
+            f"last {timings[size][-1]:.1f} ms"
+        )
+    return timings
+
+
+async def warm_up_in_background(ready: asyncio.Event) -> None:
+    """
+    Runs the warm-up in a worker thread and sets `ready` once it has finished.
+    A failed warm-up is logged and still sets `ready`, since the request path
+    works cold and only the first requests are slower.
+    """
+    try:
+        await asyncio.to_thread(warm_up)
+    except Exception:
+        logger.exception("Warm-up failed, reporting ready without it")
+    ready.set()
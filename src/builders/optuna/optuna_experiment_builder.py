@@ -1,7 +1,8 @@
 import optuna
 from src.builders.pipeline.pipeline_builder import PipelineBuilder
-from src.containers.experiment import ExperimentSetup
+from src.containers.experiment import CompiledExperiment, ExperimentSetup
 from src.dto.config import OptunaExperimentConfig
+from src.tuning.transformers.registry import TRANSFORMERS
 
 from .optuna_grid_distribution_builder import OptunaGridDistributionBuilder
 from .optuna_trial_grid_builder import OptunaTrialGridBuilder
@@ -42,3 +43,46 @@ class OptunaExperimentBuilder:
 
         pipeline = PipelineBuilder.build(**build_kwargs)
         return ExperimentSetup(pipeline, params)
+
+    @staticmethod
+    def compile(cfg: OptunaExperimentConfig) -> CompiledExperiment:
+        """
+        Builds the validated search space for every target transformation once, so
+        trials of the same study only sample parameters and build the pipeline.
+
+        Models without target transformations only search the identity one.
+        """
+        transformers = {
+            name: transformer
+            for name, transformer in cfg.transformers.to_dict().items()
+            if cfg.model.target_transformations or TRANSFORMERS[name].is_identity
+        }
+        spaces = OptunaTrialGridBuilder().compile(
+            optuna_params=cfg.optuna_model_config.params,
+            model_params=cfg.model.params,
+            transformers=transformers,
+        )
+        return CompiledExperiment(
+            spaces=spaces, model_cfg=cfg.model, features_cfg=cfg.features
+        )
+
+    @staticmethod
+    def build_from_compiled(
+        compiled: CompiledExperiment, trial: optuna.Trial
+    ) -> ExperimentSetup:
+        """
+        Builds an ExperimentSetup for a trial by sampling from the precompiled
+        search spaces.
+
+        The pipeline is constructed directly rather than cloned from a template,
+        since sklearn's clone() is far slower than building the unfitted steps.
+        """
+        params = OptunaTrialGridBuilder().build_from_spaces(
+            trial=trial, spaces=compiled.spaces
+        )
+        pipeline = PipelineBuilder.build(
+            model_cfg=compiled.model_cfg,
+            features_cfg=compiled.features_cfg,
+            transformation=trial.params["transformation"],
+        )
+        return ExperimentSetup(pipeline, params)
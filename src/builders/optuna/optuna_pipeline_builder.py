@@ -2,10 +2,12 @@ import optuna
 from src.builders.base.base_pipeline_builder import BasePipelineBuilder
 from src.conf.schema import OptunaStageConfig
 from src.containers.builder import OptunaBuildResult
-from src.data.core import DataSaver
+from src.data.core import DataLoader, DataSaver
 from src.factories.pruner_factory import PrunerFactory
 from src.io.file_ops import PathManager
 from src.models.savers.model_saver import ModelSaver
+from src.models.spec import ModelSpec
+from src.optuna.checkpoint import StudyCheckpoint
 from src.optuna.tuning import OptunaOptimize
 from src.training.cv import get_cv
 from src.tuning.runners import CrossValidationRunner, OptunaSearchRunner
@@ -21,6 +23,7 @@ class OptunaPipelineBuilder(
         return ModelSaver(
             models_dir=self.cfg.models_dir.output_dir,
             data_saver=data_saver,
+            compress=self.cfg.models_dir.compress,
         )
 
     def _build_optimizer(self) -> OptunaOptimize:
@@ -51,12 +54,29 @@ class OptunaPipelineBuilder(
         )
         return cross_runner, search_runner
 
+    def _build_checkpoint(
+        self, model_spec: ModelSpec, data_loader: DataLoader, data_saver: DataSaver
+    ) -> StudyCheckpoint | None:
+        """
+        Builds a StudyCheckpoint persisting the best trial, if enabled.
+        """
+        if not self.cfg.optuna_config.checkpoint:
+            return None
+        return StudyCheckpoint(
+            model_name=model_spec.model_class.__name__,
+            models_dir=self.cfg.models_dir.output_dir,
+            data_saver=data_saver,
+            data_loader=data_loader,
+            save_pipeline=self.cfg.optuna_config.checkpoint_pipeline,
+        )
+
     def build(self) -> OptunaBuildResult:
         """
         Builds all components for the Optuna experiment pipeline:
         - DataLoader and DataSaver
         - Optuna optimizer
         - Cross-validation and Optuna search runners
+        - Optional study checkpoint
         """
         PathManager.ensure_dir(self.cfg.models_dir.output_dir)
         data_loader, data_saver = self._build_data_io()
@@ -64,6 +84,7 @@ class OptunaPipelineBuilder(
         model_spec = self._build_model_spec()
         optimizer = self._build_optimizer()
         cross_runner, search_runner = self._build_runners(study=optimizer.study)
+        checkpoint = self._build_checkpoint(model_spec, data_loader, data_saver)
 
         return OptunaBuildResult(
             data_loader=data_loader,
@@ -72,4 +93,5 @@ class OptunaPipelineBuilder(
             optimizer=optimizer,
             cross_runner=cross_runner,
             search_runner=search_runner,
+            checkpoint=checkpoint,
         )
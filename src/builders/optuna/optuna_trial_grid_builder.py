@@ -1,6 +1,7 @@
 from typing import Any
 
 import optuna
+from optuna.distributions import BaseDistribution
 from src.builders.pipeline.pipeline_grid_builder import PipelineGridBuilder
 from src.builders.transformer.wrapper_grid_builder import WrapperGridBuilder
 from src.params.optuna_grid import OptunaGrid
@@ -16,7 +17,7 @@ class OptunaTrialGridBuilder:
         optuna_params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
-        Builds an Optuna search space from given parameters and optional 
+        Builds an Optuna search space from given parameters and optional
         Optuna config.
         """
         return OptunaSpaceBuilder.build(params, optuna_params)
@@ -26,7 +27,7 @@ class OptunaTrialGridBuilder:
         trial: optuna.Trial, optuna_space: dict[str, Any]
     ) -> dict[str, Any]:
         """
-        Suggests parameter values for a given Optuna trial based on the search 
+        Suggests parameter values for a given Optuna trial based on the search
         space.
         """
         return OptunaGrid.create_trial_params(trial, optuna_space)
@@ -37,7 +38,7 @@ class OptunaTrialGridBuilder:
         transformer_params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
-        Merges model and transformer parameters and applies pipeline/wrapper 
+        Merges model and transformer parameters and applies pipeline/wrapper
         prefixes.
         """
         if transformer_params is None:
@@ -49,6 +50,57 @@ class OptunaTrialGridBuilder:
             )
             return wrapper_grid
 
+    def build_space(
+        self,
+        transformation: str,
+        optuna_params: dict[str, Any],
+        model_params: dict[str, Any],
+        transformers: dict[str, Any],
+    ) -> dict[str, BaseDistribution]:
+        """
+        Builds the Optuna search space for a single target transformation.
+        Includes transformer parameters only if a transformer is selected for
+        optimization.
+        """
+        if TRANSFORMERS[transformation].is_identity:
+            prefixed = self._merge_and_prefix(model_params)
+        else:
+            transformer_params = transformers[transformation].params
+            prefixed = self._merge_and_prefix(model_params, transformer_params)
+
+        return self._build_optuna_space_params(
+            params=prefixed,
+            optuna_params=optuna_params,
+        )
+
+    def compile(
+        self,
+        optuna_params: dict[str, Any],
+        model_params: dict[str, Any],
+        transformers: dict[str, Any],
+    ) -> dict[str, dict[str, BaseDistribution]]:
+        """
+        Builds the search spaces for all target transformations at once, so they
+        can be reused across trials of the same study.
+        """
+        return {
+            transformation: self.build_space(
+                transformation, optuna_params, model_params, transformers
+            )
+            for transformation in transformers
+        }
+
+    def build_from_spaces(
+        self,
+        trial: optuna.Trial,
+        spaces: dict[str, dict[str, BaseDistribution]],
+    ) -> dict[str, Any]:
+        """
+        Builds the trial parameter grid from precompiled search spaces.
+        """
+        chosen_transformer = trial.suggest_categorical("transformation", list(spaces))
+        return self._build_trial_params(trial, spaces[chosen_transformer])
+
     def build(
         self,
         trial: optuna.Trial,
@@ -58,28 +110,13 @@ class OptunaTrialGridBuilder:
     ) -> dict[str, Any]:
         """
         Builds the full trial parameter grid.
-        Includes transformer parameters only if a transformer is selected for 
+        Includes transformer parameters only if a transformer is selected for
         optimization.
         """
         chosen_transformer = trial.suggest_categorical(
             "transformation", list(transformers)
         )
-
-        spec = TRANSFORMERS[chosen_transformer]
-        if spec.is_identity:
-            model_prefixed = self._merge_and_prefix(model_params)
-            model_space = self._build_optuna_space_params(
-                params=model_prefixed,
-                optuna_params=optuna_params,
-            )
-            return self._build_trial_params(trial, model_space)
-
-        else:
-            transformer_params = transformers[chosen_transformer].params
-            prefixed = self._merge_and_prefix(model_params, transformer_params)
-            space = self._build_optuna_space_params(
-                params=prefixed,
-                optuna_params=optuna_params,
-            )
-
-            return self._build_trial_params(trial, space)
+        space = self.build_space(
+            chosen_transformer, optuna_params, model_params, transformers
+        )
+        return self._build_trial_params(trial, space)
@@ -1,15 +1,36 @@
 from sklearn.base import BaseEstimator
+from sklearn.linear_model import LinearRegression
 
 from src.builders.pipeline.pipeline_builder import PipelineBuilder
 from src.builders.pipeline.pipeline_grid_builder import PipelineGridBuilder
 from src.conf.schema import TrainingStageConfig
 from src.training.cv import get_cv
 from src.training.train import TrainModel
-from src.tuning.runners import CrossValidationRunner, GridSearchRunner
+from src.tuning.runners import (CrossValidationRunner, GridSearchRunner,
+                                StreamingLinearRunner)
 from src.tuning.transformers import TargetTransformer
 
 
 class TrainingBuilder:
+    @staticmethod
+    def build_streaming_runner(
+        model_class: type[BaseEstimator], cfg: TrainingStageConfig
+    ) -> StreamingLinearRunner:
+        """
+        Builds the out-of-core runner, which supports linear regression without
+        a parameter grid only.
+        """
+        if not issubclass(model_class, LinearRegression) or cfg.model.params:
+            raise ValueError(
+                "Out-of-core training supports LinearRegression without a "
+                f"parameter grid only, got {model_class.__name__}"
+            )
+        return StreamingLinearRunner(
+            features=cfg.features,
+            n_splits=cfg.cv.n_splits,
+            random_state=cfg.cv.random_state,
+        )
+
     @staticmethod
     def build(model_class: type[BaseEstimator], cfg: TrainingStageConfig) -> TrainModel:
         """
@@ -24,7 +45,11 @@ class TrainingBuilder:
         param_grid = PipelineGridBuilder.build(model_params=cfg.model.params)
 
         grid_runner = GridSearchRunner(cv=cv)
-        cross_runner = CrossValidationRunner(cv=cv)
+        cross_runner = (
+            TrainingBuilder.build_streaming_runner(model_class, cfg)
+            if cfg.streaming is not None and cfg.streaming.enabled
+            else CrossValidationRunner(cv=cv)
+        )
 
         target_transformer = TargetTransformer(
             cfg_transform=cfg.transformers,
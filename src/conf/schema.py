@@ -46,6 +46,11 @@ class ModelConfig(ConvertConfig):
 class OptunaConfig(ConvertConfig):
     trials: int
     timeout: float | None = None
+    top_n: int = 1
+    budget: float | None = None
+    rounds: int = 4
+    checkpoint: bool = True
+    checkpoint_pipeline: bool = False
 
 
 @dataclass
@@ -92,11 +97,15 @@ class DataDir:
     root_dir: Path
     raw_dir: Path
     processed_dir: Path
+    memory_map: bool = False
+    shared_dir: Path | None = None
 
     def __post_init__(self) -> None:
         self.root_dir = Path(self.root_dir)
         self.raw_dir = Path(self.raw_dir)
         self.processed_dir = Path(self.processed_dir)
+        if self.shared_dir is not None:
+            self.shared_dir = Path(self.shared_dir)
 
 
 @dataclass
@@ -104,6 +113,8 @@ class TrainingDir:
     output_dir: Path
     model_file: str
     metrics_file: str
+    index_file: str = "index.sqlite"
+    compress: int | str | None = None
 
     def __post_init__(self) -> None:
         self.output_dir = Path(self.output_dir)
@@ -112,6 +123,7 @@ class TrainingDir:
 @dataclass
 class ModelsDir:
     output_dir: Path
+    compress: int | str | None = None
 
     def __post_init__(self) -> None:
         self.output_dir = Path(self.output_dir)
@@ -123,10 +135,53 @@ class KaggleConfig:
     filename: str
 
 
+@dataclass
+class ConversionConfig(ConvertConfig):
+    streaming: bool = True
+    block_size: int = 1 << 20
+    row_group_size: int = 1 << 20
+    column_types: dict[str, str] | None = None
+    categorical: list[str] | None = None
+
+
+@dataclass
+class SyntheticConfig(ConvertConfig):
+    enabled: bool = False
+    rows: int = 1_000_000
+    chunk_rows: int = 1_000_000
+    seed: int = 42
+    filename: str = "insurance_synthetic.parquet"
+
+
+@dataclass
+class IngestConfig(ConvertConfig):
+    enabled: bool = False
+    dataset: str = "claims"
+    source: str | None = None
+    date: str | None = None
+    id_column: str | None = None
+
+
 @dataclass
 class DataStageConfig:
     data_dir: DataDir
     kaggle: KaggleConfig
+    conversion: ConversionConfig | None = None
+    synthetic: SyntheticConfig | None = None
+    ingest: IngestConfig | None = None
+
+
+@dataclass
+class StreamingConfig(ConvertConfig):
+    enabled: bool = False
+    batch_size: int = 1 << 20
+
+
+@dataclass
+class MLflowConfig(ConvertConfig):
+    background: bool = True
+    queue_size: int = 2
+    retries: int = 2
 
 
 @dataclass
@@ -137,6 +192,8 @@ class TrainingStageConfig:
     features: FeaturesConfig
     model: ModelConfig
     transformers: TransformersConfig
+    streaming: StreamingConfig | None = None
+    mlflow: MLflowConfig | None = None
 
 
 @dataclass
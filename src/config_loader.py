@@ -1,9 +1,10 @@
 from omegaconf import DictConfig
 
-from src.conf.schema import (CVConfig, DataDir, DataStageConfig,
-                             FeaturesConfig, KaggleConfig, ModelConfig,
-                             TrainingDir, TrainingStageConfig,
-                             TransformersConfig)
+from src.conf.schema import (ConversionConfig, CVConfig, DataDir,
+                             DataStageConfig, FeaturesConfig, IngestConfig,
+                             KaggleConfig, MLflowConfig, ModelConfig,
+                             StreamingConfig, SyntheticConfig, TrainingDir,
+                             TrainingStageConfig, TransformersConfig)
 
 
 def load_stage_configs(cfg: DictConfig) -> tuple[DataStageConfig, TrainingStageConfig]:
@@ -18,6 +19,17 @@ def load_stage_configs(cfg: DictConfig) -> tuple[DataStageConfig, TrainingStageC
     data_dir = DataDir(**cfg.data)
     training_dir = TrainingDir(**cfg.training)
     kaggle_cfg = KaggleConfig(**cfg.kaggle)
+    conversion_cfg = (
+        ConversionConfig.from_omegaconf(cfg.conversion) if "conversion" in cfg else None
+    )
+    synthetic_cfg = (
+        SyntheticConfig.from_omegaconf(cfg.synthetic) if "synthetic" in cfg else None
+    )
+    streaming_cfg = (
+        StreamingConfig.from_omegaconf(cfg.streaming) if "streaming" in cfg else None
+    )
+    mlflow_cfg = MLflowConfig.from_omegaconf(cfg.mlflow) if "mlflow" in cfg else None
+    ingest_cfg = IngestConfig.from_omegaconf(cfg.ingest) if "ingest" in cfg else None
 
     training_stage_cfg = TrainingStageConfig(
         data_dir=data_dir,
@@ -26,8 +38,16 @@ def load_stage_configs(cfg: DictConfig) -> tuple[DataStageConfig, TrainingStageC
         features=features_cfg,
         model=model_cfg,
         transformers=transform_cfg,
+        streaming=streaming_cfg,
+        mlflow=mlflow_cfg,
     )
 
-    data_stage_cfg = DataStageConfig(data_dir=data_dir, kaggle=kaggle_cfg)
+    data_stage_cfg = DataStageConfig(
+        data_dir=data_dir,
+        kaggle=kaggle_cfg,
+        conversion=conversion_cfg,
+        synthetic=synthetic_cfg,
+        ingest=ingest_cfg,
+    )
 
     return data_stage_cfg, training_stage_cfg
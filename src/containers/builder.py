@@ -4,6 +4,7 @@ from src.data.core import DataLoader
 from src.models.savers.model_saver import ModelSaver
 from src.models.savers.run_saver import RunSaver
 from src.models.spec import ModelSpec
+from src.optuna.checkpoint import StudyCheckpoint
 from src.optuna.tuning import OptunaOptimize
 from src.training.train import TrainModel
 from src.tuning.runners import CrossValidationRunner, OptunaSearchRunner
@@ -25,3 +26,4 @@ class OptunaBuildResult:
     optimizer: OptunaOptimize
     cross_runner: CrossValidationRunner
     search_runner: OptunaSearchRunner
+    checkpoint: StudyCheckpoint | None = None
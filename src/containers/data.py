@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 
@@ -9,3 +11,48 @@ class SplitData:
     X_test: pd.DataFrame
     y_train: pd.Series | pd.DataFrame
     y_test: pd.Series | pd.DataFrame
+
+
+@dataclass
+class ParquetBatches:
+    path: Path
+    reader: Callable[..., Iterator[pd.DataFrame]]
+    columns: list[str] | None = None
+    batch_size: int = 1 << 20
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        """
+        Streams the file in batches; every iteration starts a new pass.
+        """
+        return self.reader(self.path, batch_size=self.batch_size, columns=self.columns)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """
+        Returns the first `n` rows of the first batch.
+        """
+        return next(iter(self)).head(n)
+
+
+@dataclass
+class StreamingSplitData:
+    X_train: ParquetBatches
+    X_test: ParquetBatches
+    y_train: pd.Series
+    y_test: pd.Series
+
+
+@dataclass
+class FileDigest:
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class DataManifest:
+    data_hash: str
+    inputs_hash: str
+    params: dict[str, Any]
+    raw: FileDigest
+    splits: dict[str, FileDigest] = field(default_factory=dict)
+    batches: dict[str, FileDigest] = field(default_factory=dict)
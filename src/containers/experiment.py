@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 from sklearn.base import BaseEstimator
 
+import optuna
+from optuna.distributions import BaseDistribution
 from src.conf.schema import (FeaturesConfig, ModelConfig, OptunaModelConfig,
                              TransformersConfig)
 
@@ -14,6 +16,13 @@ class ExperimentSetup:
     params: dict[str, Any]
 
 
+@dataclass
+class CompiledExperiment:
+    spaces: dict[str, dict[str, BaseDistribution]]
+    model_cfg: ModelConfig
+    features_cfg: FeaturesConfig
+
+
 @dataclass
 class ExperimentContext:
     model_cfg: ModelConfig
@@ -23,3 +32,10 @@ class ExperimentContext:
     X_train: pd.DataFrame
     X_test: pd.DataFrame
     y_train: pd.Series
+
+
+@dataclass
+class SchedulerArm:
+    name: str
+    study: optuna.Study
+    optimize: Callable[[int | None, float | None], optuna.Study]
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 
-from src.io.readers import CSVReader, JoblibReader, ParquetReader, YamlReader
-from src.io.writers import JoblibWriter, ParquetWriter, YamlWriter
+from src.io.readers import (ArrowReader, CSVReader, JoblibReader, JsonReader,
+                            MsgpackReader, ParquetReader, YamlReader)
+from src.io.writers import (ArrowWriter, JoblibWriter, JsonWriter,
+                            MsgpackWriter, ParquetWriter, YamlWriter)
 
 
 @dataclass
@@ -10,6 +12,9 @@ class Readers:
     parquet: ParquetReader
     yaml: YamlReader
     joblib: JoblibReader
+    json: JsonReader
+    msgpack: MsgpackReader
+    arrow: ArrowReader
 
 
 @dataclass
@@ -17,3 +22,6 @@ class Writers:
     parquet: ParquetWriter
     yaml: YamlWriter
     joblib: JoblibWriter
+    json: JsonWriter
+    msgpack: MsgpackWriter
+    arrow: ArrowWriter
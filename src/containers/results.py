@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -46,11 +47,79 @@ class StageResult:
     folds_scores_mean: float
     metrics: dict[str, float]
     transformation: str | None = None
+    data_hash: str | None = None
 
 
 @dataclass
-class LoadedModelResults:
-    runs: dict[str, StageResult]
+class EstimatorHandle:
+    path: Path
+    loader: Callable[..., BaseEstimator]
+    mmap_mode: str | None = None
+    _estimator: BaseEstimator | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def loaded(self) -> bool:
+        return self._estimator is not None
+
+    def get(self) -> BaseEstimator:
+        """
+        Deserializes the estimator on first access and caches it.
+        """
+        if self._estimator is None:
+            self._estimator = self.loader(self.path, mmap_mode=self.mmap_mode)
+        return self._estimator
+
+    def set(self, estimator: BaseEstimator) -> None:
+        """
+        Replaces the estimator, e.g. with a refit one, without loading it.
+        """
+        self._estimator = estimator
+
+
+class LazyStageResult(StageResult):
+    """
+    StageResult of a saved run whose estimator is only deserialized when the
+    `estimator` attribute is first accessed. Representing or comparing the
+    result uses the handle, so it never loads the estimator.
+    """
+
+    estimator_handle: EstimatorHandle
+
+    @property
+    def estimator(self) -> BaseEstimator:
+        return self.estimator_handle.get()
+
+    @estimator.setter
+    def estimator(self, value: EstimatorHandle | BaseEstimator) -> None:
+        if isinstance(value, EstimatorHandle):
+            self.estimator_handle = value
+        else:
+            self.estimator_handle.set(value)
+
+    def _fields(self) -> dict[str, Any]:
+        values = {
+            f.name: getattr(self, f.name) for f in fields(self) if f.name != "estimator"
+        }
+        return {**values, "estimator_handle": self.estimator_handle}
+
+    def __repr__(self) -> str:
+        values = self._fields().items()
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in values)})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+
+@dataclass
+class IndexedRun:
+    run_id: str
+    model_name: str
+    test_r2: float | None
+    run_dir: Path
 
 
 @dataclass
@@ -59,3 +128,14 @@ class PredictionSet:
     y_test: pd.Series
     train_predictions: YType
     test_predictions: YType
+
+
+@dataclass
+class ArmAllocation:
+    name: str
+    seconds: float = 0.0
+    trials: int = 0
+    best_value: float = float("-inf")
+    rate: float | None = None
+    stopped_round: int | None = None
+    history: list[float] = field(default_factory=list)
@@ -20,6 +20,9 @@ RunnerType = TypeVar("RunnerType", bound=BaseEstimator)
 """Type returned by run() method of the base runner"""
 OptunaRunnerResult = TypeVar("OptunaRunnerResult")
 
+"""Joblib compression: level, codec name, "codec:level" or (codec, level)"""
+CompressionType = int | str | tuple[str, int] | None
+
 """Type of stage configuration in pipeline base builder"""
 StageConfigType = TypeVar("StageConfigType")
 
@@ -1 +1,16 @@
 SPLIT_FILES = ["X_train", "X_test", "y_train", "y_test"]
+
+TARGET_COLUMN = "charges"
+
+METRICS_FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".msgpack": "msgpack",
+}
+
+TEST_SIZE = 0.2
+
+RANDOM_STATE = 42
+
+MANIFEST_FILE = "manifest.json"
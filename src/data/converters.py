@@ -1,10 +1,21 @@
+from abc import ABC, abstractmethod
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from src.io.file_ops import PathManager
 from src.io.readers import CSVReader
 from src.io.writers import ParquetWriter
 
 
-class CSVToParquetConverter:
+class BaseConverter(ABC):
+    @abstractmethod
+    def convert(self, csv_path: Path, parquet_path: Path) -> Path: ...
+
+
+class CSVToParquetConverter(BaseConverter):
     def __init__(self, csv_reader: CSVReader, parquet_writer: ParquetWriter):
         self.csv_reader = csv_reader
         self.parquet_writer = parquet_writer
@@ -16,3 +27,72 @@ class CSVToParquetConverter:
         df = self.csv_reader.read(csv_path)
         self.parquet_writer.write(df, parquet_path)
         return parquet_path
+
+
+class StreamingCSVToParquetConverter(BaseConverter):
+    """
+    Converts a CSV file into Parquet batch by batch with pyarrow, so memory is
+    bounded by the row group size instead of the file size.
+    """
+
+    def __init__(
+        self,
+        column_types: dict[str, str] | None = None,
+        categorical: list[str] | None = None,
+        block_size: int = 1 << 20,
+        row_group_size: int = 1 << 20,
+    ):
+        self.column_types = column_types or {}
+        self.categorical = categorical or []
+        self.block_size = block_size
+        self.row_group_size = row_group_size
+
+    def _convert_options(self) -> pacsv.ConvertOptions:
+        """
+        Builds explicit column types; categorical columns are dictionary-encoded.
+        """
+        column_types = {
+            name: pa.type_for_alias(alias) for name, alias in self.column_types.items()
+        }
+        for name in self.categorical:
+            column_types[name] = pa.dictionary(
+                pa.int32(), column_types.get(name, pa.string())
+            )
+        return pacsv.ConvertOptions(column_types=column_types)
+
+    def convert(self, csv_path: Path, parquet_path: Path) -> Path:
+        """
+        Streams a CSV file at the given path into a Parquet file, writing a row
+        group every `row_group_size` rows.
+        """
+        reader = pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=self.block_size),
+            convert_options=self._convert_options(),
+        )
+
+        with (
+            PathManager.atomic_write(parquet_path) as tmp_path,
+            pq.ParquetWriter(tmp_path, reader.schema) as writer,
+        ):
+            batches, rows = [], 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows < self.row_group_size:
+                    continue
+
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                full = rows - rows % self.row_group_size
+                writer.write_table(
+                    table.slice(0, full).combine_chunks(), self.row_group_size
+                )
+                batches = table.slice(full).to_batches()
+                rows -= full
+
+            if rows:
+                writer.write_table(
+                    pa.Table.from_batches(batches, schema=reader.schema).combine_chunks()
+                )
+
+        return parquet_path
@@ -1,29 +1,46 @@
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 from sklearn.base import BaseEstimator
 
-from src.containers.data import SplitData
+from src.containers.data import (DataManifest, ParquetBatches, SplitData,
+                                  StreamingSplitData)
 from src.containers.io import Readers, Writers
-from src.containers.types import SplitDataDict
+from src.containers.types import CompressionType, SplitDataDict
 from src.io.file_ops import PathManager
 from src.logger.setup import logger
+from src.serializers.data_manifest import DataManifestSerializer
 from src.serializers.split_data import SplitDataSerializer
 
-from .constants import SPLIT_FILES
-from .converters import CSVToParquetConverter
+from .constants import MANIFEST_FILE, METRICS_FORMATS, SPLIT_FILES
+from .converters import BaseConverter
 from .download import DatasetDownloader
 from .split import get_missing_split_files
 
 
+def get_metrics_format(path: Path) -> str:
+    """
+    Returns the name of the metrics format matching the file extension.
+    """
+    try:
+        return METRICS_FORMATS[path.suffix]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported metrics file extension '{path.suffix}', "
+            f"expected one of: {', '.join(METRICS_FORMATS)}"
+        ) from None
+
+
 class DataLoader:
     def __init__(self, readers: Readers):
         self.readers = readers
 
-    def load_splitted_data(self, processed_dir: Path) -> SplitData:
+    @staticmethod
+    def _check_splits(processed_dir: Path) -> None:
         """
-        Loads train/test splits from processed directory into a SplitData object.
+        Raises FileNotFoundError if any split file is missing.
         """
         missing_files = get_missing_split_files(processed_dir)
         if missing_files:
@@ -33,23 +50,84 @@ class DataLoader:
                 f"The following required files are missing in {processed_dir}: {missing_str}"
             )
 
+    def load_splitted_data(
+        self,
+        processed_dir: Path,
+        columns: list[str] | None = None,
+        memory_map: bool = False,
+    ) -> SplitData:
+        """
+        Loads train/test splits from processed directory into a SplitData object.
+        Feature splits can be restricted to the given columns.
+        """
+        self._check_splits(processed_dir)
+
         data = {
-            file: self.readers.parquet.read(processed_dir / f"{file}.parquet")
+            file: self.readers.parquet.read(
+                processed_dir / f"{file}.parquet",
+                columns=columns if file.startswith("X") else None,
+                memory_map=memory_map,
+            )
             for file in SPLIT_FILES
         }
         return SplitDataSerializer.from_dict(data)
 
+    def load_streaming_data(
+        self,
+        processed_dir: Path,
+        columns: list[str] | None = None,
+        batch_size: int = 1 << 20,
+    ) -> StreamingSplitData:
+        """
+        Loads the train/test targets into memory and returns the feature splits
+        as Parquet batch streams, for training that does not fit in memory.
+        """
+        self._check_splits(processed_dir)
+
+        def batches(name: str) -> ParquetBatches:
+            return ParquetBatches(
+                path=processed_dir / f"{name}.parquet",
+                reader=self.readers.parquet.iter_batches,
+                columns=columns,
+                batch_size=batch_size,
+            )
+
+        def target(name: str) -> pd.Series:
+            path = processed_dir / f"{name}.parquet"
+            return self.readers.parquet.read(path).iloc[:, 0]
+
+        return StreamingSplitData(
+            X_train=batches("X_train"),
+            X_test=batches("X_test"),
+            y_train=target("y_train"),
+            y_test=target("y_test"),
+        )
+
     def load_metrics(self, metrics_path: Path) -> dict[str, Any]:
         """
-        Loads metrics from a YAML file and return as a dictionary.
+        Loads metrics from a YAML, JSON or MessagePack file, chosen by the file
+        extension, and return as a dictionary.
         """
-        return self.readers.yaml.read(metrics_path)
+        return getattr(self.readers, get_metrics_format(metrics_path)).read(
+            metrics_path
+        )
 
-    def load_model(self, model_path: Path) -> BaseEstimator:
+    def load_manifest(self, processed_dir: Path) -> DataManifest | None:
+        """
+        Loads the data manifest of the processed directory, if one was written.
+        """
+        manifest_path = processed_dir / MANIFEST_FILE
+        if not PathManager.exists(manifest_path):
+            return None
+        return DataManifestSerializer.from_dict(self.readers.json.read(manifest_path))
+
+    def load_model(
+        self, model_path: Path, mmap_mode: str | None = None
+    ) -> BaseEstimator:
         """
         Loads model from Pickle file and return estimator.
         """
-        return self.readers.joblib.read(model_path)
+        return self.readers.joblib.read(model_path, mmap_mode=mmap_mode)
 
 
 class DataSaver:
@@ -64,17 +142,56 @@ class DataSaver:
         for name, value in splits.items():
             self.writers.parquet.write(value, processed_dir / f"{name}.parquet")
 
+    @contextmanager
+    def split_appender(
+        self, processed_dir: Path
+    ) -> Iterator[Callable[[SplitDataDict], None]]:
+        """
+        Yields a function appending splits to their Parquet files in the
+        processed directory, creating them if needed. Each file is written by
+        one open writer and replaced once the block exits without error.
+        """
+        with ExitStack() as stack:
+            appenders = {
+                name: stack.enter_context(
+                    self.writers.parquet.appender(processed_dir / f"{name}.parquet")
+                )
+                for name in SPLIT_FILES
+            }
+
+            def append(splits: SplitDataDict) -> None:
+                for name, value in splits.items():
+                    appenders[name].append(value)
+
+            yield append
+
     def save_metrics(self, metrics: dict[str, Any], metrics_path: Path) -> None:
         """
-        Saves evaluation metrics as a YAML file.
+        Saves evaluation metrics as a YAML, JSON or MessagePack file, chosen by
+        the file extension.
         """
-        self.writers.yaml.write(metrics, metrics_path)
+        getattr(self.writers, get_metrics_format(metrics_path)).write(
+            metrics, metrics_path
+        )
 
-    def save_model(self, model: BaseEstimator, model_path: Path) -> None:
+    def save_manifest(self, manifest: DataManifest, processed_dir: Path) -> None:
         """
-        Saves a scikit-learn model using Joblib.
+        Saves the data manifest as JSON in the processed directory.
         """
-        self.writers.joblib.write(model, model_path)
+        self.writers.json.write(
+            DataManifestSerializer.to_dict(manifest), processed_dir / MANIFEST_FILE
+        )
+
+    def save_model(
+        self,
+        model: BaseEstimator,
+        model_path: Path,
+        compress: CompressionType = None,
+    ) -> None:
+        """
+        Saves a scikit-learn model using Joblib, optionally compressed.
+        """
+        self.writers.joblib.write(model, model_path, compress=compress)
 
 
 class DataFetcher:
@@ -82,26 +199,38 @@ class DataFetcher:
         self,
         raw_dir: Path,
         downloader: DatasetDownloader,
-        converter: CSVToParquetConverter,
+        converter: BaseConverter,
         readers: Readers,
+        filename: str = "insurance.parquet",
     ):
         self.raw_dir = raw_dir
         self.downloader = downloader
         self.converter = converter
         self.readers = readers
+        self.filename = filename
 
-    def fetch(self, filename: str = "insurance.parquet") -> pd.DataFrame:
+    def fetch_path(self, filename: str | None = None) -> Path:
         """
-        Fetches dataset as a Pandas DataFrame. Downloads CSV and converts to
-        Parquet if needed.
+        Ensures the raw dataset exists as Parquet and returns its path. Downloads
+        CSV and converts to Parquet if needed; sources producing Parquet directly
+        skip conversion.
         """
-        parquet_path = self.raw_dir / filename
+        parquet_path = self.raw_dir / (filename or self.filename)
 
         if PathManager.exists(parquet_path):
             logger.debug("Dataset is already downloaded")
-            return self.readers.parquet.read(parquet_path)
+            return parquet_path
 
-        csv_path = self.downloader.download()
-        parquet_path = self.converter.convert(csv_path, parquet_path)
-        PathManager.remove_file(csv_path)
-        return self.readers.parquet.read(parquet_path)
+        downloaded_path = self.downloader.download()
+        if downloaded_path.suffix == ".parquet":
+            downloaded_path.replace(parquet_path)
+        else:
+            parquet_path = self.converter.convert(downloaded_path, parquet_path)
+            PathManager.remove_file(downloaded_path)
+        return parquet_path
+
+    def fetch(self, filename: str | None = None) -> pd.DataFrame:
+        """
+        Fetches dataset as a Pandas DataFrame.
+        """
+        return self.readers.parquet.read(self.fetch_path(filename))
@@ -1,21 +1,44 @@
 from pathlib import Path
+from typing import Any, Callable
 
 import pandas as pd
 
+from src.containers.data import DataManifest, FileDigest, SplitData
 from src.data.split import split_features_target, split_train_test
 from src.logger.setup import logger
+from src.serializers.split_data import SplitDataSerializer
 
-from .core import DataFetcher, DataSaver
-from .split import get_missing_split_files
+from .constants import RANDOM_STATE, SPLIT_FILES, TARGET_COLUMN, TEST_SIZE
+from .core import DataFetcher, DataLoader, DataSaver
+from .ingest import ROW_ID, PartitionedDataset, assign_test
+from .manifest import DataManifestBuilder
 
 
 class Data:
     def __init__(
-        self, data_saver: DataSaver, data_fetcher: DataFetcher, processed_dir: Path
+        self,
+        data_saver: DataSaver,
+        data_fetcher: DataFetcher,
+        processed_dir: Path,
+        data_loader: DataLoader,
+        test_size: float = TEST_SIZE,
+        random_state: int = RANDOM_STATE,
+        dataset: PartitionedDataset | None = None,
     ):
         self.data_saver = data_saver
         self.data_fetcher = data_fetcher
         self.processed_dir = processed_dir
+        self.data_loader = data_loader
+        self.test_size = test_size
+        self.random_state = random_state
+        self.dataset = dataset
+
+    def fetch_path(self) -> Path:
+        """
+        Delegates dataset fetching to DataFetcher and returns the path of the raw
+        Parquet file.
+        """
+        return self.data_fetcher.fetch_path()
 
     def fetch(self) -> pd.DataFrame:
         """
@@ -24,18 +47,124 @@ class Data:
         """
         return self.data_fetcher.fetch()
 
-    def split(self, df: pd.DataFrame, target_col: str = "charges") -> None:
+    def read(self, raw_path: Path) -> pd.DataFrame:
         """
-        Splits a DataFrame into features (X) and target (y), then into training and test sets,
-        and save the resulting datasets as Parquet files.
+        Reads the raw Parquet dataset as a Pandas DataFrame.
+        """
+        return self.data_fetcher.readers.parquet.read(raw_path)
+
+    def params(
+        self,
+        transform: str,
+        target_col: str = TARGET_COLUMN,
+        incremental: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Returns the parameters the splits depend on besides the raw data.
         """
-        missing_files = get_missing_split_files(self.processed_dir)
-        if not missing_files:
-            logger.debug("Splits already exist, skipping")
-            return
+        params = {
+            "target": target_col,
+            "test_size": self.test_size,
+            "split": "hash" if incremental else "random",
+            "transform": transform,
+        }
+        if incremental:
+            params["id_column"] = self.dataset.id_column
+        else:
+            params["random_state"] = self.random_state
+        return params
 
-        X, y = split_features_target(df, target_col)
-        split_data = split_train_test(X, y)
+    def current_manifest(
+        self, raw_path: Path, params: dict[str, Any]
+    ) -> DataManifest | None:
+        """
+        Returns the stored manifest if the splits on disk were produced from the
+        given raw data and parameters, otherwise None.
+        """
+        manifest = self.data_loader.load_manifest(self.processed_dir)
+        raw = DataManifestBuilder.digest(
+            raw_path, cached=manifest.raw if manifest is not None else None
+        )
+        if DataManifestBuilder.is_current(manifest, raw, params, self.processed_dir):
+            return manifest
+        return None
+
+    def split(
+        self, df: pd.DataFrame, raw_path: Path, params: dict[str, Any]
+    ) -> DataManifest:
+        """
+        Splits a DataFrame into features (X) and target (y), then into training and test sets,
+        saves the resulting datasets as Parquet files and records them in the data manifest.
+        """
+        X, y = split_features_target(df, params["target"])
+        split_data = split_train_test(
+            X, y, test_size=self.test_size, random_state=self.random_state
+        )
         self.data_saver.save_splitted_data(
             splits=split_data, processed_dir=self.processed_dir
         )
+
+        previous = self.data_loader.load_manifest(self.processed_dir)
+        raw = DataManifestBuilder.digest(
+            raw_path, cached=previous.raw if previous is not None else None
+        )
+        manifest = DataManifestBuilder.build(raw, params, self.processed_dir)
+        self.data_saver.save_manifest(manifest, self.processed_dir)
+        return manifest
+
+    def _applied_batches(
+        self, batches: dict[str, Path], params: dict[str, Any]
+    ) -> dict[str, FileDigest]:
+        """
+        Returns the batches already reflected in the processed splits. Splits made
+        with other parameters, modified on disk, or containing batches no longer in
+        the dataset are discarded and rebuilt from all batches.
+        """
+        manifest = self.data_loader.load_manifest(self.processed_dir)
+        if (
+            manifest is not None
+            and manifest.params == params
+            and manifest.batches.keys() <= batches.keys()
+            and DataManifestBuilder.splits_match(manifest, self.processed_dir)
+        ):
+            return manifest.batches
+
+        for name in SPLIT_FILES:
+            (self.processed_dir / f"{name}.parquet").unlink(missing_ok=True)
+        return {}
+
+    def update_splits(
+        self,
+        params: dict[str, Any],
+        transform: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> DataManifest:
+        """
+        Appends the batches of the partitioned dataset that are not yet in the
+        processed splits. Rows are assigned to train/test by hashed row id, so
+        earlier batches never have to be re-split.
+        """
+        batches = self.dataset.batches()
+        digests = dict(self._applied_batches(batches, params))
+
+        with self.data_saver.split_appender(self.processed_dir) as append_splits:
+            for name, path in batches.items():
+                if name in digests:
+                    continue
+                logger.info(f"Adding batch {name} to the splits")
+                df = self.dataset.read(path)
+                test = assign_test(df.pop(ROW_ID).to_numpy(), self.test_size)
+                X, y = split_features_target(transform(df), params["target"])
+                split_data = SplitData(
+                    X_train=X[~test], X_test=X[test], y_train=y[~test], y_test=y[test]
+                )
+                append_splits(SplitDataSerializer.to_dict(split_data))
+                digests[name] = DataManifestBuilder.digest(path)
+
+        manifest = DataManifestBuilder.build(
+            DataManifestBuilder.combine(digests),
+            params,
+            self.processed_dir,
+            batches=digests,
+        )
+        self.data_saver.save_manifest(manifest, self.processed_dir)
+        return manifest
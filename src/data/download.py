@@ -3,6 +3,12 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 import kagglehub
+import pandas as pd
+
+from src.io.file_ops import PathManager
+from src.logger.setup import logger
+
+from .synthetic import InsuranceSynthesizer
 
 
 class BaseDownloader(ABC):
@@ -39,6 +45,46 @@ class KaggleDownloader(BaseDownloader):
         shutil.rmtree(path, ignore_errors=True)
 
 
+class SyntheticDownloader(BaseDownloader):
+    def __init__(
+        self,
+        reference: BaseDownloader,
+        filename: str,
+        rows: int,
+        chunk_rows: int = 1_000_000,
+        seed: int = 42,
+        synthesizer: InsuranceSynthesizer | None = None,
+    ):
+        self.reference = reference
+        self.filename = filename
+        self.rows = rows
+        self.chunk_rows = chunk_rows
+        self.seed = seed
+        self.synthesizer = synthesizer or InsuranceSynthesizer()
+
+    def download(self, path: Path) -> Path:
+        """
+        Fetches the reference dataset with the wrapped downloader, fits the
+        synthesizer on it and writes the synthetic dataset as Parquet chunks.
+        The reference file is removed once the synthesizer is fitted.
+        """
+        reference_path = self.reference.download(path)
+        reference = (
+            pd.read_parquet(reference_path)
+            if reference_path.suffix == ".parquet"
+            else pd.read_csv(reference_path)
+        )
+        logger.info(
+            f"Generating {self.rows} synthetic rows from {len(reference)} "
+            f"reference rows"
+        )
+        self.synthesizer.fit(reference)
+        PathManager.remove_file(reference_path)
+        return self.synthesizer.write(
+            path / self.filename, self.rows, self.chunk_rows, self.seed
+        )
+
+
 class DatasetDownloader:
     def __init__(self, raw_dir: Path, downloader: BaseDownloader):
         self.raw_dir = raw_dir
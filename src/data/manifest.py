@@ -0,0 +1,135 @@
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from src.containers.data import DataManifest, FileDigest
+
+from .constants import SPLIT_FILES
+
+CHUNK_SIZE = 1 << 20
+
+
+def hash_file(path: Path) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in 1 MiB chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_values(*values: Any) -> str:
+    """
+    Returns the SHA-256 hex digest of JSON-serializable values.
+    """
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def code_fingerprint(*funcs: Callable) -> str:
+    """
+    Returns a digest of the source code of the given functions, so processed
+    data is invalidated when a transformation changes.
+    """
+    return hash_values(*(inspect.getsource(func) for func in funcs))
+
+
+class DataManifestBuilder:
+    @staticmethod
+    def digest(path: Path, cached: FileDigest | None = None) -> FileDigest:
+        """
+        Returns the digest of a file, reusing the cached hash when the file size
+        and modification time are unchanged.
+        """
+        stat = path.stat()
+        if (
+            cached is not None
+            and cached.size == stat.st_size
+            and cached.mtime_ns == stat.st_mtime_ns
+        ):
+            return cached
+        return FileDigest(
+            sha256=hash_file(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns
+        )
+
+    @staticmethod
+    def combine(digests: dict[str, FileDigest]) -> FileDigest:
+        """
+        Combines the digests of the files of a partitioned dataset into one.
+        """
+        return FileDigest(
+            sha256=hash_values({name: d.sha256 for name, d in digests.items()}),
+            size=sum(d.size for d in digests.values()),
+            mtime_ns=max((d.mtime_ns for d in digests.values()), default=0),
+        )
+
+    @staticmethod
+    def inputs_hash(raw: FileDigest, params: dict[str, Any]) -> str:
+        """
+        Returns the digest of everything the splits are derived from.
+        """
+        return hash_values(raw.sha256, params)
+
+    @staticmethod
+    def splits_match(manifest: DataManifest, processed_dir: Path) -> bool:
+        """
+        Checks whether the split files on disk are the ones recorded in the
+        manifest. Files are only re-hashed when their size or modification time
+        changed.
+        """
+        for name in SPLIT_FILES:
+            path = processed_dir / f"{name}.parquet"
+            stored = manifest.splits.get(name)
+            if stored is None or not path.exists():
+                return False
+            if DataManifestBuilder.digest(path, cached=stored).sha256 != stored.sha256:
+                return False
+        return True
+
+    @staticmethod
+    def is_current(
+        manifest: DataManifest | None,
+        raw: FileDigest,
+        params: dict[str, Any],
+        processed_dir: Path,
+    ) -> bool:
+        """
+        Checks whether a stored manifest still describes the raw data, parameters
+        and split files on disk.
+        """
+        if manifest is None:
+            return False
+        if DataManifestBuilder.inputs_hash(raw, params) != manifest.inputs_hash:
+            return False
+        return DataManifestBuilder.splits_match(manifest, processed_dir)
+
+    @staticmethod
+    def build(
+        raw: FileDigest,
+        params: dict[str, Any],
+        processed_dir: Path,
+        batches: dict[str, FileDigest] | None = None,
+    ) -> DataManifest:
+        """
+        Hashes the split files in the processed directory into a manifest. The
+        data hash covers the raw data, the parameters and the splits.
+        """
+        splits = {
+            name: DataManifestBuilder.digest(processed_dir / f"{name}.parquet")
+            for name in SPLIT_FILES
+        }
+        inputs_hash = DataManifestBuilder.inputs_hash(raw, params)
+        return DataManifest(
+            data_hash=hash_values(
+                inputs_hash, {name: d.sha256 for name, d in splits.items()}
+            ),
+            inputs_hash=inputs_hash,
+            params=params,
+            raw=raw,
+            splits=splits,
+            batches=batches or {},
+        )
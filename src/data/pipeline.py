@@ -1,8 +1,14 @@
 import time
+from pathlib import Path
+
+import pandas as pd
 
 from src.conf.schema import DataStageConfig
+from src.containers.data import DataManifest
 from src.factories.data_factory import DataFactory
-from src.features.core import convert_features_type
+from src.data.constants import TARGET_COLUMN
+from src.data.manifest import code_fingerprint
+from src.features.core import convert_features_type, optimize_dtypes
 from src.io.file_ops import PathManager
 from src.logger.setup import logger
 from src.patterns.base_pipeline import BasePipeline
@@ -20,6 +26,62 @@ class DataPipeline(BasePipeline[None, None]):
         PathManager.ensure_dir(self.cfg.data_dir.raw_dir)
         PathManager.ensure_dir(self.cfg.data_dir.processed_dir)
 
+    @staticmethod
+    def _transform(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts features to numeric types and downcasts them to compact dtypes.
+        """
+        logger.info("Converting features to numeric types [int/float]")
+        df = convert_features_type(df)
+
+        logger.info("Downcasting features to compact dtypes")
+        return optimize_dtypes(df, exclude=[TARGET_COLUMN])
+
+    def ingest(self) -> DataManifest:
+        """
+        Appends the configured batch to the partitioned dataset (seeding it with
+        the downloaded data on the first run) and adds new batches to the splits.
+        """
+        ingest_cfg = self.cfg.ingest
+        dataset = self.data.dataset
+
+        if ingest_cfg.source is not None:
+            logger.info(f"Ingesting batch from {ingest_cfg.source}")
+            dataset.append(
+                dataset.read_source(Path(ingest_cfg.source)), date=ingest_cfg.date
+            )
+        elif not dataset.batches():
+            logger.info("Seeding partitioned dataset with the downloaded data")
+            dataset.append(self.data.fetch(), date=ingest_cfg.date)
+
+        params = self.data.params(
+            transform=code_fingerprint(convert_features_type, optimize_dtypes),
+            incremental=True,
+        )
+        logger.info("Updating train/test splits")
+        return self.data.update_splits(params, self._transform)
+
+    def prepare(self) -> DataManifest:
+        """
+        Fetches the dataset and splits it, unless the splits on disk were already
+        produced from the same data and parameters.
+        """
+        logger.info("Fetching dataset")
+        raw_path = self.data.fetch_path()
+        params = self.data.params(
+            transform=code_fingerprint(convert_features_type, optimize_dtypes)
+        )
+
+        manifest = self.data.current_manifest(raw_path, params)
+        if manifest is not None:
+            logger.info("Splits are up to date, skipping")
+            return manifest
+
+        df = self._transform(self.data.read(raw_path))
+
+        logger.info("Preparing train/test splits")
+        return self.data.split(df, raw_path, params)
+
     def run(self) -> None:
         """
         Executes a full data pipeline.
@@ -30,14 +92,8 @@ class DataPipeline(BasePipeline[None, None]):
         logger.info("Initializing data pipeline environment")
         self.build()
 
-        logger.info("Fetching dataset")
-        df = self.data.fetch()
-
-        logger.info("Converting features to numeric types [int/float]")
-        df = convert_features_type(df)
-
-        logger.info("Preparing train/test splits")
-        self.data.split(df)
+        manifest = self.ingest() if self.data.dataset is not None else self.prepare()
+        logger.info(f"Data hash: {manifest.data_hash[:12]}")
 
         end_data = time.perf_counter()
         logger.info(f"Data stage completed in {end_data - start_data:.2f}s")
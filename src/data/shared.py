@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from src.containers.data import SplitData
+from src.containers.io import Readers
+from src.io.file_ops import PathManager
+from src.io.writers import ArrowWriter
+from src.logger.setup import logger
+from src.serializers.split_data import SplitDataSerializer
+
+from .constants import SPLIT_FILES
+from .split import get_missing_split_files
+
+
+class SharedSplitStore:
+    """
+    Uncompressed Arrow IPC copies of the train/test splits in a shared directory
+    (e.g. `/dev/shm`). Memory-mapping them yields zero-copy DataFrames whose pages
+    are shared by every process loading the same splits, instead of each worker
+    decoding its own private copy of the Parquet files.
+    """
+
+    def __init__(self, shared_dir: Path, readers: Readers, arrow_writer: ArrowWriter):
+        self.shared_dir = shared_dir
+        self.readers = readers
+        self.arrow_writer = arrow_writer
+
+    def path(self, file: str) -> Path:
+        return self.shared_dir / f"{file}.arrow"
+
+    def publish(self, processed_dir: Path) -> None:
+        """
+        Exports every split missing or older than its Parquet file to the shared
+        directory.
+        """
+        missing_files = get_missing_split_files(processed_dir)
+        if missing_files:
+            raise FileNotFoundError(
+                f"The following required files are missing in {processed_dir}: "
+                f"{', '.join(missing_files)}"
+            )
+
+        PathManager.ensure_dir(self.shared_dir)
+        for file in SPLIT_FILES:
+            parquet_path = processed_dir / f"{file}.parquet"
+            arrow_path = self.path(file)
+            if (
+                PathManager.exists(arrow_path)
+                and arrow_path.stat().st_mtime >= parquet_path.stat().st_mtime
+            ):
+                continue
+
+            logger.debug(f"Publishing {file} to {self.shared_dir}")
+            df = self.readers.parquet.read(parquet_path)
+            with PathManager.atomic_write(arrow_path) as tmp_path:
+                self.arrow_writer.write(df, tmp_path)
+
+    def load(self, processed_dir: Path, columns: list[str] | None = None) -> SplitData:
+        """
+        Publishes the splits if needed and memory-maps them into a SplitData
+        object. Feature splits can be restricted to the given columns.
+        """
+        self.publish(processed_dir)
+        data = {
+            file: self.readers.arrow.read(
+                self.path(file), columns=columns if file.startswith("X") else None
+            )
+            for file in SPLIT_FILES
+        }
+        return SplitDataSerializer.from_dict(data)
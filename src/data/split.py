@@ -8,7 +8,7 @@ from src.containers.types import SplitDataDict
 from src.io.file_ops import PathManager
 from src.serializers.split_data import SplitDataSerializer
 
-from .constants import SPLIT_FILES
+from .constants import RANDOM_STATE, SPLIT_FILES, TEST_SIZE
 
 
 def split_features_target(
@@ -23,7 +23,10 @@ def split_features_target(
 
 
 def split_train_test(
-    X: pd.DataFrame, y: pd.Series, test_size=0.2, random_state=42
+    X: pd.DataFrame,
+    y: pd.Series,
+    test_size: float = TEST_SIZE,
+    random_state: int = RANDOM_STATE,
 ) -> SplitDataDict:
     """
     Splits features and target into train/test sets.
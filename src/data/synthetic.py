@@ -0,0 +1,151 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.io.file_ops import PathManager
+from src.logger.setup import logger
+
+CATEGORIES = {
+    "sex": ["female", "male"],
+    "smoker": ["no", "yes"],
+    "region": ["northeast", "northwest", "southeast", "southwest"],
+}
+
+SCHEMA = pa.schema(
+    [
+        ("age", pa.int64()),
+        ("sex", pa.dictionary(pa.int8(), pa.string())),
+        ("bmi", pa.float64()),
+        ("children", pa.int64()),
+        ("smoker", pa.dictionary(pa.int8(), pa.string())),
+        ("region", pa.dictionary(pa.int8(), pa.string())),
+        ("charges", pa.float64()),
+    ]
+)
+
+
+class InsuranceSynthesizer:
+    """
+    Generates synthetic insurance records with the schema of the Kaggle dataset.
+
+    Rows are drawn by a smoothed bootstrap of the reference data, which keeps the
+    joint distribution of categorical features, age and bmi. Age and bmi are
+    jittered, and charges are re-priced with a log-linear model of the reference
+    charges (including the smoker x obesity interaction), so they stay consistent
+    with the jittered features.
+    """
+
+    def __init__(
+        self,
+        age_jitter: int = 2,
+        bmi_noise: float = 0.05,
+        charges_noise: float = 0.05,
+    ):
+        self.age_jitter = age_jitter
+        self.bmi_noise = bmi_noise
+        self.charges_noise = charges_noise
+        self.reference: dict[str, np.ndarray] | None = None
+        self.coef: np.ndarray | None = None
+
+    @staticmethod
+    def _design(columns: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Builds the design matrix of the log-charges model.
+        """
+        age, bmi = columns["age"], columns["bmi"]
+        smoker = columns["smoker"].astype(float)
+        obese = (bmi >= 30).astype(float)
+        region = np.eye(len(CATEGORIES["region"]))[columns["region"]][:, 1:]
+        return np.column_stack(
+            [
+                np.ones_like(age, dtype=float),
+                age,
+                age**2,
+                bmi,
+                columns["children"],
+                columns["sex"],
+                smoker,
+                smoker * bmi,
+                smoker * obese,
+                region,
+            ]
+        )
+
+    def fit(self, df: pd.DataFrame) -> "InsuranceSynthesizer":
+        """
+        Stores the encoded reference rows and fits the log-charges model.
+        """
+        columns = {
+            "age": df["age"].to_numpy(dtype=float),
+            "bmi": df["bmi"].to_numpy(dtype=float),
+            "children": df["children"].to_numpy(dtype=float),
+            "charges": df["charges"].to_numpy(dtype=float),
+        }
+        for name, categories in CATEGORIES.items():
+            codes = pd.Categorical(df[name].astype(str), categories=categories).codes
+            if (codes < 0).any():
+                raise ValueError(f"Unexpected values in column '{name}'")
+            columns[name] = codes.astype(np.int8)
+
+        self.reference = columns
+        self.coef, *_ = np.linalg.lstsq(
+            self._design(columns), np.log(columns["charges"]), rcond=None
+        )
+        return self
+
+    def sample(self, n: int, rng: np.random.Generator) -> pa.Table:
+        """
+        Generates `n` synthetic rows as an Arrow table.
+        """
+        if self.reference is None:
+            raise RuntimeError("InsuranceSynthesizer must be fitted before sampling")
+
+        idx = rng.integers(len(self.reference["age"]), size=n)
+        base = {name: values[idx] for name, values in self.reference.items()}
+
+        columns = dict(base)
+        columns["age"] = np.clip(
+            base["age"] + rng.integers(-self.age_jitter, self.age_jitter + 1, n),
+            18,
+            64,
+        )
+        columns["bmi"] = np.round(
+            np.clip(base["bmi"] * np.exp(rng.normal(0, self.bmi_noise, n)), 15, 55), 3
+        )
+        shift = (self._design(columns) - self._design(base)) @ self.coef
+        columns["charges"] = np.round(
+            base["charges"] * np.exp(shift + rng.normal(0, self.charges_noise, n)), 5
+        )
+
+        arrays = {
+            "age": pa.array(columns["age"].astype(np.int64)),
+            "bmi": pa.array(columns["bmi"]),
+            "children": pa.array(columns["children"].astype(np.int64)),
+            "charges": pa.array(columns["charges"]),
+        }
+        for name, categories in CATEGORIES.items():
+            arrays[name] = pa.DictionaryArray.from_arrays(
+                pa.array(columns[name], type=pa.int8()), pa.array(categories)
+            )
+        return pa.table([arrays[name] for name in SCHEMA.names], schema=SCHEMA)
+
+    def write(
+        self, path: Path, rows: int, chunk_rows: int = 1_000_000, seed: int = 42
+    ) -> Path:
+        """
+        Writes `rows` synthetic rows to a Parquet file, one row group per chunk,
+        so the whole dataset never has to fit in memory.
+        """
+        rng = np.random.default_rng(seed)
+        with (
+            PathManager.atomic_write(path) as tmp_path,
+            pq.ParquetWriter(tmp_path, SCHEMA) as writer,
+        ):
+            for start in range(0, rows, chunk_rows):
+                n = min(chunk_rows, rows - start)
+                writer.write_table(self.sample(n, rng))
+                logger.debug(f"Generated synthetic rows {start + n}/{rows}")
+        return path
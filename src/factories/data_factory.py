@@ -1,13 +1,53 @@
 from src.conf.schema import DataStageConfig
-from src.data.converters import CSVToParquetConverter
-from src.data.core import DataFetcher, DataSaver
+from src.containers.io import Readers, Writers
+from src.data.converters import (BaseConverter, CSVToParquetConverter,
+                                 StreamingCSVToParquetConverter)
+from src.data.core import DataFetcher, DataLoader, DataSaver
 from src.data.data import Data
-from src.data.download import DatasetDownloader, KaggleDownloader
+from src.data.ingest import PartitionedDataset
+from src.data.download import (BaseDownloader, DatasetDownloader,
+                               KaggleDownloader, SyntheticDownloader)
 
 from .io_factory import IOFactory
 
 
 class DataFactory:
+    @staticmethod
+    def create_converter(
+        cfg: DataStageConfig, readers: Readers, writers: Writers
+    ) -> BaseConverter:
+        """
+        Creates the streaming pyarrow converter if enabled in the config, otherwise
+        the in-memory pandas one.
+        """
+        if cfg.conversion is None or not cfg.conversion.streaming:
+            return CSVToParquetConverter(readers.csv, writers.parquet)
+
+        return StreamingCSVToParquetConverter(
+            column_types=cfg.conversion.column_types,
+            categorical=cfg.conversion.categorical,
+            block_size=cfg.conversion.block_size,
+            row_group_size=cfg.conversion.row_group_size,
+        )
+
+    @staticmethod
+    def create_source(cfg: DataStageConfig) -> BaseDownloader:
+        """
+        Creates the Kaggle downloader, wrapped in the synthetic data generator if
+        enabled in the config.
+        """
+        kaggle_downloader = KaggleDownloader(cfg.kaggle.handle, cfg.kaggle.filename)
+        if cfg.synthetic is None or not cfg.synthetic.enabled:
+            return kaggle_downloader
+
+        return SyntheticDownloader(
+            reference=kaggle_downloader,
+            filename=cfg.synthetic.filename,
+            rows=cfg.synthetic.rows,
+            chunk_rows=cfg.synthetic.chunk_rows,
+            seed=cfg.synthetic.seed,
+        )
+
     @staticmethod
     def create(cfg: DataStageConfig) -> Data:
         """
@@ -16,10 +56,37 @@ class DataFactory:
         readers = IOFactory.create_readers()
         writers = IOFactory.create_writers()
 
-        kaggle_downloader = KaggleDownloader(cfg.kaggle.handle, cfg.kaggle.filename)
-        downloader = DatasetDownloader(cfg.data_dir.raw_dir, kaggle_downloader)
-        converter = CSVToParquetConverter(readers.csv, writers.parquet)
+        source = DataFactory.create_source(cfg)
+        downloader = DatasetDownloader(cfg.data_dir.raw_dir, source)
+        converter = DataFactory.create_converter(cfg, readers, writers)
         data_saver = DataSaver(writers)
-        data_fetcher = DataFetcher(cfg.data_dir.raw_dir, downloader, converter, readers)
+        data_fetcher = DataFetcher(
+            cfg.data_dir.raw_dir,
+            downloader,
+            converter,
+            readers,
+            filename=(
+                cfg.synthetic.filename
+                if cfg.synthetic is not None and cfg.synthetic.enabled
+                else "insurance.parquet"
+            ),
+        )
+
+        dataset = (
+            PartitionedDataset(
+                cfg.data_dir.raw_dir / cfg.ingest.dataset,
+                readers,
+                writers,
+                id_column=cfg.ingest.id_column,
+            )
+            if cfg.ingest is not None and cfg.ingest.enabled
+            else None
+        )
 
-        return Data(data_saver, data_fetcher, cfg.data_dir.processed_dir)
+        return Data(
+            data_saver,
+            data_fetcher,
+            cfg.data_dir.processed_dir,
+            data_loader=DataLoader(readers),
+            dataset=dataset,
+        )
@@ -1,13 +1,20 @@
 from src.containers.io import Readers, Writers
-from src.io.readers import CSVReader, JoblibReader, ParquetReader, YamlReader
-from src.io.writers import JoblibWriter, ParquetWriter, YamlWriter
+from src.io.readers import (ArrowReader, CSVReader, JoblibReader, JsonReader,
+                            MsgpackReader, ParquetReader, YamlReader)
+from src.io.writers import (ArrowWriter, JoblibWriter, JsonWriter,
+                            MsgpackWriter, ParquetWriter, YamlWriter)
 
 
 class IOFactory:
     @staticmethod
     def create_writers() -> Writers:
         return Writers(
-            parquet=ParquetWriter(), yaml=YamlWriter(), joblib=JoblibWriter()
+            parquet=ParquetWriter(),
+            yaml=YamlWriter(),
+            joblib=JoblibWriter(),
+            json=JsonWriter(),
+            msgpack=MsgpackWriter(),
+            arrow=ArrowWriter(),
         )
 
     @staticmethod
@@ -17,4 +24,7 @@ class IOFactory:
             parquet=ParquetReader(),
             yaml=YamlReader(),
             joblib=JoblibReader(),
+            json=JsonReader(),
+            msgpack=MsgpackReader(),
+            arrow=ArrowReader(),
         )
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -13,3 +14,49 @@ def convert_features_type(df: pd.DataFrame) -> pd.DataFrame:
     df["smoker"] = (df["smoker"] == "yes").astype(float)
     
     return df
+
+
+def optimize_dtypes(df: pd.DataFrame, exclude: list[str] | None = None) -> pd.DataFrame:
+    """
+    Downcasts columns to compact dtypes: integral values to the smallest integer
+    type, other floats to float32 and strings to pandas categoricals. Excluded
+    columns (e.g. the target) are left untouched.
+    """
+    df = df.copy()
+    exclude = set(exclude or [])
+
+    for col in df.columns:
+        if col in exclude:
+            continue
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            df[col] = series.astype(np.int8)
+        elif pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            if series.notna().all() and (series % 1 == 0).all():
+                df[col] = pd.to_numeric(series, downcast="integer")
+            else:
+                df[col] = series.astype(np.float32)
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(
+            series
+        ):
+            df[col] = series.astype("category")
+
+    return df
+
+
+def widen_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts compact dtypes back to float64 and strings, the types clients send
+    to the served model.
+    """
+    df = df.copy()
+
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(df[col].cat.categories.dtype)
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype(np.float64)
+
+    return df
@@ -1,4 +1,13 @@
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+# The umask can only be read by setting it, so read it once at import rather
+# than flipping the process-wide value on every write.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 class PathManager:
@@ -23,3 +32,25 @@ class PathManager:
         Returns True if the given path exists, False otherwise.
         """
         return path.exists()
+
+    @staticmethod
+    @contextmanager
+    def atomic_write(path: Path) -> Iterator[Path]:
+        """
+        Yields a temporary path next to the target and atomically moves it into
+        place once writing succeeded, so readers never see a partial file. The
+        temporary name is unique, so concurrent writers of the same target do
+        not clobber each other's files. The file gets the usual 0o666 & ~umask
+        mode instead of the 0o600 that mkstemp creates it with.
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{path.stem}.", suffix=f".tmp{path.suffix}", dir=path.parent
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            yield tmp_path
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
@@ -1,14 +1,29 @@
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Generic, Iterator, TypeVar
 
 import joblib
 import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import yaml
 from sklearn.base import BaseEstimator
 
 T = TypeVar("T")
 
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def in_file_order(names: list[str], columns: list[str]) -> list[str]:
+    """
+    Orders the requested columns as they are stored in the file.
+    """
+    missing = set(columns) - set(names)
+    if missing:
+        raise KeyError(f"Columns not found in file: {', '.join(sorted(missing))}")
+    return [name for name in names if name in columns]
+
 
 class BaseReader(ABC, Generic[T]):
     @abstractmethod
@@ -26,23 +41,84 @@ class CSVReader(BaseReader[pd.DataFrame]):
 class YamlReader(BaseReader[dict]):
     def read(self, path: Path) -> dict:
         """
-        Reads a YAML file from the given path into a Python dictionary.
+        Reads a YAML file from the given path into a Python dictionary, using
+        the libyaml loader when available.
+        """
+        with open(path) as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+
+class JsonReader(BaseReader[dict]):
+    def read(self, path: Path) -> dict:
+        """
+        Reads a JSON file from the given path into a Python dictionary.
         """
         with open(path) as f:
-            return yaml.safe_load(f)
+            return json.load(f)
+
+
+class MsgpackReader(BaseReader[dict]):
+    def read(self, path: Path) -> dict:
+        """
+        Reads a MessagePack file from the given path into a Python dictionary.
+        Requires the optional `msgpack` package.
+        """
+        import msgpack
+
+        with open(path, "rb") as f:
+            return msgpack.unpack(f)
 
 
 class ParquetReader(BaseReader[pd.DataFrame]):
-    def read(self, path: Path) -> pd.DataFrame:
+    def read(
+        self,
+        path: Path,
+        columns: list[str] | None = None,
+        memory_map: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Reads a Parquet file from the given path into a pandas DataFrame, reading
+        only the given columns. Arrow buffers are released column by column while
+        converting, which keeps peak memory close to the size of the result.
+        """
+        if columns is not None:
+            columns = in_file_order(pq.read_schema(path).names, columns)
+        table = pq.read_table(path, columns=columns, memory_map=memory_map)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def iter_batches(
+        self,
+        path: Path,
+        batch_size: int = 1 << 20,
+        columns: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads a Parquet file batch by batch as pandas DataFrames of at most
+        `batch_size` rows, so memory is bounded by the batch size.
+        """
+        parquet_file = pq.ParquetFile(path)
+        if columns is not None:
+            columns = in_file_order(parquet_file.schema_arrow.names, columns)
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas(split_blocks=True, self_destruct=True)
+
+
+class ArrowReader(BaseReader[pd.DataFrame]):
+    def read(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame:
         """
-        Reads a Parquet file from the given path into a pandas DataFrame.
+        Memory-maps an uncompressed Arrow IPC file into a pandas DataFrame.
+        Numeric columns without nulls are zero-copy views of the mapped file.
         """
-        return pd.read_parquet(path)
+        table = feather.read_table(path, memory_map=True)
+        if columns is not None:
+            table = table.select(in_file_order(table.column_names, columns))
+        return table.to_pandas(split_blocks=True)
 
 
 class JoblibReader(BaseReader[BaseEstimator]):
-    def read(self, path: Path) -> BaseEstimator:
+    def read(self, path: Path, mmap_mode: str | None = None) -> BaseEstimator:
         """
-        Reads a Joblib file from the given path into a scikit-learn model.
+        Reads a Joblib file from the given path into a scikit-learn model,
+        optionally memory-mapping its numpy arrays.
         """
-        return joblib.load(path)
+        return joblib.load(path, mmap_mode=mmap_mode)
@@ -1,13 +1,22 @@
+import json
+import os
 from abc import ABC, abstractmethod
+from contextlib import ExitStack
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import yaml
 import joblib
 from sklearn.base import BaseEstimator
 
 from typing import Generic, TypeVar
 
+from src.containers.types import CompressionType
+from src.io.file_ops import PathManager
+
 T = TypeVar("T")
 
 
@@ -23,6 +32,87 @@ class ParquetWriter(BaseWriter[pd.DataFrame]):
         """
         data.to_parquet(path, index=False)
 
+    def appender(self, path: Path) -> "ParquetAppender":
+        """
+        Returns an appender adding DataFrames to the Parquet file at the given
+        path through a single open writer.
+        """
+        return ParquetAppender(path)
+
+
+class ParquetAppender:
+    """
+    Appends DataFrames to a Parquet file as new row groups of one open writer,
+    so appending N DataFrames copies the existing file once instead of N times.
+    Column types are promoted to a common type when they differ (e.g. int8 and
+    int16); only then are the rows written so far copied into a wider file.
+    The file is replaced atomically on exit and left untouched on error or if
+    nothing was appended.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.schema: pa.Schema | None = None
+        self._stack = ExitStack()
+        self._tmp_path: Path | None = None
+        self._writer: pq.ParquetWriter | None = None
+
+    def __enter__(self) -> "ParquetAppender":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._stack.__exit__(exc_type, exc, tb)
+
+    def _start(self, schema: pa.Schema, source: Path | None) -> None:
+        """
+        Opens the writer on the temporary file and copies the row groups of
+        `source` into it, cast to the given schema.
+        """
+        self._writer = pq.ParquetWriter(self._tmp_path, schema)
+        self.schema = schema
+        if source is not None:
+            existing = pq.ParquetFile(source)
+            for i in range(existing.num_row_groups):
+                self._writer.write_table(existing.read_row_group(i).cast(schema))
+
+    def append(self, data: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        if self._writer is None:
+            self._tmp_path = self._stack.enter_context(
+                PathManager.atomic_write(self.path)
+            )
+            source = self.path if self.path.exists() else None
+            schemas = [table.schema]
+            if source is not None:
+                schemas.insert(0, pq.ParquetFile(source).schema_arrow)
+            self._start(pa.unify_schemas(schemas, promote_options="permissive"), source)
+        else:
+            schema = pa.unify_schemas(
+                [self.schema, table.schema], promote_options="permissive"
+            )
+            if not schema.equals(self.schema):
+                self._writer.close()
+                previous = self._tmp_path.with_name(f"{self._tmp_path.name}.old")
+                os.replace(self._tmp_path, previous)
+                try:
+                    self._start(schema, previous)
+                finally:
+                    previous.unlink()
+        self._writer.write_table(table.cast(self.schema))
+
+
+class ArrowWriter(BaseWriter[pd.DataFrame]):
+    def write(self, data: pd.DataFrame, path: Path) -> None:
+        """
+        Writes a pandas DataFrame to an uncompressed, single-chunk Arrow IPC file,
+        so it can be memory-mapped and read without copies.
+        """
+        feather.write_feather(
+            data, path, compression="uncompressed", chunksize=max(len(data), 1)
+        )
+
 
 class YamlWriter(BaseWriter[dict]):
     def write(self, data: dict, path: Path) -> None:
@@ -33,9 +123,47 @@ class YamlWriter(BaseWriter[dict]):
             yaml.safe_dump(data, f)
 
 
+class JsonWriter(BaseWriter[dict]):
+    def write(self, data: dict, path: Path) -> None:
+        """
+        Writes a Python dictionary to a JSON file at the given path.
+        """
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+class MsgpackWriter(BaseWriter[dict]):
+    def write(self, data: dict, path: Path) -> None:
+        """
+        Writes a Python dictionary to a MessagePack file at the given path.
+        Requires the optional `msgpack` package.
+        """
+        import msgpack
+
+        with open(path, "wb") as f:
+            msgpack.pack(data, f)
+
+
 class JoblibWriter(BaseWriter[BaseEstimator]):
-    def write(self, data: BaseEstimator, path: Path) -> None:
+    @staticmethod
+    def parse_compression(compress: CompressionType) -> int | str | tuple[str, int]:
+        """
+        Normalizes a compression setting to the form accepted by joblib:
+        `None` disables compression and "zlib:3" becomes ("zlib", 3).
+        """
+        if compress is None:
+            return 0
+        if isinstance(compress, str) and ":" in compress:
+            method, level = compress.split(":", 1)
+            return method, int(level)
+        return compress
+
+    def write(
+        self, data: BaseEstimator, path: Path, compress: CompressionType = None
+    ) -> None:
         """
-        Writes a Python object to a joblib file at the given path.
+        Writes a Python object to a joblib file at the given path. Uncompressed
+        files can be loaded with `mmap_mode`, compressed ones are always read
+        fully into memory.
         """
-        joblib.dump(data, path)
+        joblib.dump(data, path, compress=self.parse_compression(compress))
@@ -0,0 +1,102 @@
+import queue
+import threading
+import time
+
+import pandas as pd
+
+from src.containers.results import StageResult
+from src.logger.setup import logger
+
+from .logger import MLflowLogger
+
+
+class BackgroundMLflowLogger:
+    """
+    Logs models to MLflow from a worker thread, so training continues while
+    the previous run uploads. The queue is bounded: `log_model` blocks when
+    `queue_size` runs are already waiting. Failed runs are retried and kept in
+    `failed`; `close` waits for the queue to drain and reports them.
+    """
+
+    def __init__(
+        self,
+        mlflow_logger: MLflowLogger,
+        queue_size: int = 2,
+        retries: int = 2,
+        retry_delay: float = 1.0,
+    ):
+        self.mlflow_logger = mlflow_logger
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failed: list[StageResult] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(
+            target=self._work, name="mlflow-logger", daemon=True
+        )
+        self._worker.start()
+
+    def __enter__(self) -> "BackgroundMLflowLogger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(raise_on_failure=exc_type is None)
+
+    def log_model(
+        self, result: StageResult, X_train: pd.DataFrame, register: bool = False
+    ) -> None:
+        """
+        Queues a model to be logged to MLflow, waiting while the queue is full.
+        """
+        if not self._worker.is_alive():
+            raise RuntimeError("Background MLflow logger is closed")
+        self._queue.put((result, X_train, register))
+
+    def _log(self, result: StageResult, X_train: pd.DataFrame, register: bool) -> None:
+        """
+        Logs a model, retrying with exponential backoff.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                self.mlflow_logger.log_model(result, X_train, register=register)
+                return
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                delay = self.retry_delay * 2**attempt
+                logger.warning(
+                    f"Logging {result.model_name} to MLflow failed ({e}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                try:
+                    self._log(*item)
+                except Exception:
+                    logger.exception(f"Failed to log {item[0].model_name} to MLflow")
+                    self.failed.append(item[0])
+            finally:
+                self._queue.task_done()
+
+    def close(self, raise_on_failure: bool = True) -> None:
+        """
+        Waits until all queued runs are logged and stops the worker. Raises if
+        any run could not be logged.
+        """
+        if self._worker.is_alive():
+            logger.info("Waiting for background MLflow logging to finish")
+            self._queue.put(None)
+            self._worker.join()
+
+        if self.failed and raise_on_failure:
+            runs = ", ".join(
+                f"{result.model_name} {result.params}" for result in self.failed
+            )
+            raise RuntimeError(
+                f"{len(self.failed)} run(s) could not be logged to MLflow: {runs}"
+            )
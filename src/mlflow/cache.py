@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from src.data.manifest import hash_file
+from src.io.file_ops import PathManager
+from src.logger.setup import logger
+
+CHECKSUMS_FILE = "checksums.json"
+
+
+class ModelCache:
+    """
+    On-disk cache of registered MLflow models keyed by (name, version).
+
+    A registered version never changes, so an entry stays valid as long as its
+    files match the SHA-256 checksums recorded at download time; corrupted or
+    partial entries are downloaded again. Entries beyond `max_entries` are
+    evicted least recently used first.
+    """
+
+    def __init__(self, root: Path, max_entries: int = 5):
+        self.root = root
+        self.max_entries = max_entries
+
+    def _entry_dir(self, name: str, version: int) -> Path:
+        return self.root / name / str(version)
+
+    @staticmethod
+    def _checksums(model_dir: Path) -> dict[str, str]:
+        return {
+            path.relative_to(model_dir).as_posix(): hash_file(path)
+            for path in sorted(model_dir.rglob("*"))
+            if path.is_file()
+        }
+
+    def get(self, name: str, version: int) -> Path | None:
+        """
+        Returns the cached model directory if the entry exists and is intact,
+        marking it as recently used.
+        """
+        entry = self._entry_dir(name, version)
+        checksums_path = entry / CHECKSUMS_FILE
+        if not checksums_path.exists():
+            return None
+
+        with open(checksums_path) as f:
+            checksums = json.load(f)
+        model_dir = entry / "model"
+        if self._checksums(model_dir) != checksums:
+            logger.warning(f"Cached model {name} v{version} is corrupted, discarding")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        os.utime(checksums_path)
+        return model_dir
+
+    def put(
+        self, name: str, version: int, download: Callable[[Path], Path]
+    ) -> Path:
+        """
+        Downloads a model into the cache with `download`, which receives an empty
+        directory and returns the directory holding the model, then evicts the
+        least recently used entries. Returns the cached model directory.
+        """
+        entry = self._entry_dir(name, version)
+        tmp_entry = PathManager.ensure_dir(
+            entry.with_name(f".{version}.{uuid.uuid4().hex[:8]}.tmp")
+        )
+        try:
+            model_dir = tmp_entry / "model"
+            downloaded = download(PathManager.ensure_dir(tmp_entry / "download"))
+            os.replace(downloaded, model_dir)
+            shutil.rmtree(tmp_entry / "download", ignore_errors=True)
+
+            with open(tmp_entry / CHECKSUMS_FILE, "w") as f:
+                json.dump(self._checksums(model_dir), f, indent=2)
+
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp_entry, entry)
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        logger.info(f"Cached model {name} v{version} in {entry}")
+        self.evict(keep=entry)
+        return entry / "model"
+
+    def evict(self, keep: Path | None = None) -> None:
+        """
+        Removes the least recently used entries beyond `max_entries`.
+        """
+        entries = sorted(
+            self.root.glob(f"*/*/{CHECKSUMS_FILE}"),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        stale = [path.parent for path in entries if path.parent != keep]
+        for entry in stale[max(self.max_entries - (keep is not None), 0) :]:
+            logger.info(f"Evicting cached model {entry.parent.name} v{entry.name}")
+            shutil.rmtree(entry, ignore_errors=True)
@@ -3,6 +3,7 @@ import uuid
 import pandas as pd
 
 from src.containers.results import StageResult
+from src.features.core import widen_dtypes
 
 from .service import MLflowService
 
@@ -11,6 +12,26 @@ class MLflowLogger:
     def __init__(self, service: MLflowService):
         self.service = service
         self.service.setup()
+        self._artifact_kwargs: dict | None = None
+
+    def _get_artifact_kwargs(
+        self, result: StageResult, X_train: pd.DataFrame
+    ) -> dict:
+        """
+        Computes the input example, signature and pip requirements on the first
+        logged run and reuses them for the rest of the stage. The example uses
+        the float64/string types clients send, not the compact training dtypes.
+        """
+        if self._artifact_kwargs is None:
+            input_example = widen_dtypes(X_train.iloc[:5])
+            self._artifact_kwargs = {
+                "input_example": input_example,
+                "signature": self.service.build_signature(input_example),
+                "pip_requirements": self.service.infer_pip_requirements(
+                    result.estimator
+                ),
+            }
+        return self._artifact_kwargs
 
     def log_model(
         self, result: StageResult, X_train: pd.DataFrame, register: bool = False
@@ -20,10 +41,19 @@ class MLflowLogger:
         """
         run_name = f"{result.model_name}-{uuid.uuid4().hex[:6]}"
         with self.service.start_run(run_name):
-            self.service.log_params(result.params)
-            self.service.log_metrics(
-                result.metrics, result.folds_scores, result.folds_scores_mean
+            params = dict(result.params)
+            if result.data_hash is not None:
+                params["data_hash"] = result.data_hash
+            self.service.log_batch(
+                params=params,
+                metrics=self.service.build_metrics(
+                    result.metrics, result.folds_scores, result.folds_scores_mean
+                ),
+            )
+            self.service.log_artifacts(
+                result.estimator,
+                result.model_name,
+                **self._get_artifact_kwargs(result, X_train),
             )
-            self.service.log_artifacts(result.estimator, result.model_name, X_train)
             if register:
                 self.service.register_model(result.model_name)
@@ -1,19 +1,29 @@
+import tempfile
+import time
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 
 import mlflow
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.models import ModelSignature
 from mlflow.tracking import MlflowClient
+from src.logger.setup import logger
 from src.settings import Settings
 
+from .cache import ModelCache
+
 MLFLOW_REGISTER_NAME = "MedicalRegressor"
 
 
 class MLflowService:
-    def __init__(self):
+    def __init__(self, cache: ModelCache | None = None):
         self.mlflow = mlflow
         self.client = MlflowClient()
+        self.cache = cache
 
     def setup(self, create_experiment: bool = True) -> None:
         """
@@ -34,25 +44,85 @@ class MLflowService:
 
     def get_latest_model_version(self, model_name: str) -> int:
         """
-        Gets the latest version number of a registered MLflow model.
+        Gets the latest version number of a registered MLflow model, asking the
+        registry for the newest version only instead of listing all of them.
         """
-        all_versions = self.client.search_model_versions(f"name='{model_name}'")
-        if not all_versions:
+        latest = self.client.search_model_versions(
+            f"name='{model_name}'", max_results=1, order_by=["version_number DESC"]
+        )
+        if not latest:
             raise ValueError(f"No versions found for model {model_name}")
-        return max(int(v.version) for v in all_versions)
+        return int(latest[0].version)
 
     def load_model(self, model_name: str, version: int) -> BaseEstimator:
         """
-        Loads a specific version of a registered MLflow model.
+        Loads a specific version of a registered MLflow model, through the local
+        model cache if one is configured.
         """
-        return self.mlflow.sklearn.load_model(f"models:/{model_name}/{version}")
+        model_uri = f"models:/{model_name}/{version}"
+        if self.cache is None:
+            return self.mlflow.sklearn.load_model(model_uri)
+
+        model_dir = self.cache.get(model_name, version)
+        if model_dir is None:
+            logger.info(f"Downloading model {model_name} v{version} from MLflow")
+            model_dir = self.cache.put(
+                model_name,
+                version,
+                lambda dst: Path(
+                    self.mlflow.artifacts.download_artifacts(
+                        artifact_uri=model_uri, dst_path=str(dst)
+                    )
+                ),
+            )
+        return self.mlflow.sklearn.load_model(str(model_dir))
+
+    def log_batch(
+        self,
+        params: dict[str, Any] | None = None,
+        metrics: list[Metric] | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Logs params, metrics and tags of the active run with a single batched
+        request. The client splits it into chunks within the server limits.
+        """
+        self.client.log_batch(
+            self.mlflow.active_run().info.run_id,
+            metrics=metrics or [],
+            params=[Param(key, str(value)) for key, value in (params or {}).items()],
+            tags=[RunTag(key, str(value)) for key, value in (tags or {}).items()],
+        )
 
     def log_params(self, params: dict[str, Any]) -> None:
         """
         Logs model hyperparameters to MLflow.
         """
-        for param, value in params.items():
-            self.mlflow.log_param(param, value)
+        self.log_batch(params=params)
+
+    @staticmethod
+    def build_metrics(
+        metrics: dict[str, float],
+        folds_scores: list[float],
+        folds_scores_mean: float,
+    ) -> list[Metric]:
+        """
+        Builds evaluation metrics and cross-validation fold scores, one step
+        apart each, for batched logging.
+        """
+        values = {
+            **metrics,
+            **{
+                f"fold_{idx}_r2": score
+                for idx, score in enumerate(folds_scores, start=1)
+            },
+            "folds_r2_mean": folds_scores_mean,
+        }
+        timestamp = int(time.time() * 1000)
+        return [
+            Metric(name, float(value), timestamp, step)
+            for step, (name, value) in enumerate(values.items(), start=1)
+        ]
 
     def log_metrics(
         self,
@@ -63,30 +133,48 @@ class MLflowService:
         """
         Logs evaluation metrics and cross-validation fold scores to MLflow.
         """
-        step = 1
-        for name, value in metrics.items():
-            self.mlflow.log_metric(name, value, step)
-            step += 1
+        self.log_batch(
+            metrics=self.build_metrics(metrics, folds_scores, folds_scores_mean)
+        )
+
+    def build_signature(self, input_example: pd.DataFrame) -> ModelSignature:
+        """
+        Builds the model signature from the feature schema, which is fixed for a
+        stage, without calling the model. Predictions are a float64 vector.
+        """
+        return self.mlflow.models.infer_signature(
+            input_example, np.zeros(1, dtype=np.float64)
+        )
 
-        for idx, score in enumerate(folds_scores, start=1):
-            self.mlflow.log_metric(f"fold_{idx}_r2", score, step)
-            step += 1
-        self.mlflow.log_metric("folds_r2_mean", folds_scores_mean, step)
+    def infer_pip_requirements(self, estimator: BaseEstimator) -> list[str]:
+        """
+        Infers the pip requirements of a model by saving it to a temporary
+        directory. They only depend on the model class, so a stage infers them
+        once instead of on every logged run.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "model"
+            self.mlflow.sklearn.save_model(estimator, path)
+            return (path / "requirements.txt").read_text().splitlines()
 
     def log_artifacts(
-        self, estimator: BaseEstimator, model_name: str, X_train: pd.DataFrame
+        self,
+        estimator: BaseEstimator,
+        model_name: str,
+        input_example: pd.DataFrame,
+        signature: ModelSignature,
+        pip_requirements: list[str] | None = None,
     ) -> None:
         """
-        Logs the trained model to MLflow with input example and signature.
+        Logs the trained model to MLflow with a precomputed input example,
+        signature and pip requirements.
         """
-        example_input = X_train.iloc[:5]
-        example_output = estimator.predict(example_input)
-        signature = self.mlflow.models.infer_signature(example_input, example_output)
         self.mlflow.sklearn.log_model(
             estimator,
             name=model_name,
             signature=signature,
-            input_example=example_input,
+            input_example=input_example,
+            pip_requirements=pip_requirements,
         )
 
     def register_model(self, model_name: str) -> None:
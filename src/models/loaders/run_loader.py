@@ -1,31 +1,89 @@
 from pathlib import Path
+from typing import Any
 
 from src.conf.schema import TrainingDir
-from src.containers.results import RunResult
+from src.containers.results import EstimatorHandle, StageResult
+from src.data.constants import METRICS_FORMATS
 from src.data.core import DataLoader
 from src.io.file_ops import PathManager
+from src.logger.setup import logger
+from src.models.run_index import RunIndex
 from src.serializers.stage_result import StageResultSerializer
 
 
 class RunLoader:
-    def __init__(self, training_dir: TrainingDir, data_loader: DataLoader):
+    def __init__(
+        self,
+        training_dir: TrainingDir,
+        data_loader: DataLoader,
+        mmap_mode: str | None = None,
+    ):
         self.training_dir = training_dir
         self.data_loader = data_loader
+        self.mmap_mode = mmap_mode
+        self.index = RunIndex(training_dir.output_dir, training_dir.index_file)
 
-    def load(self, run_dir: Path) -> RunResult:
+    def _metrics_path(self, run_dir: Path) -> Path:
         """
-        Loads a single run from the given directory.
+        Returns the metrics file of a run. Runs saved with another metrics format
+        (e.g. `metrics.yaml` before switching to `metrics.json`) are still found.
         """
         metrics_path = run_dir / self.training_dir.metrics_file
-        pipeline_path = run_dir / self.training_dir.model_file
+        if PathManager.exists(metrics_path):
+            return metrics_path
+
+        for suffix in METRICS_FORMATS:
+            candidate = metrics_path.with_suffix(suffix)
+            if PathManager.exists(candidate):
+                return candidate
 
-        if not PathManager.exists(metrics_path):
-            raise FileNotFoundError(f"Path: {metrics_path} not found")
+        raise FileNotFoundError(f"Path: {metrics_path} not found")
+
+    def load_metrics(self, run_dir: Path) -> dict[str, Any]:
+        """
+        Loads only the metrics of a single run from the given directory.
+        """
+        return self.data_loader.load_metrics(self._metrics_path(run_dir))
+
+    def load(self, run_dir: Path) -> StageResult:
+        """
+        Loads a single run from the given directory. The pipeline is deserialized
+        lazily, on first access to the result's estimator.
+        """
+        pipeline_path = run_dir / self.training_dir.model_file
+        metrics = self.load_metrics(run_dir)
 
         if not PathManager.exists(pipeline_path):
             raise FileNotFoundError(f"Path: {pipeline_path} not found")
 
-        metrics = self.data_loader.load_metrics(metrics_path)
-        pipeline = self.data_loader.load_model(pipeline_path)
+        handle = EstimatorHandle(
+            path=pipeline_path,
+            loader=self.data_loader.load_model,
+            mmap_mode=self.mmap_mode,
+        )
+        return StageResultSerializer.from_loader(metrics, handle)
+
+    def sync_index(self) -> None:
+        """
+        Brings the run index in line with the run directories on disk: indexes
+        runs saved before the index existed (reading only their metrics) and
+        drops entries of removed runs.
+        """
+        run_ids = {
+            run_dir.name
+            for run_dir in self.training_dir.output_dir.iterdir()
+            if PathManager.exists(run_dir / self.training_dir.model_file)
+        }
+        indexed = self.index.run_ids()
+
+        missing = run_ids - indexed
+        if missing:
+            logger.info(f"Indexing {len(missing)} training runs")
+            self.index.add_many(
+                (run_id, self.load_metrics(self.training_dir.output_dir / run_id))
+                for run_id in sorted(missing)
+            )
 
-        return StageResultSerializer.from_loader(metrics, pipeline)
+        removed = indexed - run_ids
+        if removed:
+            self.index.remove(removed)
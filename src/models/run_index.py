@@ -0,0 +1,123 @@
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.containers.results import IndexedRun
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    model_name TEXT NOT NULL,
+    transformation TEXT,
+    folds_scores_mean REAL,
+    test_r2 REAL,
+    metrics TEXT NOT NULL,
+    indexed_at TEXT NOT NULL
+)
+"""
+
+RANK = "ORDER BY test_r2 IS NULL, test_r2 DESC, run_id"
+
+
+class RunIndex:
+    """
+    SQLite catalog of training runs holding their metrics, so runs can be ranked
+    without unpickling every saved pipeline.
+    """
+
+    def __init__(self, output_dir: Path, index_file: str):
+        self.output_dir = output_dir
+        self.index_path = output_dir / index_file
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        conn.execute(SCHEMA)
+        return conn
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def _to_run(self, row: tuple) -> IndexedRun:
+        run_id, model_name, test_r2 = row
+        return IndexedRun(
+            run_id=run_id,
+            model_name=model_name,
+            test_r2=test_r2,
+            run_dir=self.output_dir / run_id,
+        )
+
+    def add(self, run_id: str, metrics: dict[str, Any]) -> None:
+        """
+        Adds the entry of a run using its serialized metrics. Raises
+        sqlite3.IntegrityError if the run is already indexed.
+        """
+        self.add_many([(run_id, metrics)])
+
+    def add_many(self, runs: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Adds the entries of several runs in a single transaction.
+        """
+        indexed_at = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (
+                run_id,
+                metrics["model_name"],
+                metrics.get("transformation"),
+                metrics.get("folds_scores_mean"),
+                metrics.get("metrics", {}).get("test_r2"),
+                json.dumps(metrics.get("metrics", {})),
+                indexed_at,
+            )
+            for run_id, metrics in runs
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def remove(self, run_ids: set[str]) -> None:
+        """
+        Removes the entries of the given runs.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM runs WHERE run_id = ?", [(r,) for r in run_ids]
+            )
+
+    def run_ids(self) -> set[str]:
+        """
+        Returns the ids of all indexed runs.
+        """
+        return {row[0] for row in self._query("SELECT run_id FROM runs")}
+
+    def best(self) -> IndexedRun | None:
+        """
+        Returns the run with the highest test R2.
+        """
+        rows = self._query(
+            f"SELECT run_id, model_name, test_r2 FROM runs {RANK} LIMIT 1"
+        )
+        return self._to_run(rows[0]) if rows else None
+
+    def top(self, n: int) -> list[IndexedRun]:
+        """
+        Returns the best run of each model for the top `n` models ranked by
+        test R2.
+        """
+        rows = self._query(
+            f"""
+            SELECT run_id, model_name, test_r2 FROM (
+                SELECT run_id, model_name, test_r2, ROW_NUMBER() OVER (
+                    PARTITION BY model_name {RANK}
+                ) AS model_rank
+                FROM runs
+            )
+            WHERE model_rank = 1 {RANK} LIMIT ?
+            """,
+            (n,),
+        )
+        return [self._to_run(row) for row in rows]
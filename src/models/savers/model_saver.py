@@ -2,15 +2,22 @@ from pathlib import Path
 
 from src.conf.schema import FeaturesConfig
 from src.containers.results import StageResult
+from src.containers.types import CompressionType
 from src.data.core import DataSaver
 from src.io.file_ops import PathManager
 from src.serializers.model_metadata import ModelMetadataSerializer
 
 
 class ModelSaver:
-    def __init__(self, models_dir: Path, data_saver: DataSaver):
+    def __init__(
+        self,
+        models_dir: Path,
+        data_saver: DataSaver,
+        compress: CompressionType = None,
+    ):
         self.models_dir = models_dir
         self.data_saver = data_saver
+        self.compress = compress
 
     def save_model_with_metadata(
         self, result: StageResult, features: FeaturesConfig
@@ -28,5 +35,5 @@ class ModelSaver:
         model_path = self.models_dir / f"{file_name}.pkl"
         metadata_path = metadata_dir / f"{file_name}.yml"
 
-        self.data_saver.save_model(result.estimator, model_path)
+        self.data_saver.save_model(result.estimator, model_path, self.compress)
         self.data_saver.save_metrics(metadata_dict, metadata_path)
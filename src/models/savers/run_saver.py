@@ -4,6 +4,7 @@ from src.conf.schema import TrainingDir
 from src.containers.results import StageResult
 from src.data.core import DataSaver
 from src.io.file_ops import PathManager
+from src.models.run_index import RunIndex
 from src.serializers.stage_result import StageResultSerializer
 
 
@@ -15,24 +16,30 @@ class RunSaver:
     ):
         self.training_dir = training_dir
         self.data_saver = data_saver
+        self.index = RunIndex(training_dir.output_dir, training_dir.index_file)
 
     def save(self, run_result: StageResult) -> None:
         """
         Saves estimator and metrics to a timestamped directory under
-        the training output path.
+        the training output path and registers the run in the run index.
+        Timestamps have microsecond resolution, since background logging saves
+        several runs per second; an existing run is never overwritten.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
         results_path = self.training_dir.output_dir / timestamp
-        PathManager.ensure_dir(results_path)
+        PathManager.ensure_dir(results_path, exist_ok=False)
 
         metrics_path = results_path / self.training_dir.metrics_file
         model_path = results_path / self.training_dir.model_file
+        metrics = StageResultSerializer.to_metrics(run_result)
 
         self.data_saver.save_metrics(
-            metrics=StageResultSerializer.to_metrics(run_result),
+            metrics=metrics,
             metrics_path=metrics_path,
         )
         self.data_saver.save_model(
             model=run_result.estimator,
             model_path=model_path,
+            compress=self.training_dir.compress,
         )
+        self.index.add(timestamp, metrics)
@@ -4,7 +4,7 @@ from omegaconf import DictConfig, OmegaConf
 from sklearn.base import BaseEstimator
 
 from src.conf.schema import OptunaStageConfig, TrainingDir
-from src.containers.results import LoadedModelResults, StageResult
+from src.containers.results import StageResult
 from src.data.core import DataLoader
 from src.dto.config import DynamicConfig
 from src.factories.io_factory import IOFactory
@@ -12,7 +12,6 @@ from src.factories.model_factory import ModelFactory
 from src.factories.optuna_config_factory import OptunaConfigFactory
 from src.io.file_ops import PathManager
 from src.models.loaders.run_loader import RunLoader
-from src.models.selection import BestRunSelector
 from src.patterns.base_pipeline import BasePipeline
 
 
@@ -22,11 +21,22 @@ class OptunaBasePipeline(BasePipeline[RunLoader, OptunaStageConfig]):
 
     def select_best_run(self, run_loader: RunLoader) -> StageResult:
         """
-        Selects the best model run from all loaded results.
+        Selects the best model run from the run index and loads only its pipeline.
         """
-        runs = self.load_all_model_results(run_loader)
-        brs = BestRunSelector(runs)
-        return brs.select()
+        run_loader.sync_index()
+        best_run = run_loader.index.best()
+        if best_run is None:
+            raise FileNotFoundError(
+                f"No training runs found in {run_loader.training_dir.output_dir}"
+            )
+        return run_loader.load(best_run.run_dir)
+
+    def select_top_runs(self, run_loader: RunLoader, n: int) -> list[StageResult]:
+        """
+        Selects the best run of each of the top `n` models from the run index.
+        """
+        run_loader.sync_index()
+        return [run_loader.load(run.run_dir) for run in run_loader.index.top(n)]
 
     def load_optuna_config(
         self, model_class: type[BaseEstimator], dynamic_cfg: DynamicConfig
@@ -36,17 +46,6 @@ class OptunaBasePipeline(BasePipeline[RunLoader, OptunaStageConfig]):
         """
         return OptunaConfigFactory.create(self.cfg, dynamic_cfg, model_class)
 
-    def load_all_model_results(self, run_loader: RunLoader) -> LoadedModelResults:
-        """
-        Loads all model results from the training output directory.
-        """
-        runs = {}
-        for run_dir in Path(self.cfg.training.output_dir).iterdir():
-            if run_dir.is_dir():
-                runs[run_dir.name] = run_loader.load(run_dir)
-
-        return LoadedModelResults(runs=runs)
-
     def build(self) -> RunLoader:
         """
         Prepares readers and constructs a RunLoader for the pipeline.
@@ -58,16 +57,15 @@ class OptunaBasePipeline(BasePipeline[RunLoader, OptunaStageConfig]):
                 output_dir=Path(self.cfg.training.output_dir),
                 model_file=self.cfg.training.model_file,
                 metrics_file=self.cfg.training.metrics_file,
+                index_file=self.cfg.training.get("index_file", "index.sqlite"),
             ),
             data_loader=DataLoader(readers),
         )
 
-    def run(self) -> OptunaStageConfig:
+    def create_stage_config(self, best_run: StageResult) -> OptunaStageConfig:
         """
-        Builds loaders, selects best run, and creates full stage config.
+        Creates the full stage config for the model of the given run.
         """
-        run_loader = self.build()
-        best_run = self.select_best_run(run_loader)
         model_spec = ModelFactory.get_spec(best_run.model_name)
 
         dc = DynamicConfig(
@@ -80,3 +78,20 @@ class OptunaBasePipeline(BasePipeline[RunLoader, OptunaStageConfig]):
             ),
         )
         return self.load_optuna_config(model_spec.model_class, dynamic_cfg=dc)
+
+    def run(self) -> OptunaStageConfig:
+        """
+        Builds loaders, selects best run, and creates full stage config.
+        """
+        run_loader = self.build()
+        best_run = self.select_best_run(run_loader)
+        return self.create_stage_config(best_run)
+
+    def run_top(self, n: int) -> list[OptunaStageConfig]:
+        """
+        Builds loaders, selects the top `n` models, and creates a stage config
+        for each of them.
+        """
+        run_loader = self.build()
+        top_runs = self.select_top_runs(run_loader, n)
+        return [self.create_stage_config(run) for run in top_runs]
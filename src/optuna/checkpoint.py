@@ -0,0 +1,132 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from sklearn.base import BaseEstimator
+
+import optuna
+from optuna.distributions import BaseDistribution
+from optuna.trial import FrozenTrial, TrialState
+from src.data.core import DataLoader, DataSaver
+from src.io.file_ops import PathManager
+from src.logger.setup import logger
+from src.serializers.sanitizer import sanitize_params
+
+
+def in_space(params: dict[str, Any], space: dict[str, BaseDistribution]) -> bool:
+    """
+    Returns True if the params set every parameter of the search space to one of
+    its values, and nothing else.
+    """
+    if params.keys() != space.keys():
+        return False
+    for name, value in params.items():
+        distribution = space[name]
+        try:
+            if not distribution._contains(distribution.to_internal_repr(value)):
+                return False
+        except (ValueError, TypeError):
+            return False
+    return True
+
+
+class StudyCheckpoint:
+    """
+    Optuna callback persisting the best trial of a study whenever it improves.
+
+    The best params (and optionally the pipeline refitted with them) are written
+    atomically to `<models_dir>/checkpoints`, so an interrupted stage leaves a
+    usable best-so-far model and can warm-start from it on the next run.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        models_dir: Path,
+        data_saver: DataSaver,
+        data_loader: DataLoader,
+        save_pipeline: bool = False,
+    ):
+        self.model_name = model_name
+        self.checkpoint_dir = models_dir / "checkpoints"
+        self.data_saver = data_saver
+        self.data_loader = data_loader
+        self.save_pipeline = save_pipeline
+        self.refit: Callable[[dict[str, Any]], BaseEstimator] | None = None
+
+    @property
+    def params_path(self) -> Path:
+        return self.checkpoint_dir / f"{self.model_name.lower()}.yml"
+
+    @property
+    def pipeline_path(self) -> Path:
+        return self.checkpoint_dir / f"{self.model_name.lower()}.pkl"
+
+    def __call__(self, study: optuna.Study, trial: FrozenTrial) -> None:
+        """
+        Saves a checkpoint if the finished trial is the new best trial.
+        """
+        if trial.state != TrialState.COMPLETE:
+            return
+        if study.best_trial.number != trial.number:
+            return
+        self.save(trial)
+
+    def save(self, trial: FrozenTrial) -> None:
+        """
+        Atomically writes the trial's params and, if enabled, the refitted pipeline.
+        """
+        PathManager.ensure_dir(self.checkpoint_dir)
+
+        if self.save_pipeline and self.refit is not None:
+            estimator = self.refit(trial.params)
+            with PathManager.atomic_write(self.pipeline_path) as tmp_path:
+                self.data_saver.save_model(estimator, tmp_path)
+
+        checkpoint = {
+            "model_name": self.model_name,
+            "trial_number": trial.number,
+            "best_value": float(trial.value),
+            "best_params": sanitize_params(trial.params),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with PathManager.atomic_write(self.params_path) as tmp_path:
+            self.data_saver.save_metrics(checkpoint, tmp_path)
+
+        logger.debug(
+            f"Checkpoint saved for {self.model_name}: trial {trial.number}, "
+            f"value {trial.value:.4f}"
+        )
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Loads the last checkpoint of this model, if any.
+        """
+        if not PathManager.exists(self.params_path):
+            return None
+        return self.data_loader.load_metrics(self.params_path)
+
+    def resume(
+        self, study: optuna.Study, spaces: list[dict[str, BaseDistribution]]
+    ) -> None:
+        """
+        Enqueues the checkpointed best params as the first trial of the study, so
+        an interrupted optimization continues from its best-so-far result.
+        Checkpoints whose params are not a point of any of the given search
+        spaces, e.g. saved before the search space changed, are ignored.
+        """
+        checkpoint = self.load()
+        if not checkpoint or checkpoint.get("model_name") != self.model_name:
+            return
+        if not any(in_space(checkpoint["best_params"], space) for space in spaces):
+            logger.warning(
+                f"Ignoring checkpoint of {self.model_name}: its params are not in "
+                "the current search space"
+            )
+            return
+
+        study.enqueue_trial(checkpoint["best_params"], skip_if_exists=True)
+        logger.info(
+            f"Resuming {self.model_name} from checkpoint "
+            f"(value {checkpoint['best_value']:.4f})"
+        )
@@ -3,12 +3,17 @@ from typing import Any
 from sklearn.base import BaseEstimator
 
 import optuna
+from optuna.distributions import BaseDistribution, CategoricalDistribution
+from src.builders.optuna.optuna_experiment_builder import \
+    OptunaExperimentBuilder
 from src.builders.pipeline.pipeline_builder import PipelineBuilder
-from src.containers.experiment import ExperimentContext
+from src.containers.experiment import ExperimentContext, SchedulerArm
 from src.containers.results import RunResult
 from src.optuna.runners import DirectOptunaRunner, WrapperOptunaRunner
+from src.serializers.experiment import ExperimentSerializer
 from src.tuning.runners import CrossValidationRunner, OptunaSearchRunner
 
+from .checkpoint import StudyCheckpoint
 from .tuning import OptunaOptimize
 
 
@@ -19,16 +24,32 @@ class OptunaExperimentManager:
         optimizer: OptunaOptimize,
         cross_runner: CrossValidationRunner,
         search_runner: OptunaSearchRunner,
+        checkpoint: StudyCheckpoint | None = None,
     ):
         self.context = context
         self.optimizer = optimizer
         self.cross_runner = cross_runner
         self.search_runner = search_runner
+        self.checkpoint = checkpoint
 
     @property
     def has_transformation(self) -> bool:
         return self.context.model_cfg.target_transformations
 
+    def _build_estimator(
+        self, params: dict[str, Any]
+    ) -> tuple[BaseEstimator, dict[str, Any]]:
+        """
+        Builds a pipeline estimator configured with the given trial parameters.
+        """
+        estimator = PipelineBuilder.build(
+            model_cfg=self.context.model_cfg,
+            features_cfg=self.context.features_cfg,
+            transformation=params.get("transformation", "none"),
+        )
+        model_params = {k: v for k, v in params.items() if k != "transformation"}
+        return estimator.set_params(**model_params), model_params
+
     def _build_estimator_from_study(
         self, study: optuna.Study
     ) -> tuple[BaseEstimator, dict[str, Any]]:
@@ -36,35 +57,89 @@ class OptunaExperimentManager:
         Builds a pipeline estimator configured with the best parameters from an
         Optuna study.
         """
-        estimator = PipelineBuilder.build(
-            model_cfg=self.context.model_cfg,
-            features_cfg=self.context.features_cfg,
-            transformation=study.best_params["transformation"],
+        return self._build_estimator(study.best_params)
+
+    def fit_best(self, params: dict[str, Any]) -> BaseEstimator:
+        """
+        Fits a pipeline with the given trial parameters on the full training set.
+        """
+        estimator, _ = self._build_estimator(params)
+        return estimator.fit(self.context.X_train, self.context.y_train)
+
+    def _search_spaces(self, wrapper: bool) -> list[dict[str, BaseDistribution]]:
+        """
+        Returns the search spaces a trial can sample: one per target
+        transformation with the wrapper objective, the param distributions of
+        OptunaSearchCV otherwise.
+        """
+        exp_config = ExperimentSerializer.to_experiment_config(self.context)
+        if not wrapper:
+            return [OptunaExperimentBuilder.build(exp_config).params]
+        spaces = OptunaExperimentBuilder.compile(exp_config).spaces
+        return [
+            {"transformation": CategoricalDistribution([name]), **space}
+            for name, space in spaces.items()
+        ]
+
+    def _attach_checkpoint(self, wrapper: bool) -> None:
+        """
+        Resumes the study from the last checkpoint and registers the checkpoint
+        callback on both the wrapper and the direct optimization paths.
+        """
+        if self.checkpoint is None or self.checkpoint in self.optimizer.callbacks:
+            return
+
+        self.checkpoint.refit = self.fit_best
+        self.checkpoint.resume(self.optimizer.study, self._search_spaces(wrapper))
+        self.optimizer.callbacks.append(self.checkpoint)
+        if self.search_runner is not None:
+            self.search_runner.callbacks.append(self.checkpoint)
+
+    def refit(self, study: optuna.Study) -> RunResult:
+        """
+        Refits the best estimator of a finished study on the full training set.
+        """
+        estimator, best_params = self._build_estimator_from_study(study)
+        runner_res = self.cross_runner.run(
+            estimator=estimator,
+            X_train=self.context.X_train,
+            X_test=self.context.X_test,
+            y_train=self.context.y_train,
+        )
+        return RunResult(
+            runner_result=runner_res,
+            param_grid=best_params,
+            transformation=study.best_params.get("transformation", "none"),
+        )
+
+    def build_arm(self, name: str) -> SchedulerArm:
+        """
+        Exposes the study of this experiment as an arm of the budget scheduler,
+        optimized in slices with the wrapper objective.
+        """
+        runner = WrapperOptunaRunner(
+            optimizer=self.optimizer,
+            runner=self.cross_runner,
+        )
+        self._attach_checkpoint(wrapper=True)
+        objective = runner.build_objective(self.context)
+        return SchedulerArm(
+            name=name,
+            study=self.optimizer.study,
+            optimize=lambda n_trials, timeout: self.optimizer.optimize(
+                objective, n_trials=n_trials, timeout=timeout
+            ),
         )
-        best_params = {
-            k: v for k, v in study.best_params.items() if k != "transformation"
-        }
-        return estimator.set_params(**best_params), best_params
 
     def manage(self) -> RunResult:
+        self._attach_checkpoint(wrapper=self.has_transformation)
         if self.has_transformation:
             runner = WrapperOptunaRunner(
                 optimizer=self.optimizer,
                 runner=self.cross_runner,
             )
             study = runner.run(self.context)
-            estimator, best_params = self._build_estimator_from_study(study)
-            runner_res = self.cross_runner.run(
-                estimator=estimator,
-                X_train=self.context.X_train,
-                X_test=self.context.X_test,
-                y_train=self.context.y_train,
-            )
-            return RunResult(
-                runner_result=runner_res,
-                param_grid=best_params,
-                transformation=study.best_params["transformation"],
-            )
+            return self.refit(study)
 
         else:
             runner = DirectOptunaRunner(runner=self.search_runner)
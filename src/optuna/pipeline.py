@@ -3,7 +3,8 @@ import time
 from src.builders.optuna.optuna_pipeline_builder import OptunaPipelineBuilder
 from src.conf.schema import FeaturesConfig, OptunaStageConfig
 from src.containers.builder import OptunaBuildResult
-from src.containers.results import StageResult
+from src.containers.data import SplitData
+from src.containers.results import RunResult, StageResult
 from src.evaluation.metrics import flatten_metrics
 from src.logger.setup import logger
 from src.mlflow.logger import MLflowLogger
@@ -36,6 +37,42 @@ class OptunaPipeline(BasePipeline[OptunaBuildResult, None]):
         """
         model_saver.save_model_with_metadata(result, features)
 
+    def _finalize(
+        self,
+        builder: OptunaBuildResult,
+        split_data: SplitData,
+        run_result: RunResult,
+        mlflow_logger: MLflowLogger,
+        data_hash: str | None = None,
+    ) -> None:
+        """
+        Computes metrics for the optimized model, logs and registers it in MLflow
+        and saves it with metadata to disk.
+        """
+        model_name = builder.model_spec.model_class.__name__
+        pred_set = PredictionSetSerializer.from_stage_pipeline(
+            run_result.runner_result, split_data
+        )
+        metrics = self._compute_metrics(pred_set)
+
+        stage_result = StageResultSerializer.from_stage(
+            result=run_result,
+            metrics=flatten_metrics(metrics),
+            model_name=model_name,
+            data_hash=data_hash,
+        )
+        logger.info("Logging model to MLflow")
+        self._log_model(
+            mlflow_logger, stage_result, X_train=split_data.X_train, register=True
+        )
+
+        logger.info("Saving model with metadata to disk")
+        self._save_model(
+            model_saver=builder.model_saver,
+            result=stage_result,
+            features=self.cfg.features,
+        )
+
     def run(self) -> None:
         """
         Optimizes hyperparameters for the best-performing model using Optuna,
@@ -58,6 +95,7 @@ class OptunaPipeline(BasePipeline[OptunaBuildResult, None]):
 
         logger.info("Loading pre-split dataset")
         split_data = self.load_data(builder.data_loader)
+        data_hash = self.load_data_hash(builder.data_loader)
 
         context = ExperimentSerializer.from_optuna_stage(
             cfg=self.cfg,
@@ -70,29 +108,10 @@ class OptunaPipeline(BasePipeline[OptunaBuildResult, None]):
             optimizer=builder.optimizer,
             cross_runner=builder.cross_runner,
             search_runner=builder.search_runner,
+            checkpoint=builder.checkpoint,
         ).manage()
 
-        pred_set = PredictionSetSerializer.from_stage_pipeline(
-            run_result.runner_result, split_data
-        )
-        metrics = self._compute_metrics(pred_set)
-
-        stage_result = StageResultSerializer.from_stage(
-            result=run_result,
-            metrics=flatten_metrics(metrics),
-            model_name=model_name,
-        )
-        logger.info("Logging model to MLflow")
-        self._log_model(
-            mlflow_logger, stage_result, X_train=split_data.X_train, register=True
-        )
-
-        logger.info("Saving model with metadata to disk")
-        self._save_model(
-            model_saver=builder.model_saver,
-            result=stage_result,
-            features=self.cfg.features,
-        )
+        self._finalize(builder, split_data, run_result, mlflow_logger, data_hash)
         end_optuna = time.perf_counter()
         logger.info(
             f"Optuna stage completed for model {model_name} in {end_optuna - start_optuna:.2f}s"
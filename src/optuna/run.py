@@ -2,11 +2,16 @@ from omegaconf import DictConfig
 
 from .base import OptunaBasePipeline
 from .pipeline import OptunaPipeline
+from .scheduled_pipeline import ScheduledOptunaPipeline
 
 
 def run(cfg: DictConfig):
     base = OptunaBasePipeline(dynamic_cfg=cfg)
-    static_config = base.run()
+    top_n = cfg.optuna.study.get("top_n", 1)
 
-    pipeline = OptunaPipeline(cfg=static_config)
+    if top_n > 1:
+        pipeline = ScheduledOptunaPipeline(cfgs=base.run_top(top_n))
+    else:
+        static_config = base.run()
+        pipeline = OptunaPipeline(cfg=static_config)
     pipeline.run()
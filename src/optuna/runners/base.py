@@ -4,7 +4,8 @@ from typing import Generic
 import optuna
 from src.builders.optuna.optuna_experiment_builder import \
     OptunaExperimentBuilder
-from src.containers.experiment import ExperimentContext, ExperimentSetup
+from src.containers.experiment import (CompiledExperiment, ExperimentContext,
+                                      ExperimentSetup)
 from src.containers.types import OptunaRunnerResult
 from src.dto.config import OptunaExperimentConfig
 
@@ -22,5 +23,22 @@ class BaseExperimentRunner(ABC, Generic[OptunaRunnerResult]):
             trial=trial,
         )
 
+    def compile(self, exp_config: OptunaExperimentConfig) -> CompiledExperiment:
+        """
+        Precompiles the search spaces shared by all trials of a study.
+        """
+        return OptunaExperimentBuilder().compile(cfg=exp_config)
+
+    def build_trial(
+        self, compiled: CompiledExperiment, trial: optuna.Trial
+    ) -> ExperimentSetup:
+        """
+        Builds an ExperimentSetup for a single trial from a compiled experiment.
+        """
+        return OptunaExperimentBuilder().build_from_compiled(
+            compiled=compiled,
+            trial=trial,
+        )
+
     @abstractmethod
     def run(self, context: ExperimentContext) -> OptunaRunnerResult: ...
@@ -1,7 +1,9 @@
+from typing import Callable
+
 import numpy as np
 
 import optuna
-from src.containers.experiment import ExperimentContext
+from src.containers.experiment import CompiledExperiment, ExperimentContext
 from src.optuna.tuning import OptunaOptimize
 from src.serializers.experiment import ExperimentSerializer
 from src.tuning.runners import CrossValidationRunner
@@ -14,29 +16,40 @@ class WrapperOptunaRunner(BaseExperimentRunner[optuna.Study]):
         self.optimizer = optimizer
         self.runner = runner
 
-    def objective(self, trial: optuna.Trial, context: ExperimentContext) -> np.float64:
+    def objective(
+        self,
+        trial: optuna.Trial,
+        context: ExperimentContext,
+        compiled: CompiledExperiment,
+    ) -> np.float64:
         """
         Objective function to evaluate a single trial.
 
-        Builds the experiment setup, runs cross-validation using the wrapper runner,
-        and returns the mean score across folds.
+        Samples parameters from the precompiled search space, builds the pipeline,
+        and returns the mean cross-validation score across folds. The best trial
+        is refitted once by the manager, so trials skip the refit and predictions.
         """
-        exp_setup = self.build(
-            exp_config=ExperimentSerializer.to_experiment_config(context),
-            trial=trial,
-        )
+        exp_setup = self.build_trial(compiled, trial)
         exp_setup.pipeline.set_params(**exp_setup.params)
 
-        result = self.runner.run(
+        return self.runner.score(
             estimator=exp_setup.pipeline,
             X_train=context.X_train,
-            X_test=context.X_test,
             y_train=context.y_train,
         )
-        return result.folds_scores_mean
+
+    def build_objective(
+        self, context: ExperimentContext
+    ) -> Callable[[optuna.Trial], np.float64]:
+        """
+        Compiles the experiment once per study and returns the objective function
+        bound to it.
+        """
+        compiled = self.compile(ExperimentSerializer.to_experiment_config(context))
+        return lambda trial: self.objective(trial, context, compiled)
 
     def run(self, context: ExperimentContext) -> optuna.Study:
         """
         Runs the Optuna optimization using the objective function.
         """
-        return self.optimizer.optimize(lambda trial: self.objective(trial, context))
+        return self.optimizer.optimize(self.build_objective(context))
@@ -0,0 +1,93 @@
+import time
+
+from src.builders.optuna.optuna_pipeline_builder import OptunaPipelineBuilder
+from src.conf.schema import OptunaStageConfig
+from src.containers.builder import OptunaBuildResult
+from src.logger.setup import logger
+from src.mlflow.logger import MLflowLogger
+from src.mlflow.service import MLflowService
+from src.serializers.experiment import ExperimentSerializer
+
+from .manager import OptunaExperimentManager
+from .pipeline import OptunaPipeline
+from .scheduler import OptunaBudgetScheduler
+
+
+class ScheduledOptunaPipeline(OptunaPipeline):
+    def __init__(self, cfgs: list[OptunaStageConfig]):
+        self.cfgs = [cfg for cfg in cfgs if cfg.model.params]
+        self.skipped = [cfg.model.name for cfg in cfgs if not cfg.model.params]
+        self.cfg = self.cfgs[0] if self.cfgs else None
+
+    def build(self) -> dict[str, OptunaBuildResult]:
+        """
+        Constructs the components of the optuna pipeline for every candidate model,
+        each with its own study.
+        """
+        builds = {}
+        for cfg in self.cfgs:
+            builder = OptunaPipelineBuilder(cfg).build()
+            builds[builder.model_spec.model_class.__name__] = builder
+        return builds
+
+    def run(self) -> None:
+        """
+        Optimizes hyperparameters of the top training models concurrently within
+        a shared compute budget, then retrains the overall best one and logs the
+        final version to MLflow.
+        """
+        logger.info("Running scheduled optuna stage")
+        if self.skipped:
+            logger.warning(
+                f"Not scheduling models without params to optimize: "
+                f"{', '.join(self.skipped)}"
+            )
+        if not self.cfgs:
+            logger.info("No params to optimize, skipping optimization")
+            return
+
+        start_optuna = time.perf_counter()
+        logger.info("Starting MLflow Service")
+        mlflow_logger = MLflowLogger(service=MLflowService())
+
+        logger.info("Initializing optuna pipeline environment")
+        builds = self.build()
+        logger.info(f"Stage initialized for models: {', '.join(builds)}")
+
+        logger.info("Loading pre-split dataset")
+        data_loader = next(iter(builds.values())).data_loader
+        split_data = self.load_data(data_loader)
+        data_hash = self.load_data_hash(data_loader)
+
+        managers = {
+            name: OptunaExperimentManager(
+                context=ExperimentSerializer.from_optuna_stage(
+                    cfg=cfg, split_data=split_data
+                ),
+                optimizer=builder.optimizer,
+                cross_runner=builder.cross_runner,
+                search_runner=builder.search_runner,
+                checkpoint=builder.checkpoint,
+            )
+            for cfg, (name, builder) in zip(self.cfgs, builds.items())
+        }
+
+        logger.info("Running scheduled optimization")
+        scheduler = OptunaBudgetScheduler(self.cfg.optuna_config)
+        allocations = scheduler.run(
+            [manager.build_arm(name) for name, manager in managers.items()]
+        )
+
+        model_name = scheduler.best(allocations)
+        logger.info(f"Best model after scheduling: {model_name}")
+        self.cfg = self.cfgs[list(builds).index(model_name)]
+        manager = managers[model_name]
+        run_result = manager.refit(manager.optimizer.study)
+
+        self._finalize(
+            builds[model_name], split_data, run_result, mlflow_logger, data_hash
+        )
+        end_optuna = time.perf_counter()
+        logger.info(
+            f"Optuna stage completed for model {model_name} in {end_optuna - start_optuna:.2f}s"
+        )
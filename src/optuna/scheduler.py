@@ -0,0 +1,224 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import optuna
+from optuna.trial import TrialState
+from src.conf.schema import OptunaConfig
+from src.containers.experiment import SchedulerArm
+from src.containers.results import ArmAllocation
+from src.logger.setup import logger
+
+KEEP_RATIO = 0.5
+EXPLORATION_SHARE = 0.1
+MIN_TRIALS_TO_STOP = 3
+
+
+class OptunaBudgetScheduler:
+    """
+    Splits a total compute budget across several Optuna studies.
+
+    The budget is spent in rounds. Each round's share is split between the active
+    studies proportionally to their observed improvement rate (gain of the best
+    value per unit of budget), with a small exploration share so no study starves.
+    Studies of a round run concurrently; between rounds the studies with the
+    weakest optimistic outlook are stopped. A study is only considered for
+    stopping once it ran `min_trials` trials and its rate is known: the first
+    completed value is the baseline the gain is measured from, so a single
+    value says nothing about how fast a study improves.
+
+    The budget unit is seconds when `budget` is configured, trials otherwise.
+    """
+
+    def __init__(
+        self,
+        optuna_cfg: OptunaConfig,
+        keep_ratio: float = KEEP_RATIO,
+        exploration: float = EXPLORATION_SHARE,
+        min_trials: int = MIN_TRIALS_TO_STOP,
+    ):
+        self.cfg = optuna_cfg
+        self.keep_ratio = keep_ratio
+        self.exploration = exploration
+        self.min_trials = min_trials
+
+    @property
+    def by_time(self) -> bool:
+        return self.cfg.budget is not None
+
+    def _total_budget(self, arms: list[SchedulerArm]) -> float:
+        """
+        Returns the total budget in seconds, or in trials if no time budget is set.
+        """
+        if self.by_time:
+            return float(self.cfg.budget)
+        return float(self.cfg.trials * len(arms))
+
+    @staticmethod
+    def _completed_values(study: optuna.Study) -> list[float]:
+        """
+        Returns the values of all completed trials of a study.
+        """
+        return [
+            trial.value
+            for trial in study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+        ]
+
+    def _allocate(
+        self,
+        active: list[SchedulerArm],
+        allocations: dict[str, ArmAllocation],
+        round_budget: float,
+    ) -> dict[str, float]:
+        """
+        Splits the round budget between active arms by their improvement rate.
+        Arms whose rate is still unknown are credited with the best known rate.
+        """
+        rates = {arm.name: allocations[arm.name].rate for arm in active}
+        optimistic = max((r for r in rates.values() if r is not None), default=0.0)
+        rates = {
+            name: max(optimistic if rate is None else rate, 0.0)
+            for name, rate in rates.items()
+        }
+        total_rate = sum(rates.values())
+        if total_rate == 0:
+            return {name: round_budget / len(rates) for name in rates}
+
+        explore = self.exploration * round_budget / len(rates)
+        exploit = round_budget - explore * len(rates)
+        return {
+            name: explore + exploit * rate / total_rate for name, rate in rates.items()
+        }
+
+    def _run_arm(
+        self, arm: SchedulerArm, allocation: ArmAllocation, share: float
+    ) -> float:
+        """
+        Optimizes a single arm for its share of the round and updates its
+        allocation. Returns the budget actually spent.
+        """
+        trials_before = len(arm.study.trials)
+        start = time.perf_counter()
+
+        if self.by_time:
+            arm.optimize(None, share)
+        else:
+            arm.optimize(max(1, round(share)), None)
+
+        elapsed = time.perf_counter() - start
+        trials_run = len(arm.study.trials) - trials_before
+        values = self._completed_values(arm.study)
+
+        best_before = allocation.best_value
+        if not math.isfinite(best_before) and values:
+            best_before = values[0]
+
+        allocation.seconds += elapsed
+        allocation.trials += trials_run
+        allocation.best_value = max(values, default=float("-inf"))
+        allocation.history.append(allocation.best_value)
+
+        spent = elapsed if self.by_time else float(trials_run)
+        if len(values) < 2:
+            allocation.rate = None
+        elif spent:
+            allocation.rate = (allocation.best_value - best_before) / spent
+        return spent
+
+    def _stop_losers(
+        self,
+        active: list[SchedulerArm],
+        allocations: dict[str, ArmAllocation],
+        remaining: float,
+        round_idx: int,
+    ) -> list[SchedulerArm]:
+        """
+        Keeps the arms with the best optimistic outlook: their best value plus
+        the improvement expected from an equal share of the remaining budget.
+        Arms with too few trials or an unknown rate are always kept and do not
+        count towards the keep ratio.
+        """
+        if len(active) <= 1:
+            return active
+
+        share = remaining / len(active)
+        eligible = [
+            arm
+            for arm in active
+            if allocations[arm.name].trials >= self.min_trials
+            and allocations[arm.name].rate is not None
+        ]
+        ranked = sorted(
+            eligible,
+            key=lambda arm: allocations[arm.name].best_value
+            + allocations[arm.name].rate * share,
+            reverse=True,
+        )
+        keep = max(1, math.ceil(len(ranked) * self.keep_ratio))
+        stopped = ranked[keep:]
+        for arm in stopped:
+            allocations[arm.name].stopped_round = round_idx + 1
+            logger.info(f"Stopping study for {arm.name} after round {round_idx + 1}")
+        return [arm for arm in active if arm not in stopped]
+
+    @staticmethod
+    def _log_allocation(allocations: dict[str, ArmAllocation]) -> None:
+        """
+        Logs the final budget allocation per arm, best first.
+        """
+        logger.info("Final Optuna budget allocation:")
+        for allocation in sorted(
+            allocations.values(), key=lambda a: a.best_value, reverse=True
+        ):
+            status = (
+                f"stopped after round {allocation.stopped_round}"
+                if allocation.stopped_round
+                else "ran to the end"
+            )
+            logger.info(
+                f"{allocation.name}: {allocation.seconds:.2f}s, "
+                f"{allocation.trials} trials, best={allocation.best_value:.4f}, "
+                f"{status}"
+            )
+
+    @staticmethod
+    def best(allocations: dict[str, ArmAllocation]) -> str:
+        """
+        Returns the name of the arm with the highest best value.
+        """
+        return max(allocations.values(), key=lambda a: a.best_value).name
+
+    def run(self, arms: list[SchedulerArm]) -> dict[str, ArmAllocation]:
+        """
+        Runs all arms within the total budget and returns the final allocation.
+        """
+        allocations = {arm.name: ArmAllocation(name=arm.name) for arm in arms}
+        remaining = self._total_budget(arms)
+        rounds = max(1, self.cfg.rounds)
+        active = list(arms)
+
+        for round_idx in range(rounds):
+            if not active or remaining <= 0:
+                break
+
+            round_budget = remaining / (rounds - round_idx)
+            shares = self._allocate(active, allocations, round_budget)
+            logger.info(
+                f"Optuna round [{round_idx + 1}/{rounds}]: "
+                + ", ".join(f"{name}={share:.2f}" for name, share in shares.items())
+            )
+
+            with ThreadPoolExecutor(max_workers=len(active)) as executor:
+                spent = executor.map(
+                    lambda arm: self._run_arm(
+                        arm, allocations[arm.name], shares[arm.name]
+                    ),
+                    active,
+                )
+                remaining -= sum(spent)
+
+            if round_idx < rounds - 1:
+                active = self._stop_losers(active, allocations, remaining, round_idx)
+
+        self._log_allocation(allocations)
+        return allocations
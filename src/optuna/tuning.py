@@ -4,6 +4,7 @@ import numpy as np
 
 import optuna
 from optuna.pruners import BasePruner
+from optuna.trial import FrozenTrial
 from src.conf.schema import OptunaConfig
 
 
@@ -15,19 +16,30 @@ class OptunaOptimize:
         study_name: str = "MedicalRegressor",
     ):
         self.optuna_cfg = optuna_cfg
+        self.callbacks: list[Callable[[optuna.Study, FrozenTrial], None]] = []
         self.study = optuna.create_study(
             study_name=study_name, pruner=pruner, direction="maximize"
         )
 
     def optimize(
-        self, objective_fn: Callable[[optuna.Trial], np.float64]
+        self,
+        objective_fn: Callable[[optuna.Trial], np.float64],
+        n_trials: int | None = None,
+        timeout: float | None = None,
     ) -> optuna.Study:
         """
         Runs the Optuna study using the provided objective function.
+
+        Trial count and timeout default to the configured values and can be
+        overridden to run the study in slices; a slice given only a timeout runs
+        until the timeout, whatever the configured trial count.
         """
+        if n_trials is None and timeout is None:
+            n_trials, timeout = self.optuna_cfg.trials, self.optuna_cfg.timeout
         self.study.optimize(
             func=objective_fn,
-            n_trials=self.optuna_cfg.trials,
-            timeout=self.optuna_cfg.timeout,
+            n_trials=n_trials,
+            timeout=timeout,
+            callbacks=self.callbacks,
         )
         return self.study
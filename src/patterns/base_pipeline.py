@@ -3,12 +3,16 @@ from typing import Generic
 
 import pandas as pd
 
-from src.containers.data import SplitData
+from src.containers.data import SplitData, StreamingSplitData
 from src.containers.results import PredictionSet, StageResult
 from src.containers.types import BuildResultType, RunResultType
 from src.data.core import DataLoader
+from src.data.shared import SharedSplitStore
 from src.dto.metrics import AllMetrics
 from src.evaluation.metrics import get_metrics
+from src.io.writers import ArrowWriter
+from src.logger.setup import logger
+from src.mlflow.background import BackgroundMLflowLogger
 from src.mlflow.logger import MLflowLogger
 
 
@@ -21,12 +25,51 @@ class BasePipeline(ABC, Generic[BuildResultType, RunResultType]):
 
     def load_data(self, data_loader: DataLoader) -> SplitData:
         """
-        Loads preprocessed training and test data using the provided readers.
+        Loads preprocessed training and test data using the provided readers,
+        restricted to the configured feature columns. With a shared directory
+        configured, the splits are memory-mapped from shared Arrow files.
         """
+        data_dir = self.cfg.data_dir
+        features = self.cfg.features
+        columns = features.numeric + features.binary + features.categorical
+
+        if data_dir.shared_dir is not None:
+            store = SharedSplitStore(
+                data_dir.shared_dir, data_loader.readers, ArrowWriter()
+            )
+            return store.load(data_dir.processed_dir, columns=columns)
+
         return data_loader.load_splitted_data(
-            processed_dir=self.cfg.data_dir.processed_dir
+            processed_dir=data_dir.processed_dir,
+            columns=columns,
+            memory_map=data_dir.memory_map,
         )
 
+    def load_streaming_data(
+        self, data_loader: DataLoader, batch_size: int
+    ) -> StreamingSplitData:
+        """
+        Loads the targets and opens the feature splits as Parquet batch streams,
+        restricted to the configured feature columns.
+        """
+        features = self.cfg.features
+        return data_loader.load_streaming_data(
+            processed_dir=self.cfg.data_dir.processed_dir,
+            columns=features.numeric + features.binary + features.categorical,
+            batch_size=batch_size,
+        )
+
+    def load_data_hash(self, data_loader: DataLoader) -> str | None:
+        """
+        Returns the hash of the processed data from the data manifest, so results
+        can be traced back to the data they were trained on.
+        """
+        manifest = data_loader.load_manifest(self.cfg.data_dir.processed_dir)
+        if manifest is None:
+            logger.warning("No data manifest found, results will not carry a data hash")
+            return None
+        return manifest.data_hash
+
     @staticmethod
     def _compute_metrics(pred_set: PredictionSet) -> AllMetrics:
         """
@@ -41,7 +84,7 @@ class BasePipeline(ABC, Generic[BuildResultType, RunResultType]):
 
     @staticmethod
     def _log_model(
-        logger: MLflowLogger,
+        logger: MLflowLogger | BackgroundMLflowLogger,
         stage_result: StageResult,
         X_train: pd.DataFrame,
         register: bool = False,
@@ -0,0 +1,26 @@
+from dataclasses import asdict
+from typing import Any
+
+from src.containers.data import DataManifest, FileDigest
+
+
+class DataManifestSerializer:
+    @staticmethod
+    def to_dict(manifest: DataManifest) -> dict[str, Any]:
+        return asdict(manifest)
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> DataManifest:
+        return DataManifest(
+            data_hash=data["data_hash"],
+            inputs_hash=data["inputs_hash"],
+            params=data["params"],
+            raw=FileDigest(**data["raw"]),
+            splits={
+                name: FileDigest(**digest) for name, digest in data["splits"].items()
+            },
+            batches={
+                name: FileDigest(**digest)
+                for name, digest in data.get("batches", {}).items()
+            },
+        )
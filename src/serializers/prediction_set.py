@@ -1,11 +1,11 @@
-from src.containers.data import SplitData
+from src.containers.data import SplitData, StreamingSplitData
 from src.containers.results import PredictionSet, RunnerResult
 
 
 class PredictionSetSerializer:
     @staticmethod
     def from_stage_pipeline(
-        result: RunnerResult, split_data: SplitData
+        result: RunnerResult, split_data: SplitData | StreamingSplitData
     ) -> PredictionSet:
         return PredictionSet(
             y_train=split_data.y_train,
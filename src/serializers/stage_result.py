@@ -2,7 +2,8 @@ from typing import Any
 
 from sklearn.base import BaseEstimator
 
-from src.containers.results import RunResult, StageResult
+from src.containers.results import (EstimatorHandle, LazyStageResult,
+                                    RunResult, StageResult)
 
 from .sanitizer import sanitize_params
 
@@ -18,11 +19,17 @@ class StageResultSerializer:
             "folds_scores_mean": float(stage_result.folds_scores_mean),
             "metrics": stage_result.metrics,
             "transformation": stage_result.transformation,
+            "data_hash": stage_result.data_hash,
         }
 
     @staticmethod
-    def from_loader(metrics: dict[str, Any], pipeline: BaseEstimator) -> StageResult:
-        return StageResult(
+    def from_loader(
+        metrics: dict[str, Any], pipeline: BaseEstimator | EstimatorHandle
+    ) -> StageResult:
+        result_cls = (
+            LazyStageResult if isinstance(pipeline, EstimatorHandle) else StageResult
+        )
+        return result_cls(
             model_name=metrics["model_name"],
             params=metrics["params"],
             param_grid=metrics["param_grid"],
@@ -30,12 +37,16 @@ class StageResultSerializer:
             folds_scores_mean=metrics["folds_scores_mean"],
             metrics=metrics["metrics"],
             transformation=metrics["transformation"],
+            data_hash=metrics.get("data_hash"),
             estimator=pipeline,
         )
 
     @staticmethod
     def from_stage(
-        result: RunResult, metrics: dict[str, Any], model_name: str
+        result: RunResult,
+        metrics: dict[str, Any],
+        model_name: str,
+        data_hash: str | None = None,
     ) -> StageResult:
         return StageResult(
             model_name=model_name,
@@ -46,4 +57,5 @@ class StageResultSerializer:
             folds_scores_mean=result.runner_result.folds_scores_mean,
             transformation=result.transformation,
             metrics=metrics,
+            data_hash=data_hash,
         )
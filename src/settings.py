@@ -1,6 +1,7 @@
 import logging
 import os
 from datetime import datetime
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -12,6 +13,8 @@ class Settings:
     GITHUB_SHA: str | None = os.getenv("GITHUB_SHA")
     LOCAL_MLFLOW_URI: str = "http://localhost:5000"
     MLFLOW_TRACKING_URI: str | None = os.getenv("MLFLOW_TRACKING_URI")
+    MODEL_CACHE_DIR: str | None = os.getenv("MODEL_CACHE_DIR")
+    MODEL_CACHE_SIZE: int = int(os.getenv("MODEL_CACHE_SIZE", "5"))
 
     @classmethod
     def commit_hash(cls) -> str:
@@ -38,6 +41,15 @@ class Settings:
         """
         return cls.MLFLOW_TRACKING_URI or cls.LOCAL_MLFLOW_URI
 
+    @classmethod
+    def model_cache_dir(cls) -> Path:
+        """
+        Returns the directory of the local cache of registered models.
+        """
+        if cls.MODEL_CACHE_DIR:
+            return Path(cls.MODEL_CACHE_DIR)
+        return Path.home() / ".cache" / "ml-medical-cost" / "models"
+
     @classmethod
     def logging_level(cls) -> int:
         """
@@ -1,4 +1,5 @@
 import time
+from contextlib import nullcontext
 
 from src.builders.training.training_pipeline_builder import \
     TrainingPipelineBuilder
@@ -7,6 +8,7 @@ from src.containers.builder import TrainingBuildResult
 from src.containers.results import StageResult
 from src.evaluation.metrics import flatten_metrics
 from src.logger.setup import logger
+from src.mlflow.background import BackgroundMLflowLogger
 from src.mlflow.logger import MLflowLogger
 from src.mlflow.service import MLflowService
 from src.models.savers.run_saver import RunSaver
@@ -35,6 +37,24 @@ class TrainingPipeline(BasePipeline[TrainingBuildResult, None]):
         """
         run_saver.save(stage_result)
 
+    def _start_mlflow_logger(
+        self,
+    ) -> BackgroundMLflowLogger | nullcontext[MLflowLogger]:
+        """
+        Starts the MLflow logger, logging from a background thread unless
+        disabled in the config. Used as a context manager that waits for all
+        runs to be logged on exit.
+        """
+        mlflow_logger = MLflowLogger(service=MLflowService())
+        mlflow_cfg = self.cfg.mlflow
+        if mlflow_cfg is None or not mlflow_cfg.background:
+            return nullcontext(mlflow_logger)
+        return BackgroundMLflowLogger(
+            mlflow_logger,
+            queue_size=mlflow_cfg.queue_size,
+            retries=mlflow_cfg.retries,
+        )
+
     def run(self) -> None:
         """
         Trains and evaluates all defined models using cross-validation, logs results
@@ -43,61 +63,69 @@ class TrainingPipeline(BasePipeline[TrainingBuildResult, None]):
         logger.info("Running training stage")
         start_training = time.perf_counter()
 
-        logger.info("Starting MLflow Service")
-        mlflow_logger = MLflowLogger(service=MLflowService())
-
         logger.info("Initializing training pipeline environment")
         builder = self.build()
 
-        logger.info("Loading pre-split dataset")
-        split_data = self.load_data(builder.loader)
+        streaming = self.cfg.streaming
+        if streaming is not None and streaming.enabled:
+            logger.info("Opening pre-split dataset for out-of-core training")
+            split_data = self.load_streaming_data(builder.loader, streaming.batch_size)
+            X_sample = split_data.X_train.head()
+        else:
+            logger.info("Loading pre-split dataset")
+            split_data = self.load_data(builder.loader)
+            X_sample = split_data.X_train
+        data_hash = self.load_data_hash(builder.loader)
         model_name = builder.model_spec.model_class.__name__
         logger.info(f"Stage initialized for model: {model_name}")
 
-        for idx, train_result in enumerate(
-            builder.training.run(
-                X_train=split_data.X_train,
-                X_test=split_data.X_test,
-                y_train=split_data.y_train,
-            ),
-            start=1,
-        ):
-            start_iteration = time.perf_counter()
-            logger.info(f"Running training iteration [{idx}] for model {model_name}")
+        logger.info("Starting MLflow Service")
+        with self._start_mlflow_logger() as mlflow_logger:
+            for idx, train_result in enumerate(
+                builder.training.run(
+                    X_train=split_data.X_train,
+                    X_test=split_data.X_test,
+                    y_train=split_data.y_train,
+                ),
+                start=1,
+            ):
+                start_iteration = time.perf_counter()
+                logger.info(f"Running training iteration [{idx}] for model {model_name}")
 
-            pred_set = PredictionSetSerializer.from_stage_pipeline(
-                result=train_result.runner_result, split_data=split_data
-            )
-            metrics = self._compute_metrics(pred_set)
+                pred_set = PredictionSetSerializer.from_stage_pipeline(
+                    result=train_result.runner_result, split_data=split_data
+                )
+                metrics = self._compute_metrics(pred_set)
 
-            diagnostics = ModelDiagnostics(
-                folds_scores=train_result.runner_result.folds_scores
-            )
-            diagnostics.report(
-                model_name=model_name,
-                train_r2=metrics.train.r2,
-                test_r2=metrics.test.r2,
-            )
-            stage_result = StageResultSerializer.from_stage(
-                result=train_result,
-                metrics=flatten_metrics(metrics),
-                model_name=model_name,
-            )
-            logger.info("Logging model to MLflow")
-            self._log_model(
-                mlflow_logger,
-                stage_result,
-                X_train=split_data.X_train,
-            )
-            logger.info("Saving training results to disk")
-            self._save_run(
-                run_saver=builder.run_saver,
-                stage_result=stage_result,
-            )
-            end_iteration = time.perf_counter()
-            logger.info(
-                f"Iteration [{idx}] completed in {end_iteration - start_iteration:.2f}s"
-            )
+                diagnostics = ModelDiagnostics(
+                    folds_scores=train_result.runner_result.folds_scores
+                )
+                diagnostics.report(
+                    model_name=model_name,
+                    train_r2=metrics.train.r2,
+                    test_r2=metrics.test.r2,
+                )
+                stage_result = StageResultSerializer.from_stage(
+                    result=train_result,
+                    metrics=flatten_metrics(metrics),
+                    model_name=model_name,
+                    data_hash=data_hash,
+                )
+                logger.info("Logging model to MLflow")
+                self._log_model(
+                    mlflow_logger,
+                    stage_result,
+                    X_train=X_sample,
+                )
+                logger.info("Saving training results to disk")
+                self._save_run(
+                    run_saver=builder.run_saver,
+                    stage_result=stage_result,
+                )
+                end_iteration = time.perf_counter()
+                logger.info(
+                    f"Iteration [{idx}] completed in {end_iteration - start_iteration:.2f}s"
+                )
         end_training = time.perf_counter()
         logger.info(
             f"Training stage completed for model {model_name} in {end_training - start_training:.2f}s"
@@ -6,7 +6,8 @@ from sklearn.pipeline import Pipeline
 
 from src.conf.schema import ModelConfig
 from src.containers.results import EvaluationResult, RunnerResult, RunResult
-from src.tuning.runners import CrossValidationRunner, GridSearchRunner
+from src.tuning.runners import (CrossValidationRunner, GridSearchRunner,
+                                StreamingLinearRunner)
 from src.tuning.transformers import TargetTransformer
 
 
@@ -18,7 +19,7 @@ class TrainModel:
         param_grid: dict[str, list],
         pipeline: Pipeline,
         grid_runner: GridSearchRunner,
-        cross_runner: CrossValidationRunner,
+        cross_runner: CrossValidationRunner | StreamingLinearRunner,
         target_transformer: TargetTransformer,
     ):
         self.model_class = model
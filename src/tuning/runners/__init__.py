@@ -1,9 +1,11 @@
 from .cross_validation_runner import CrossValidationRunner
 from .grid_search_runner import GridSearchRunner
 from .optuna_search_runner import OptunaSearchRunner
+from .streaming_runner import StreamingLinearRunner
 
 __all__ = [
     "GridSearchRunner",
     "CrossValidationRunner",
     "OptunaSearchRunner",
+    "StreamingLinearRunner",
 ]
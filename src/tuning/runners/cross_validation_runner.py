@@ -4,6 +4,7 @@ from sklearn.base import BaseEstimator
 from sklearn.model_selection import KFold, cross_val_score
 
 from src.containers.results import RunnerResult
+from src.evaluation.metrics import compute_scores_mean
 
 from .base_runner import BaseRunner
 
@@ -43,3 +44,16 @@ class CrossValidationRunner(BaseRunner):
         trained = self.fit_estimator(estimator, X_train, y_train)
 
         return self._collect_results(trained, folds_scores, X_train, X_test)
+
+    def score(
+        self,
+        estimator: BaseEstimator,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+    ) -> np.float64:
+        """
+        Performs cross-validation only and returns the mean score across folds,
+        without refitting the estimator or generating predictions.
+        """
+        folds_scores = self._perform_cross_validation(estimator, X_train, y_train)
+        return compute_scores_mean(folds_scores)
@@ -1,10 +1,11 @@
-from typing import Any
+from typing import Any, Callable
 
 from sklearn.base import BaseEstimator
 from sklearn.model_selection import KFold
 
 import optuna
 from optuna.integration import OptunaSearchCV
+from optuna.trial import FrozenTrial
 from src.conf.schema import OptunaConfig
 
 from .search_runner import SearchRunner
@@ -22,6 +23,7 @@ class OptunaSearchRunner(SearchRunner[OptunaSearchCV]):
         self.study = study
         self.cv = cv
         self.scoring = scoring
+        self.callbacks: list[Callable[[optuna.Study, FrozenTrial], None]] = []
 
     def perform_search(
         self, estimator: BaseEstimator, param_grid: dict[str, Any]
@@ -37,5 +39,6 @@ class OptunaSearchRunner(SearchRunner[OptunaSearchCV]):
             n_trials=self.cfg.trials,
             timeout=self.cfg.timeout,
             study=self.study,
+            callbacks=self.callbacks or None,
             return_train_score=True,
         )
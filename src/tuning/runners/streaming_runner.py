@@ -0,0 +1,245 @@
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, clone
+from sklearn.compose import ColumnTransformer, TransformedTargetRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.conf.schema import FeaturesConfig
+from src.containers.data import ParquetBatches
+from src.containers.results import RunnerResult
+from src.evaluation.metrics import compute_scores_mean
+
+from .base_runner import BaseRunner
+
+
+class StreamingLinearRunner(BaseRunner):
+    """
+    Out-of-core counterpart of CrossValidationRunner for linear regression.
+
+    Feature batches are streamed from Parquet in three passes: to collect the
+    preprocessing statistics, to accumulate the normal equations (X^T X, X^T y)
+    of every fold, and to score the folds and predict. Only the target column
+    is held in memory. Rows are assigned to folds at random, and preprocessing
+    and target transformers are fitted on the whole training set.
+    """
+
+    def __init__(
+        self,
+        features: FeaturesConfig,
+        n_splits: int = 5,
+        random_state: int | None = None,
+    ):
+        self.features = features
+        self.n_splits = n_splits
+        self.random_state = random_state
+
+    def _moment_sample(self, X_train: ParquetBatches) -> pd.DataFrame:
+        """
+        Builds a small frame with the mean and variance of every numeric feature
+        and all categories of the training set, so fitting the preprocessor on it
+        gives the same state as fitting it on the full data.
+        """
+        numeric, categorical = self.features.numeric, self.features.categorical
+        scaler = StandardScaler()
+        categories: dict[str, set] = {col: set() for col in categorical}
+
+        for batch in X_train:
+            if numeric:
+                scaler.partial_fit(batch[numeric].to_numpy(dtype=np.float64))
+            for col in categorical:
+                categories[col].update(batch[col].dropna().unique().tolist())
+
+        pairs = max([len(values) for values in categories.values()] + [1])
+        sample = X_train.head(1)
+        sample = sample.iloc[np.zeros(2 * pairs, dtype=int)].reset_index(drop=True)
+        if numeric:
+            for col, mean, std in zip(numeric, scaler.mean_, np.sqrt(scaler.var_)):
+                sample[col] = np.repeat([mean - std, mean + std], pairs)
+        for col, values in categories.items():
+            values = np.resize(np.array(sorted(values)), 2 * pairs)
+            if not isinstance(sample[col].dtype, pd.CategoricalDtype):
+                values = values.astype(sample[col].dtype)
+            sample[col] = values
+        return sample
+
+    @staticmethod
+    def _design(
+        preprocessor: ColumnTransformer, model: LinearRegression, X: pd.DataFrame
+    ) -> np.ndarray:
+        """
+        Preprocesses a batch into a dense float64 design matrix, with a column of
+        ones for the intercept.
+        """
+        design = preprocessor.transform(X)
+        if sparse.issparse(design):
+            design = design.toarray()
+        design = np.asarray(design, dtype=np.float64)
+        if model.fit_intercept:
+            design = np.hstack([design, np.ones((len(design), 1))])
+        return design
+
+    @staticmethod
+    def _inverse(target: BaseEstimator | None, predictions: np.ndarray) -> np.ndarray:
+        """
+        Maps predictions from the transformed target space back to the target.
+        """
+        if target is None:
+            return predictions
+        return np.asarray(target.inverse_transform(predictions.reshape(-1, 1))).ravel()
+
+    def _fit_shell(
+        self, estimator: BaseEstimator, X_train: ParquetBatches, y: np.ndarray
+    ) -> tuple[BaseEstimator, BaseEstimator | None]:
+        """
+        Fits a copy of the estimator on the moment sample, which leaves the
+        preprocessor in its final state, and fits the target transformer on the
+        full target. Returns the estimator and the fitted target transformer.
+        """
+        sample = self._moment_sample(X_train)
+        trained = clone(estimator).fit(sample, np.resize(y, len(sample)))
+        if not isinstance(trained, TransformedTargetRegressor):
+            return trained, None
+
+        trained.transformer_ = clone(trained.transformer).fit(y.reshape(-1, 1))
+        return trained, trained.transformer_
+
+    def _designs(
+        self,
+        preprocessor: ColumnTransformer,
+        model: LinearRegression,
+        X: ParquetBatches,
+    ) -> Iterator[tuple[slice, np.ndarray]]:
+        """
+        Streams design matrices together with the rows they cover.
+        """
+        offset = 0
+        for batch in X:
+            design = self._design(preprocessor, model, batch)
+            yield slice(offset, offset + len(design)), design
+            offset += len(design)
+
+    def _normal_equations(
+        self,
+        designs: Iterator[tuple[slice, np.ndarray]],
+        y: np.ndarray,
+        folds: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Accumulates X^T X and X^T y separately for every fold.
+        """
+        gram, moment = None, None
+        for rows, design in designs:
+            if gram is None:
+                n_columns = design.shape[1]
+                gram = np.zeros((self.n_splits, n_columns, n_columns))
+                moment = np.zeros((self.n_splits, n_columns))
+            for fold in range(self.n_splits):
+                mask = folds[rows] == fold
+                gram[fold] += design[mask].T @ design[mask]
+                moment[fold] += design[mask].T @ y[rows][mask]
+        return gram, moment
+
+    @staticmethod
+    def _solve(
+        gram: np.ndarray, moment: np.ndarray, exclude: int | None = None
+    ) -> np.ndarray:
+        """
+        Solves the normal equations summed over all folds but `exclude`. The
+        least-squares solver also handles collinear one-hot columns.
+        """
+        keep = [fold for fold in range(len(gram)) if fold != exclude]
+        return np.linalg.lstsq(
+            gram[keep].sum(axis=0), moment[keep].sum(axis=0), rcond=None
+        )[0]
+
+    def run(
+        self,
+        estimator: BaseEstimator,
+        X_train: ParquetBatches,
+        X_test: ParquetBatches,
+        y_train: pd.Series,
+    ) -> RunnerResult:
+        """
+        Fits a linear regression pipeline out of core, computing cross-validation
+        scores from the per-fold normal equations, and generates predictions for
+        train and test sets.
+        """
+        y = y_train.to_numpy(dtype=np.float64)
+        trained, target = self._fit_shell(estimator, X_train, y)
+        pipeline = (
+            trained.regressor_
+            if isinstance(trained, TransformedTargetRegressor)
+            else trained
+        )
+        preprocessor = pipeline.named_steps["preprocessor"]
+        model = pipeline.named_steps["model"]
+        if not isinstance(model, LinearRegression):
+            raise ValueError(
+                f"Out-of-core training supports LinearRegression only, "
+                f"got {type(model).__name__}"
+            )
+
+        y_fit = (
+            np.asarray(target.transform(y.reshape(-1, 1))).ravel()
+            if target is not None
+            else y
+        )
+        folds = np.random.default_rng(self.random_state).integers(
+            self.n_splits, size=len(y), dtype=np.int8
+        )
+        gram, moment = self._normal_equations(
+            self._designs(preprocessor, model, X_train), y_fit, folds
+        )
+
+        weights = self._solve(gram, moment)
+        fold_weights = np.stack(
+            [self._solve(gram, moment, exclude=fold) for fold in range(self.n_splits)]
+        )
+        if model.fit_intercept:
+            model.coef_, model.intercept_ = weights[:-1], weights[-1]
+        else:
+            model.coef_, model.intercept_ = weights, 0.0
+
+        # Per-fold R2 from sums of squares accumulated batch by batch, so the
+        # out-of-fold predictions are never materialized.
+        train_predictions = np.empty_like(y)
+        mean = y.mean()
+        residuals, totals, sums, counts = np.zeros((4, self.n_splits))
+        for rows, design in self._designs(preprocessor, model, X_train):
+            train_predictions[rows] = self._inverse(target, design @ weights)
+            fold_predictions = self._inverse(
+                target, np.einsum("ij,ij->i", design, fold_weights[folds[rows]])
+            )
+            centered = y[rows] - mean
+            for stats, values in (
+                (residuals, (y[rows] - fold_predictions) ** 2),
+                (totals, centered**2),
+                (sums, centered),
+                (counts, None),
+            ):
+                stats += np.bincount(
+                    folds[rows], weights=values, minlength=self.n_splits
+                )
+
+        folds_scores = [
+            np.float64(1 - residual / (total - total_sum**2 / count))
+            for residual, total, total_sum, count in zip(
+                residuals, totals, sums, counts
+            )
+        ]
+        test_predictions = np.concatenate(
+            [self.make_predictions(trained, batch) for batch in X_test]
+        )
+
+        return RunnerResult(
+            trained=trained,
+            folds_scores=folds_scores,
+            folds_scores_mean=compute_scores_mean(folds_scores),
+            train_predictions=train_predictions,
+            test_predictions=test_predictions,
+            params=self._get_params(estimator=trained),
+        )
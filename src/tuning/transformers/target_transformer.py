@@ -7,7 +7,7 @@ from src.builders.transformer.transformer_wrapper_builder import \
 from src.builders.transformer.wrapper_grid_builder import WrapperGridBuilder
 from src.conf.schema import TransformersConfig
 from src.containers.results import EvaluationResult
-from src.factories.transformer_factory import TargetTransformerFactory
+from src.factories import transformer_factory
 
 from .registry import TRANSFORMERS
 
@@ -28,7 +28,7 @@ class TargetTransformer:
                 yield EvaluationResult(estimator=pipeline, param_grid=param_grid)
 
             else:
-                transformer = TargetTransformerFactory.create(
+                transformer = transformer_factory.TargetTransformerFactory.create(
                     transformation=transformation
                 )
                 wrapper = TransformerWrapperBuilder.build(
@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# the Bento service imports its sibling modules as top-level modules, the way
+# `bentoml serve` runs it from its own directory
+BENTO_DIR = Path(__file__).resolve().parents[3] / "services" / "backend" / "bento"
+
+sys.path.insert(0, str(BENTO_DIR))
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PolynomialFeatures
+
+from services.backend.bento.compiled import compile_pipeline, validate
+from services.backend.bento.service import synthetic_rows
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture(scope="module")
+def train_data():
+    X = pd.DataFrame(synthetic_rows(300, seed=1))
+    y = 250 * X["age"] + 20000 * X["smoker"] + 300 * X["bmi"] + 1000
+    return X, y
+
+
+@pytest.mark.parametrize("model", ["linear", "tree", "rf", "knn"])
+@pytest.mark.parametrize("preprocess", [True, False])
+@pytest.mark.parametrize("transformation", ["none", "log", "power"])
+def test_compiled_pipeline_matches_the_pipeline(
+    train_data, model, preprocess, transformation
+):
+    X, y = train_data
+    pipeline = PipelineBuilder.build(
+        ModelConfig(model, preprocess, False, {}), FEATURES, transformation
+    ).fit(X, y)
+    rows = synthetic_rows(100, seed=2) + [
+        {**synthetic_rows(1)[0], "region": "unknown", "children": 9.0}
+    ]
+
+    compiled = compile_pipeline(pipeline)
+
+    error = validate(compiled, lambda r: pipeline.predict(pd.DataFrame(r)), rows)
+    assert error <= 1e-9
+    assert compiled.predict_array(compiled.encode(rows)) == pytest.approx(
+        pipeline.predict(pd.DataFrame(rows)), rel=1e-9
+    )
+
+
+def test_unsupported_transformer_is_rejected(train_data):
+    X, y = train_data
+    pipeline = Pipeline(
+        [
+            (
+                "preprocessor",
+                ColumnTransformer([("poly", PolynomialFeatures(), ["age"])]),
+            ),
+            ("model", LinearRegression()),
+        ]
+    ).fit(X, y)
+
+    with pytest.raises(ValueError, match="PolynomialFeatures"):
+        compile_pipeline(pipeline)
+
+
+def test_validation_rejects_a_mismatch(train_data):
+    X, y = train_data
+    pipeline = PipelineBuilder.build(
+        ModelConfig("linear", True, False, {}), FEATURES
+    ).fit(X, y)
+    rows = synthetic_rows(10)
+
+    with pytest.raises(ValueError, match="differs"):
+        validate(
+            compile_pipeline(pipeline),
+            lambda r: pipeline.predict(pd.DataFrame(r)) + np.float64(1.0),
+            rows,
+        )
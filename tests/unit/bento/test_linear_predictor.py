@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sklearn.preprocessing import FunctionTransformer
+
+from services.backend.bento.compiled import export_linear
+from services.backend.bento.linear_predictor import LinearPredictor
+from services.backend.bento.service import synthetic_rows
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.builders.transformer.transformer_wrapper_builder import \
+    TransformerWrapperBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+from src.tuning.transformers.identity import IdentityTransformer
+
+BENTO_DIR = Path(__file__).resolve().parents[3] / "services" / "backend" / "bento"
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture(scope="module")
+def train_data():
+    X = pd.DataFrame(synthetic_rows(300, seed=1))
+    y = 250 * X["age"] + 20000 * X["smoker"] + 300 * X["bmi"] + 1000
+    return X, y
+
+
+def fit(train_data, model="linear", preprocess=True, transformation="none"):
+    return PipelineBuilder.build(
+        ModelConfig(model, preprocess, False, {}), FEATURES, transformation
+    ).fit(*train_data)
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+@pytest.mark.parametrize("transformation", ["none", "log"])
+def test_exported_predictor_matches_the_pipeline(
+    train_data, tmp_path, preprocess, transformation
+):
+    pipeline = fit(train_data, preprocess=preprocess, transformation=transformation)
+    rows = synthetic_rows(100, seed=2) + [
+        {**synthetic_rows(1)[0], "region": "unknown", "children": 9.0}
+    ]
+
+    LinearPredictor(**export_linear(pipeline)).save(tmp_path / "predictor.json")
+    predictor = LinearPredictor.load(tmp_path / "predictor.json")
+
+    assert predictor.predict(rows) == pytest.approx(
+        pipeline.predict(pd.DataFrame(rows)), rel=1e-9
+    )
+
+
+@pytest.mark.parametrize("transformer", [IdentityTransformer(), FunctionTransformer()])
+def test_identity_target_wrapper_is_exported(train_data, transformer):
+    pipeline = TransformerWrapperBuilder.build(
+        fit(train_data), transformer=transformer
+    ).fit(*train_data)
+    rows = synthetic_rows(100, seed=2)
+
+    predictor = LinearPredictor(**export_linear(pipeline))
+
+    assert predictor.inverse == "identity"
+    assert predictor.predict(rows) == pytest.approx(
+        pipeline.predict(pd.DataFrame(rows)), rel=1e-9
+    )
+
+
+@pytest.mark.parametrize(
+    "model, transformation", [("rf", "none"), ("linear", "power")]
+)
+def test_non_linear_pipelines_are_not_exported(train_data, model, transformation):
+    pipeline = fit(train_data, model=model, transformation=transformation)
+
+    with pytest.raises(ValueError):
+        export_linear(pipeline)
+
+
+def test_unknown_format_is_rejected(train_data):
+    spec = LinearPredictor(**export_linear(fit(train_data))).to_dict()
+
+    with pytest.raises(ValueError, match="format"):
+        LinearPredictor.from_dict({**spec, "format": "linear-v0"})
+
+
+def test_predictor_does_not_import_sklearn(train_data, tmp_path):
+    path = tmp_path / "predictor.json"
+    LinearPredictor(**export_linear(fit(train_data))).save(path)
+    code = f"""
+import sys
+from linear_predictor import LinearPredictor
+LinearPredictor.load({str(path)!r}).predict({synthetic_rows(2)!r})
+print(any(name.startswith("sklearn") for name in sys.modules))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BENTO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
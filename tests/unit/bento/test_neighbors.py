@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.neighbors import KNeighborsRegressor
+
+from services.backend.bento import compiled as compiled_module
+from services.backend.bento import neighbors
+from services.backend.bento.compiled import (
+    NEIGHBORS_MAX_ROWS,
+    build_neighbors,
+    compile_pipeline,
+    validate,
+)
+from services.backend.bento.service import synthetic_rows
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = np.column_stack(
+        [rng.integers(18, 65, 500), rng.uniform(16, 50, 500), rng.integers(0, 6, 500)]
+    ).astype(float)
+    y = 250 * X[:, 0] + 400 * X[:, 1] + rng.normal(0, 500, 500)
+    return X, y
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_search_matches_sklearn(data, weights):
+    X, y = data
+    model = KNeighborsRegressor(n_neighbors=5, weights=weights, algorithm="brute")
+    model.fit(X, y)
+    # the first rows are training rows, matched at distance zero
+    rng = np.random.default_rng(1)
+    Q = np.vstack([X[:10], X[10:60] + rng.normal(0, 1, (50, 3))])
+    search = build_neighbors(model)
+
+    distances, idx = search.kneighbors(Q)
+    expected_distances, expected_idx = model.kneighbors(Q)
+
+    assert distances == pytest.approx(expected_distances, abs=1e-9)
+    assert search.predict(Q) == pytest.approx(model.predict(Q), rel=1e-9)
+    assert (idx[:, 0] == expected_idx[:, 0]).mean() > 0.9
+
+
+def test_near_ties_fall_back_to_exact_search(data, monkeypatch):
+    X, y = data
+    model = KNeighborsRegressor(n_neighbors=3, algorithm="brute").fit(X, y)
+    monkeypatch.setattr(neighbors, "CANDIDATE_MARGIN", 0)
+    monkeypatch.setattr(neighbors, "CHUNK_DISTANCES", 1000)
+    Q = X[:40] + 0.5
+
+    distances, _ = build_neighbors(model).kneighbors(Q)
+
+    assert distances == pytest.approx(model.kneighbors(Q)[0], abs=1e-9)
+
+
+def test_other_metrics_are_not_searched(data):
+    model = KNeighborsRegressor(p=1).fit(*data)
+    with pytest.raises(ValueError):
+        build_neighbors(model)
+
+
+@pytest.mark.parametrize("algorithm", ["kd_tree", "brute"])
+def test_knn_pipeline_compiles_to_the_search(algorithm):
+    X = pd.DataFrame(synthetic_rows(300, seed=1))
+    y = 250 * X["age"] + 20000 * X["smoker"] + 300 * X["bmi"] + 1000
+    pipeline = PipelineBuilder.build(ModelConfig("knn", True, False, {}), FEATURES, "log")
+    pipeline.set_params(regressor__model__algorithm=algorithm).fit(X, y)
+    rows = synthetic_rows(NEIGHBORS_MAX_ROWS, seed=2)
+
+    compiled = compile_pipeline(pipeline)
+
+    assert validate(compiled, lambda r: pipeline.predict(pd.DataFrame(r)), rows) <= 1e-9
+
+
+def test_large_training_sets_query_the_fitted_index(data, monkeypatch):
+    model = KNeighborsRegressor(algorithm="kd_tree").fit(*data)
+
+    assert compiled_module._compile_model(model) != model.predict
+    monkeypatch.setattr(compiled_module, "NEIGHBORS_MAX_FIT_ROWS", len(data[0]) - 1)
+    assert compiled_module._compile_model(model) == model.predict
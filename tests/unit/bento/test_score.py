@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.backend.bento import compiled
+from services.backend.bento.score import PREDICTION_COLUMN, score
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+from src.features.core import convert_features_type
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+def raw_frame(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.uniform(16, 50, n).round(2),
+            "children": rng.integers(0, 6, n),
+            "smoker": rng.choice(["yes", "no"], n),
+            "region": rng.choice(["northeast", "northwest", "southeast"], n),
+        }
+    )
+
+
+@pytest.mark.parametrize("model", ["rf", "knn"])
+def test_scores_every_batch(tmp_path, monkeypatch, model):
+    train = convert_features_type(raw_frame(200, seed=0))
+    pipeline = PipelineBuilder.build(
+        ModelConfig(model, False, False, {}), FEATURES, "log"
+    ).fit(train, 1000 + 250 * train["age"] + 20000 * train["smoker"])
+    raw = raw_frame(250, seed=1)
+    raw.to_parquet(tmp_path / "input.parquet", index=False)
+    # batches on both sides of the packed tree threshold
+    monkeypatch.setattr(compiled, "TREE_TRAVERSAL_MAX_ROWS", 50)
+
+    rows = score(pipeline, tmp_path / "input.parquet", tmp_path / "output.parquet", 60)
+
+    scored = pd.read_parquet(tmp_path / "output.parquet")
+    assert rows == len(scored) == 250
+    assert scored[PREDICTION_COLUMN].to_numpy() == pytest.approx(
+        pipeline.predict(convert_features_type(raw)), rel=1e-9
+    )
+    pd.testing.assert_frame_equal(scored.drop(columns=PREDICTION_COLUMN), raw)
+
+
+def test_scores_dictionary_encoded_columns(tmp_path):
+    train = convert_features_type(raw_frame(200, seed=0))
+    pipeline = PipelineBuilder.build(
+        ModelConfig("linear", True, False, {}), FEATURES, "none"
+    ).fit(train, 1000 + 250 * train["age"] + 20000 * train["smoker"])
+    plain = raw_frame(100, seed=1)
+    raw = plain.astype({"sex": "category", "smoker": "category", "region": "category"})
+    raw.to_parquet(tmp_path / "input.parquet", index=False)
+
+    rows = score(pipeline, tmp_path / "input.parquet", tmp_path / "output.parquet", 40)
+
+    scored = pd.read_parquet(tmp_path / "output.parquet")
+    assert rows == 100
+    assert isinstance(scored["region"].dtype, pd.CategoricalDtype)
+    assert scored[PREDICTION_COLUMN].to_numpy() == pytest.approx(
+        pipeline.predict(convert_features_type(plain)), rel=1e-9
+    )
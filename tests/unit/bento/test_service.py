@@ -1,60 +1,162 @@
 from unittest import mock
 
-import numpy as np
+import bentoml
+import pandas as pd
 import pytest
+from bentoml._internal.configuration.containers import BentoMLContainer
+from bentoml._internal.models import ModelStore
+from bentoml.exceptions import ServiceUnavailable
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
 
-from services.backend.bento.service import MedicalRegressorService
-
-
-@pytest.mark.parametrize(
-    "input_data, prediction",
-    [
-        (
-            {
-                "age": 30.0,
-                "sex": 0.0,
-                "bmi": 25.0,
-                "children": 0.0,
-                "smoker": 0.0,
-                "region": "northwest"
-            },
-            [1234.56],
-        ),
-        (
-            [
-                {
-                    "age": 40.0,
-                    "sex": 1.0,
-                    "bmi": 22.0,
-                    "children": 1.0,
-                    "smoker": 0.0,
-                    "region": "southwest"
-                },
-                {
-                    "age": 35.0,
-                    "sex": 0.0,
-                    "bmi": 28.0,
-                    "children": 2.0,
-                    "smoker": 1.0,
-                    "region": "northwest"
-                },
-            ],
-            [1000.0, 2000.0],
-        ),
-    ],
-)
-def test_medical_service_predict(input_data, prediction):
-    fake_model = mock.Mock()
-    fake_model.predict.return_value = np.array(prediction)
+from services.backend.bento.compiled import export_linear
+from services.backend.bento.linear_predictor import LinearPredictor
+from services.backend.bento.service import (BENTO_MODEL_NAME,
+                                            LINEAR_PREDICTOR_KEY,
+                                            WARM_UP_BATCH_SIZES,
+                                            MedicalRegressorService,
+                                            synthetic_rows, warm_up)
 
+ROW = {
+    "age": 40.0,
+    "sex": 1.0,
+    "bmi": 30.0,
+    "children": 1.0,
+    "smoker": 0.0,
+    "region": "southeast",
+}
+
+ROWS = [{**ROW, "age": 30.0, "region": "northwest"}, {**ROW, "age": 50.0}]
+
+
+def save_model(offset, metadata=None):
+    X = pd.DataFrame([ROW] * 8).assign(
+        age=[20.0, 30.0, 40.0, 50.0, 25.0, 35.0, 45.0, 55.0],
+        region=["northeast", "northwest", "southeast", "southwest"] * 2,
+    )
+    model = Pipeline(
+        [
+            (
+                "preprocessor",
+                ColumnTransformer(
+                    [("region", OneHotEncoder(), ["region"])], remainder="passthrough"
+                ),
+            ),
+            ("model", LinearRegression()),
+        ]
+    ).fit(X, 100 * X["age"] + offset)
+    if metadata is not None:
+        metadata = metadata(model)
+    return bentoml.sklearn.save_model(BENTO_MODEL_NAME, model, metadata=metadata)
+
+
+@pytest.fixture
+def model_store(tmp_path):
+    BentoMLContainer.model_store.set(ModelStore(tmp_path))
+    yield
+    BentoMLContainer.model_store.reset()
+
+
+@pytest.fixture
+def service(model_store, monkeypatch):
+    monkeypatch.setattr(
+        "services.backend.bento.service.MODEL_POLL_INTERVAL", 3600.0
+    )
+    first = save_model(offset=0.0)
+    service = MedicalRegressorService()
+    assert service.watcher.loaded.wait(timeout=10)
+    yield service, first
+    service.shutdown()
+
+
+def test_predictions_report_the_model_version(service):
+    service, first = service
+
+    single = service.predict(ROWS[0])
+    many = service.predict_multiple(ROWS)
+
+    assert single["charges"] == pytest.approx(3000.0)
+    assert many["charges"] == pytest.approx([3000.0, 5000.0])
+    assert single["model_version"] == many["model_version"] == first.tag.version
+    assert service.status()["predictor"] == "CompiledPipeline"
+
+
+def test_batchable_api_predicts_every_row(service):
+    service, _ = service
+
+    assert service.predict_batch(ROWS) == pytest.approx([3000.0, 5000.0])
+
+
+def test_exported_linear_predictor_is_used(service):
+    service, _ = service
+    save_model(
+        offset=1.0,
+        metadata=lambda model: {
+            LINEAR_PREDICTOR_KEY: LinearPredictor(**export_linear(model)).to_dict()
+        },
+    )
+
+    assert service.watcher.check()
+    assert service.status()["predictor"] == "LinearPredictor"
+    assert service.predict_batch(ROWS) == pytest.approx([3001.0, 5001.0])
+
+
+def test_new_model_version_is_swapped_in(service):
+    service, first = service
+    assert not service.watcher.check()
+
+    second = save_model(offset=1.0)
+    in_flight = service.watcher.active
+    assert service.watcher.check()
+
+    assert in_flight.model.predict(pd.DataFrame(ROWS[:1]))[0] == pytest.approx(3000.0)
+    assert service.predict(ROWS[0]) == {
+        "charges": pytest.approx(3001.0),
+        "model_version": second.tag.version,
+    }
+    status = service.status()
+    assert status["model_version"] == second.tag.version
+    assert status["last_checked"] is not None
+
+
+def test_failed_update_keeps_serving_the_active_model(service, monkeypatch):
+    service, first = service
+    save_model(offset=1.0)
+    monkeypatch.setattr(
+        service.watcher, "warm_up", mock.Mock(side_effect=ValueError("warm-up failed"))
+    )
+    service.watcher.poll()
+
+    assert service.predict(ROWS[0])["model_version"] == first.tag.version
+    assert service.status()["last_error"] == "warm-up failed"
+
+
+def test_service_is_not_ready_until_the_model_is_warm(model_store, monkeypatch):
+    monkeypatch.setattr(
+        "services.backend.bento.service.MODEL_POLL_INTERVAL", 3600.0
+    )
     service = MedicalRegressorService()
-    service.model = fake_model
+    service.watcher.stop()
+
+    assert not service.__is_ready__()
+    assert service.status()["ready"] is False
+    with pytest.raises(ServiceUnavailable):
+        service.predict(ROWS[0])
+
+    save_model(offset=0.0)
+    service.watcher.poll()
+    assert service.__is_ready__()
+    assert service.predict(ROWS[0])["charges"] == pytest.approx(3000.0)
+
 
-    if isinstance(input_data, list):
-        result = service.predict_multiple(input_data)
-        assert result == {"charges": prediction}
-    else:
-        result = service.predict(input_data)
-        assert result == {"charges": prediction[0]}
+def test_warm_up_runs_every_batch_size():
+    model = mock.Mock()
+    warm_up(model)
 
-    fake_model.predict.assert_called_once()
+    sizes = [len(call.args[0]) for call in model.predict.call_args_list]
+    assert sorted(set(sizes)) == sorted(WARM_UP_BATCH_SIZES)
+    rows = pd.DataFrame(synthetic_rows(8))
+    assert rows["region"].nunique() == 4
+    assert set(rows["sex"]) == set(rows["smoker"]) == {0.0, 1.0}
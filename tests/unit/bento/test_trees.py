@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from services.backend.bento import trees
+from services.backend.bento.compiled import pack_trees
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = np.column_stack(
+        [rng.integers(18, 65, 400), rng.uniform(16, 50, 400), rng.integers(0, 2, 400)]
+    ).astype(float)
+    y = 250 * X[:, 0] + 20000 * X[:, 2] * (X[:, 1] > 30) + rng.normal(0, 500, 400)
+    return X, y
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        DecisionTreeRegressor(random_state=0),
+        RandomForestRegressor(n_estimators=20, random_state=0),
+        ExtraTreesRegressor(n_estimators=20, max_depth=6, random_state=0),
+    ],
+)
+def test_packed_trees_match_the_model(data, model):
+    X, y = data
+    model.fit(X, y)
+    packed = pack_trees(model)
+    # rows on the split thresholds take the same branch as in sklearn
+    tree = model.estimators_[0].tree_ if hasattr(model, "estimators_") else model.tree_
+    on_split = np.tile(X[:1], (10, 1))
+    on_split[:, 1] = tree.threshold[tree.feature == 1][:10]
+    X_test = np.vstack([X[:100], on_split])
+
+    assert packed.predict(X_test) == pytest.approx(model.predict(X_test), rel=1e-9)
+
+
+def test_chunked_traversal_matches(data, monkeypatch):
+    X, y = data
+    model = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, y)
+    expected = pack_trees(model).predict(X)
+
+    monkeypatch.setattr(trees, "CHUNK_PATHS", 64)
+
+    assert pack_trees(model).predict(X) == pytest.approx(expected, rel=1e-12)
+    assert pack_trees(model).predict(X[:0]).shape == (0,)
+
+
+def test_other_models_are_not_packed(data):
+    with pytest.raises(ValueError):
+        pack_trees(LinearRegression().fit(*data))
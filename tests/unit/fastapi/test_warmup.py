@@ -0,0 +1,34 @@
+import asyncio
+from unittest import mock
+
+from services.backend.fastapi import warmup
+from services.backend.fastapi.schemas import MedicalCostFeatures
+from services.backend.fastapi.warmup import (synthetic_features, warm_up,
+                                             warm_up_in_background)
+
+
+def test_synthetic_features_cover_every_category():
+    features = synthetic_features(8)
+
+    assert all(isinstance(f, MedicalCostFeatures) for f in features)
+    assert {f.region for f in features} == set(type(features[0].region))
+    assert {f.sex for f in features} == set(type(features[0].sex))
+    assert {f.smoker for f in features} == set(type(features[0].smoker))
+
+
+def test_warm_up_times_every_batch_size():
+    timings = warm_up(batch_sizes=(1, 4), repeats=2)
+
+    assert list(timings) == [1, 4]
+    assert all(len(values) == 2 for values in timings.values())
+
+
+def test_failed_warm_up_is_logged_and_reports_ready(monkeypatch):
+    monkeypatch.setattr(warmup, "warm_up", mock.Mock(side_effect=RuntimeError))
+    monkeypatch.setattr(warmup, "logger", mock.Mock())
+    ready = asyncio.Event()
+
+    asyncio.run(warm_up_in_background(ready))
+
+    assert ready.is_set()
+    warmup.logger.exception.assert_called_once()
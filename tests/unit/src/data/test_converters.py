@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.data.converters import StreamingCSVToParquetConverter
+from src.features.core import convert_features_type
+
+COLUMN_TYPES = {
+    "age": "int64",
+    "sex": "string",
+    "bmi": "float64",
+    "children": "int64",
+    "smoker": "string",
+    "region": "string",
+    "charges": "float64",
+}
+
+
+@pytest.fixture
+def insurance_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.normal(30.0, 6.0, n).round(3),
+            "children": rng.integers(0, 5, n),
+            "smoker": rng.choice(["yes", "no"], n),
+            "region": rng.choice(["northeast", "northwest", "southeast"], n),
+            "charges": rng.normal(13000.0, 5000.0, n).round(4),
+        }
+    )
+    path = tmp_path / "insurance.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+def test_streaming_converter_writes_row_groups(tmp_path, insurance_csv):
+    csv_path, df = insurance_csv
+    converter = StreamingCSVToParquetConverter(
+        column_types=COLUMN_TYPES,
+        categorical=["sex", "smoker", "region"],
+        block_size=4096,
+        row_group_size=300,
+    )
+
+    parquet_path = converter.convert(csv_path, tmp_path / "insurance.parquet")
+
+    metadata = pq.ParquetFile(parquet_path).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+        300,
+        300,
+        300,
+        100,
+    ]
+    schema = pq.read_schema(parquet_path)
+    assert schema.field("age").type == pa.int64()
+    assert pa.types.is_dictionary(schema.field("region").type)
+
+    result = pd.read_parquet(parquet_path)
+    assert isinstance(result["region"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(
+        convert_features_type(result.astype({"region": str})),
+        convert_features_type(df),
+        check_dtype=False,
+    )
+    assert {p.name for p in tmp_path.iterdir()} == {
+        "insurance.csv",
+        "insurance.parquet",
+    }
+
+
+def test_streaming_converter_infers_types_without_config(tmp_path, insurance_csv):
+    csv_path, df = insurance_csv
+    parquet_path = StreamingCSVToParquetConverter().convert(
+        csv_path, tmp_path / "insurance.parquet"
+    )
+
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), df, check_dtype=False)
@@ -0,0 +1,121 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.core import DataLoader, DataSaver
+from src.data.data import Data
+from src.data.ingest import ROW_ID, PartitionedDataset, assign_test
+from src.data.pipeline import DataPipeline
+from src.factories.io_factory import IOFactory
+
+
+def make_batch(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.normal(30.0, 6.0, n).round(2),
+            "children": rng.integers(0, 5, n),
+            "smoker": rng.choice(["yes", "no"], n),
+            "region": rng.choice(["northeast", "southwest"], n),
+            "charges": rng.gamma(2.0, 5000.0, n),
+        }
+    )
+
+
+def make_data(tmp_path, name="processed"):
+    readers = IOFactory.create_readers()
+    writers = IOFactory.create_writers()
+    processed_dir = tmp_path / name
+    processed_dir.mkdir()
+    return Data(
+        data_saver=DataSaver(writers),
+        data_fetcher=mock.Mock(readers=readers),
+        processed_dir=processed_dir,
+        data_loader=DataLoader(readers),
+        dataset=PartitionedDataset(tmp_path / "raw" / "claims", readers, writers),
+    )
+
+
+def update(data):
+    params = data.params(transform="v1", incremental=True)
+    return data.update_splits(params, DataPipeline._transform)
+
+
+def load_splits(data):
+    splits = data.data_loader.load_splitted_data(data.processed_dir)
+    return {
+        name: getattr(splits, name).reset_index(drop=True)
+        for name in ["X_train", "X_test", "y_train", "y_test"]
+    }
+
+
+def test_assign_test_is_stable_per_row():
+    ids = np.arange(100_000, dtype=np.uint64)
+    test = assign_test(ids, 0.2)
+
+    assert test.mean() == pytest.approx(0.2, abs=0.01)
+    np.testing.assert_array_equal(assign_test(ids[50_000:], 0.2), test[50_000:])
+
+
+def test_append_is_partitioned_and_idempotent(tmp_path):
+    data = make_data(tmp_path)
+    batch = make_batch(100, seed=0)
+
+    path = data.dataset.append(batch, date="2025-01-01")
+    assert path.parent.name == "date=2025-01-01"
+    assert data.dataset.append(batch, date="2025-01-02") is None
+    assert list(data.dataset.batches().values()) == [path]
+
+    stored = data.dataset.read(path)
+    assert stored[ROW_ID].is_unique
+    pd.testing.assert_frame_equal(stored.drop(columns=ROW_ID), batch)
+
+    with pytest.raises(ValueError):
+        data.dataset.append(make_batch(10, seed=1), date="01/02/2025")
+
+
+def test_update_splits_appends_only_new_batches(tmp_path):
+    data = make_data(tmp_path)
+    data.dataset.append(make_batch(500, seed=0), date="2025-01-01")
+    first = update(data)
+    train_rows = len(load_splits(data)["X_train"])
+
+    data.dataset.append(make_batch(300, seed=1), date="2025-01-02")
+    with mock.patch.object(data.dataset, "read", wraps=data.dataset.read) as read:
+        second = update(data)
+    assert read.call_count == 1
+    assert second.data_hash != first.data_hash
+    assert len(second.batches) == 2
+
+    incremental = load_splits(data)
+    assert len(incremental["X_train"]) > train_rows
+    assert len(incremental["X_train"]) + len(incremental["X_test"]) == 800
+
+    rebuilt = make_data(tmp_path, name="rebuilt")
+    update(rebuilt)
+    for name, df in load_splits(rebuilt).items():
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(incremental[name]), pd.DataFrame(df), check_dtype=False
+        )
+
+    with mock.patch.object(data.dataset, "read") as read:
+        assert update(data) == second
+    read.assert_not_called()
+
+
+def test_update_splits_rebuilds_when_params_change(tmp_path):
+    data = make_data(tmp_path)
+    data.dataset.append(make_batch(500, seed=0), date="2025-01-01")
+    update(data)
+
+    data.test_size = 0.5
+    manifest = update(data)
+    splits = load_splits(data)
+
+    assert manifest.params["test_size"] == 0.5
+    assert len(splits["X_train"]) + len(splits["X_test"]) == 500
+    assert len(splits["X_test"]) == pytest.approx(250, abs=40)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.containers.results import StageResult
+from src.data.core import DataLoader, DataSaver
+from src.data.data import Data
+from src.factories.io_factory import IOFactory
+from src.serializers.stage_result import StageResultSerializer
+
+
+@pytest.fixture
+def raw_path(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "bmi": rng.normal(30.0, 6.0, n),
+            "charges": rng.gamma(2.0, 5000.0, n),
+        }
+    )
+    path = tmp_path / "insurance.parquet"
+    df.to_parquet(path)
+    return path
+
+
+@pytest.fixture
+def data(tmp_path):
+    processed_dir = tmp_path / "processed"
+    processed_dir.mkdir()
+    readers = IOFactory.create_readers()
+    return Data(
+        data_saver=DataSaver(IOFactory.create_writers()),
+        data_fetcher=mock.Mock(readers=readers),
+        processed_dir=processed_dir,
+        data_loader=DataLoader(readers),
+    )
+
+
+def run_split(data, raw_path, params):
+    return data.split(data.read(raw_path), raw_path, params)
+
+
+def test_manifest_is_current_until_inputs_change(data, raw_path):
+    params = data.params(transform="v1")
+    assert data.current_manifest(raw_path, params) is None
+
+    manifest = run_split(data, raw_path, params)
+    assert data.current_manifest(raw_path, params) == manifest
+
+    assert data.current_manifest(raw_path, data.params(transform="v2")) is None
+    data.random_state = 7
+    assert data.current_manifest(raw_path, data.params(transform="v1")) is None
+    data.random_state = 42
+
+    df = pd.read_parquet(raw_path)
+    df.iloc[0, 0] += 1
+    df.to_parquet(raw_path)
+    assert data.current_manifest(raw_path, params) is None
+
+    updated = run_split(data, raw_path, params)
+    assert updated.data_hash != manifest.data_hash
+    assert updated.raw.sha256 != manifest.raw.sha256
+    assert data.current_manifest(raw_path, params) == updated
+
+
+def test_manifest_detects_modified_splits(data, raw_path):
+    params = data.params(transform="v1")
+    manifest = run_split(data, raw_path, params)
+
+    with mock.patch("src.data.manifest.hash_file") as hash_file:
+        assert data.current_manifest(raw_path, params) == manifest
+    hash_file.assert_not_called()
+
+    y_test = data.processed_dir / "y_test.parquet"
+    pd.read_parquet(y_test).iloc[::-1].to_parquet(y_test)
+    assert data.current_manifest(raw_path, params) is None
+
+    (data.processed_dir / "X_train.parquet").unlink()
+    assert data.current_manifest(raw_path, params) is None
+
+
+def test_data_hash_is_stored_in_run_metrics():
+    result = StageResult(
+        model_name="LinearRegression",
+        estimator=LinearRegression(),
+        params={},
+        param_grid={},
+        folds_scores=[0.5],
+        folds_scores_mean=0.5,
+        metrics={"test_r2": 0.5},
+        data_hash="abc123",
+    )
+
+    metrics = StageResultSerializer.to_metrics(result)
+    assert metrics["data_hash"] == "abc123"
+    assert StageResultSerializer.from_loader(metrics, result.estimator).data_hash == (
+        "abc123"
+    )
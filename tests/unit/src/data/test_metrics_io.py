@@ -0,0 +1,57 @@
+import pytest
+
+from src.conf.schema import TrainingDir
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+from src.models.loaders.run_loader import RunLoader
+
+METRICS = {
+    "model_name": "LinearRegression",
+    "params": {"model__fit_intercept": True},
+    "folds_scores": [0.81, 0.79],
+    "metrics": {"test_r2": 0.8, "train_rmse": 1234.5},
+    "transformation": None,
+}
+
+
+@pytest.fixture
+def data_saver():
+    return DataSaver(IOFactory.create_writers())
+
+
+@pytest.fixture
+def data_loader():
+    return DataLoader(IOFactory.create_readers())
+
+
+@pytest.mark.parametrize("file_name", ["metrics.yaml", "metrics.yml", "metrics.json"])
+def test_metrics_roundtrip_by_extension(tmp_path, data_saver, data_loader, file_name):
+    path = tmp_path / file_name
+    data_saver.save_metrics(METRICS, path)
+    assert data_loader.load_metrics(path) == METRICS
+
+
+def test_metrics_roundtrip_msgpack(tmp_path, data_saver, data_loader):
+    pytest.importorskip("msgpack")
+    path = tmp_path / "metrics.msgpack"
+    data_saver.save_metrics(METRICS, path)
+    assert data_loader.load_metrics(path) == METRICS
+
+
+def test_metrics_unsupported_extension(tmp_path, data_saver):
+    with pytest.raises(ValueError, match="Unsupported metrics file extension"):
+        data_saver.save_metrics(METRICS, tmp_path / "metrics.txt")
+
+
+def test_run_loader_reads_legacy_yaml_metrics(tmp_path, data_saver, data_loader):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    data_saver.save_metrics(METRICS, run_dir / "metrics.yaml")
+    training_dir = TrainingDir(
+        output_dir=tmp_path, model_file="pipeline.pkl", metrics_file="metrics.json"
+    )
+
+    assert RunLoader(training_dir, data_loader).load_metrics(run_dir) == METRICS
+
+    with pytest.raises(FileNotFoundError):
+        RunLoader(training_dir, data_loader).load_metrics(tmp_path)
@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.core import DataLoader, DataSaver
+from src.data.shared import SharedSplitStore
+from src.factories.io_factory import IOFactory
+from src.io.writers import ArrowWriter
+
+COLUMNS = ["bmi", "age", "region"]
+
+
+@pytest.fixture
+def processed_dir(tmp_path):
+    rng = np.random.default_rng(0)
+
+    def features(n):
+        return pd.DataFrame(
+            {
+                "age": rng.integers(18, 65, n).astype(float),
+                "bmi": rng.normal(30.0, 6.0, n),
+                "region": rng.choice(["northeast", "southwest"], n),
+                "unused": rng.normal(size=n),
+            }
+        )
+
+    splits = {
+        "X_train": features(80),
+        "X_test": features(20),
+        "y_train": pd.DataFrame({"charges": rng.normal(size=80)}),
+        "y_test": pd.DataFrame({"charges": rng.normal(size=20)}),
+    }
+    DataSaver(IOFactory.create_writers()).save_splitted_data(splits, tmp_path)
+    return tmp_path
+
+
+def test_load_splitted_data_projects_columns(processed_dir):
+    loader = DataLoader(IOFactory.create_readers())
+    split_data = loader.load_splitted_data(
+        processed_dir, columns=COLUMNS, memory_map=True
+    )
+
+    assert list(split_data.X_train.columns) == ["age", "bmi", "region"]
+    assert isinstance(split_data.y_train, pd.Series)
+    full = pd.read_parquet(processed_dir / "X_test.parquet")
+    pd.testing.assert_frame_equal(split_data.X_test, full[["age", "bmi", "region"]])
+
+    with pytest.raises(KeyError, match="missing_column"):
+        loader.load_splitted_data(processed_dir, columns=["missing_column"])
+
+
+def test_shared_store_memory_maps_splits(processed_dir, tmp_path_factory):
+    shared_dir = tmp_path_factory.mktemp("shm")
+    readers = IOFactory.create_readers()
+    store = SharedSplitStore(shared_dir, readers, ArrowWriter())
+
+    shared = store.load(processed_dir, columns=COLUMNS)
+    expected = DataLoader(readers).load_splitted_data(processed_dir, columns=COLUMNS)
+
+    pd.testing.assert_frame_equal(shared.X_train, expected.X_train)
+    pd.testing.assert_series_equal(shared.y_test, expected.y_test)
+    assert not shared.X_train["bmi"].to_numpy().flags.writeable
+    assert sorted(p.name for p in shared_dir.iterdir()) == [
+        "X_test.arrow",
+        "X_train.arrow",
+        "y_test.arrow",
+        "y_train.arrow",
+    ]
+
+
+def test_shared_store_republishes_stale_splits(processed_dir, tmp_path_factory):
+    store = SharedSplitStore(
+        tmp_path_factory.mktemp("shm"), IOFactory.create_readers(), ArrowWriter()
+    )
+    store.publish(processed_dir)
+    published = store.path("X_train").stat().st_mtime_ns
+    published_test = store.path("X_test").stat().st_mtime_ns
+
+    store.publish(processed_dir)
+    assert store.path("X_train").stat().st_mtime_ns == published
+
+    parquet_path = processed_dir / "X_train.parquet"
+    later = published + 10**9
+    os.utime(parquet_path, ns=(later, later))
+    store.publish(processed_dir)
+    assert store.path("X_train").stat().st_mtime_ns > published
+    assert store.path("X_test").stat().st_mtime_ns == published_test
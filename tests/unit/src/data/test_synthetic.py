@@ -0,0 +1,129 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.data.core import DataFetcher
+from src.data.download import (BaseDownloader, DatasetDownloader,
+                               SyntheticDownloader)
+from src.factories.io_factory import IOFactory
+from src.features.core import convert_features_type
+
+
+@pytest.fixture
+def reference_df():
+    rng = np.random.default_rng(1)
+    n = 1338
+    df = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.normal(30.7, 6.1, n).clip(16, 53).round(3),
+            "children": rng.choice(6, n, p=[0.43, 0.24, 0.18, 0.12, 0.02, 0.01]),
+            "smoker": rng.choice(["yes", "no"], n, p=[0.2, 0.8]),
+            "region": rng.choice(
+                ["northeast", "northwest", "southeast", "southwest"], n
+            ),
+        }
+    )
+    smoker = df["smoker"] == "yes"
+    df["charges"] = (
+        250 * df["age"]
+        + np.where(smoker, 20000 + np.where(df["bmi"] >= 30, 20000, 0), 0)
+        + rng.gamma(2.0, 1500.0, n)
+    ).round(5)
+    return df
+
+
+@pytest.fixture
+def reference_downloader(reference_df):
+    class ReferenceDownloader(BaseDownloader):
+        def download(self, path):
+            csv_path = path / "insurance.csv"
+            reference_df.to_csv(csv_path, index=False)
+            return csv_path
+
+    return ReferenceDownloader()
+
+
+def test_synthetic_downloader_writes_parquet_chunks(
+    tmp_path, reference_df, reference_downloader
+):
+    downloader = SyntheticDownloader(
+        reference=reference_downloader,
+        filename="synthetic.parquet",
+        rows=25_000,
+        chunk_rows=10_000,
+    )
+
+    path = downloader.download(tmp_path)
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == 25_000
+    assert parquet_file.metadata.num_row_groups == 3
+
+    df = pd.read_parquet(path)
+    assert list(df.columns) == list(reference_df.columns)
+    assert df["age"].between(18, 64).all()
+    assert set(df["region"]) == set(reference_df["region"])
+    assert convert_features_type(df)["smoker"].dtype == np.float64
+
+    for name in ("smoker", "sex", "region"):
+        np.testing.assert_allclose(
+            df[name].value_counts(normalize=True).sort_index(),
+            reference_df[name].value_counts(normalize=True).sort_index(),
+            atol=0.02,
+        )
+
+    def median_charges(data):
+        obese = data["bmi"] >= 30
+        return data.groupby([data["smoker"].astype(str), obese])["charges"].median()
+
+    np.testing.assert_allclose(
+        median_charges(df), median_charges(reference_df), rtol=0.1
+    )
+    assert df["age"].corr(df["charges"]) == pytest.approx(
+        reference_df["age"].corr(reference_df["charges"]), abs=0.05
+    )
+
+
+def test_synthetic_downloader_is_reproducible(tmp_path, reference_downloader):
+    def generate(filename):
+        return pd.read_parquet(
+            SyntheticDownloader(
+                reference=reference_downloader, filename=filename, rows=1000
+            ).download(tmp_path)
+        )
+
+    pd.testing.assert_frame_equal(generate("a.parquet"), generate("b.parquet"))
+
+
+def test_synthetic_downloader_removes_reference_file(tmp_path, reference_downloader):
+    path = SyntheticDownloader(
+        reference=reference_downloader, filename="synthetic.parquet", rows=500
+    ).download(tmp_path)
+
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_data_fetcher_skips_conversion_for_parquet_source(
+    tmp_path, reference_downloader
+):
+    source = SyntheticDownloader(
+        reference=reference_downloader, filename="synthetic.parquet", rows=500
+    )
+    converter = mock.Mock()
+    fetcher = DataFetcher(
+        tmp_path,
+        DatasetDownloader(tmp_path, source),
+        converter,
+        IOFactory.create_readers(),
+        filename="synthetic.parquet",
+    )
+
+    df = fetcher.fetch()
+
+    assert len(df) == 500
+    converter.convert.assert_not_called()
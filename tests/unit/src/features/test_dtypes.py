@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+from src.features.core import (convert_features_type, optimize_dtypes,
+                               widen_dtypes)
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture
+def insurance_df():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.choice(["female", "male"], n),
+            "bmi": rng.normal(30.0, 6.0, n).round(3),
+            "children": rng.integers(0, 6, n),
+            "smoker": rng.choice(["yes", "no"], n),
+            "region": rng.choice(["northeast", "northwest", "southeast"], n),
+        }
+    )
+    df["charges"] = np.exp(8 + 0.02 * df["age"] + (df["smoker"] == "yes"))
+    return convert_features_type(df)
+
+
+def test_optimize_dtypes(insurance_df):
+    compact = optimize_dtypes(insurance_df, exclude=["charges"])
+
+    assert compact.dtypes.to_dict() == {
+        "age": np.int8,
+        "sex": np.int8,
+        "bmi": np.float32,
+        "children": np.int8,
+        "smoker": np.int8,
+        "region": "category",
+        "charges": np.float64,
+    }
+    assert compact.memory_usage(deep=True).sum() < (
+        insurance_df.memory_usage(deep=True).sum() / 3
+    )
+    pd.testing.assert_frame_equal(
+        widen_dtypes(compact), insurance_df, check_exact=False, rtol=1e-6
+    )
+
+
+@pytest.mark.parametrize(
+    "name, preprocess_num_features, params",
+    [
+        ("linear", True, {}),
+        ("tree", False, {"random_state": 0}),
+        ("rf", False, {"n_estimators": 10, "random_state": 0}),
+        ("knn", True, {}),
+    ],
+)
+@pytest.mark.parametrize("transformation", ["none", "log"])
+def test_pipelines_accept_compact_dtypes(
+    insurance_df, name, preprocess_num_features, params, transformation
+):
+    X = insurance_df.drop(columns="charges")
+    y = insurance_df["charges"]
+    X_compact = optimize_dtypes(X)
+    model_cfg = ModelConfig(
+        name=name,
+        preprocess_num_features=preprocess_num_features,
+        target_transformations=True,
+        params={},
+    )
+    prefix = "model__" if transformation == "none" else "regressor__model__"
+
+    def fit(X_fit):
+        pipeline = PipelineBuilder.build(model_cfg, FEATURES, transformation)
+        pipeline.set_params(**{f"{prefix}{key}": value for key, value in params.items()})
+        return pipeline.fit(X_fit, y)
+
+    expected = fit(X).predict(X)
+    compact = fit(X_compact)
+
+    np.testing.assert_allclose(compact.predict(X_compact), expected, rtol=1e-5)
+    np.testing.assert_allclose(
+        compact.predict(widen_dtypes(X_compact)), expected, rtol=1e-5
+    )
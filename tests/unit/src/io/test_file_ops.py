@@ -0,0 +1,40 @@
+import pytest
+
+from src.io.file_ops import PathManager
+
+
+def test_concurrent_atomic_writes_use_separate_files(tmp_path):
+    target = tmp_path / "split.arrow"
+
+    with (
+        PathManager.atomic_write(target) as first,
+        PathManager.atomic_write(target) as second,
+    ):
+        assert first != second
+        first.write_text("first")
+        second.write_text("second")
+
+    assert target.read_text() == "first"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_atomic_write_leaves_no_file(tmp_path):
+    target = tmp_path / "split.arrow"
+
+    with pytest.raises(RuntimeError):
+        with PathManager.atomic_write(target) as tmp:
+            tmp.write_text("partial")
+            raise RuntimeError
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_atomic_write_uses_the_default_file_mode(tmp_path):
+    target = tmp_path / "split.arrow"
+    plain = tmp_path / "plain.arrow"
+    plain.write_text("plain")
+
+    with PathManager.atomic_write(target) as tmp:
+        tmp.write_text("atomic")
+
+    assert target.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.neighbors import KNeighborsRegressor
+
+from src.io.readers import JoblibReader
+from src.io.writers import JoblibWriter
+
+
+@pytest.fixture
+def forest():
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(300, 4)), rng.normal(size=300)
+    return RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y), X
+
+
+@pytest.mark.parametrize(
+    "compress, expected",
+    [(None, 0), (3, 3), ("lzma", "lzma"), ("zlib:3", ("zlib", 3))],
+)
+def test_parse_compression(compress, expected):
+    assert JoblibWriter.parse_compression(compress) == expected
+
+
+@pytest.mark.parametrize("compress", [None, 3, "zlib:3", "gzip:1"])
+def test_joblib_roundtrip(tmp_path, forest, compress):
+    model, X = forest
+    path = tmp_path / "model.pkl"
+
+    JoblibWriter().write(model, path, compress=compress)
+    loaded = JoblibReader().read(path)
+
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+
+
+def test_compressed_model_is_smaller(tmp_path, forest):
+    model, _ = forest
+    JoblibWriter().write(model, tmp_path / "raw.pkl")
+    JoblibWriter().write(model, tmp_path / "zlib.pkl", compress="zlib:3")
+
+    assert (tmp_path / "zlib.pkl").stat().st_size < (tmp_path / "raw.pkl").stat().st_size
+
+
+def test_uncompressed_model_is_memory_mapped(tmp_path, forest):
+    _, X = forest
+    model = KNeighborsRegressor().fit(X, X[:, 0])
+    path = tmp_path / "model.pkl"
+    JoblibWriter().write(model, path)
+
+    loaded = JoblibReader().read(path, mmap_mode="r")
+
+    assert isinstance(loaded._fit_X, np.memmap)
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
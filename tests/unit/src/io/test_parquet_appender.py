@@ -0,0 +1,46 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.io.writers import ParquetWriter
+
+
+def test_appender_writes_every_batch_once(tmp_path):
+    path = tmp_path / "X_train.parquet"
+    ParquetWriter().write(pd.DataFrame({"age": [18], "bmi": [20.0]}), path)
+
+    with ParquetWriter().appender(path) as appender:
+        for i in range(3):
+            appender.append(pd.DataFrame({"age": [19 + i], "bmi": [21.0 + i]}))
+        # the target is only replaced on exit
+        assert len(pd.read_parquet(path)) == 1
+
+    assert pd.read_parquet(path)["age"].tolist() == [18, 19, 20, 21]
+    assert pq.ParquetFile(path).num_row_groups == 4
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_appender_promotes_column_types(tmp_path):
+    path = tmp_path / "X_train.parquet"
+
+    with ParquetWriter().appender(path) as appender:
+        appender.append(pd.DataFrame({"children": pd.Series([1], dtype="int8")}))
+        appender.append(pd.DataFrame({"children": pd.Series([300], dtype="int16")}))
+
+    assert pq.read_schema(path).field("children").type == pa.int16()
+    assert pd.read_parquet(path)["children"].tolist() == [1, 300]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_failed_append_leaves_the_file_untouched(tmp_path):
+    path = tmp_path / "X_train.parquet"
+    ParquetWriter().write(pd.DataFrame({"age": [18]}), path)
+
+    with pytest.raises(RuntimeError):
+        with ParquetWriter().appender(path) as appender:
+            appender.append(pd.DataFrame({"age": [19]}))
+            raise RuntimeError
+
+    assert pd.read_parquet(path)["age"].tolist() == [18]
+    assert list(tmp_path.iterdir()) == [path]
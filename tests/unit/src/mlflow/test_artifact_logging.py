@@ -0,0 +1,101 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+import mlflow
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.conf.schema import FeaturesConfig, ModelConfig
+from src.containers.results import StageResult
+from src.features.core import optimize_dtypes, widen_dtypes
+from src.mlflow.logger import MLflowLogger
+from src.mlflow.service import MLflowService
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture
+def logger(tmp_path):
+    mlflow.set_tracking_uri(tmp_path.joinpath("mlruns").as_uri())
+    mlflow.set_experiment("artifact-logging")
+    with mock.patch.object(MLflowService, "setup"):
+        yield MLflowLogger(MLflowService())
+    mlflow.set_tracking_uri(None)
+
+
+@pytest.fixture
+def train_data():
+    rng = np.random.default_rng(0)
+    n = 200
+    X = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n),
+            "sex": rng.integers(0, 2, n),
+            "bmi": rng.normal(30.0, 6.0, n),
+            "children": rng.integers(0, 5, n),
+            "smoker": rng.integers(0, 2, n),
+            "region": rng.choice(["northeast", "southwest"], n),
+        }
+    )
+    y = 250 * X["age"] + 20000 * X["smoker"] + rng.normal(0, 500, n)
+    return optimize_dtypes(X), y
+
+
+def make_result(X, y):
+    estimator = PipelineBuilder.build(
+        model_cfg=ModelConfig(
+            name="linear",
+            preprocess_num_features=True,
+            target_transformations=False,
+            params={},
+            model_class=LinearRegression,
+        ),
+        features_cfg=FEATURES,
+    ).fit(X, y)
+    return StageResult(
+        model_name="LinearRegression",
+        estimator=estimator,
+        params={},
+        param_grid={},
+        folds_scores=[0.9],
+        folds_scores_mean=0.9,
+        metrics={"test_r2": 0.9},
+    )
+
+
+def test_signature_matches_the_inferred_one(logger, train_data):
+    X, y = train_data
+    example = widen_dtypes(X.iloc[:5])
+    estimator = make_result(X, y).estimator
+
+    inferred = mlflow.models.infer_signature(example, estimator.predict(example))
+    assert logger.service.build_signature(example) == inferred
+
+
+def test_artifact_metadata_is_computed_once_per_stage(logger, train_data):
+    X, y = train_data
+    with mock.patch.object(
+        logger.service,
+        "infer_pip_requirements",
+        wraps=logger.service.infer_pip_requirements,
+    ) as infer_requirements:
+        for _ in range(2):
+            logger.log_model(make_result(X, y), X_train=X)
+
+    infer_requirements.assert_called_once()
+    runs = mlflow.search_runs(output_format="list")
+    assert len(runs) == 2
+
+    logged = mlflow.sklearn.load_model(f"runs:/{runs[0].info.run_id}/LinearRegression")
+    np.testing.assert_allclose(logged.predict(X), make_result(X, y).estimator.predict(X))
+    requirements = mlflow.pyfunc.get_model_dependencies(
+        f"runs:/{runs[0].info.run_id}/LinearRegression"
+    )
+    with open(requirements) as f:
+        assert "scikit-learn" in f.read()
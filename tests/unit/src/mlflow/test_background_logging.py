@@ -0,0 +1,65 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from src.containers.results import StageResult
+from src.mlflow.background import BackgroundMLflowLogger
+
+
+def make_result(name):
+    return StageResult(
+        model_name=name,
+        estimator=mock.Mock(),
+        params={},
+        param_grid={},
+        folds_scores=[0.8],
+        folds_scores_mean=0.8,
+        metrics={"test_r2": 0.8},
+    )
+
+
+def test_training_continues_while_runs_are_logged():
+    release = threading.Event()
+    logged = []
+
+    def log_model(result, X_train, register=False):
+        release.wait(timeout=5)
+        logged.append(result.model_name)
+
+    mlflow_logger = mock.Mock(log_model=mock.Mock(side_effect=log_model))
+    background = BackgroundMLflowLogger(mlflow_logger, queue_size=2)
+    for name in ["a", "b", "c"]:
+        background.log_model(make_result(name), X_train=None)
+    assert logged == []
+
+    blocked = threading.Thread(
+        target=background.log_model, args=(make_result("d"), None)
+    )
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=5)
+    background.close()
+    assert logged == ["a", "b", "c", "d"]
+    with pytest.raises(RuntimeError, match="closed"):
+        background.log_model(make_result("e"), X_train=None)
+
+
+def test_failed_runs_are_retried_and_reported():
+    def log_model(result, X_train, register=False):
+        if result.model_name == "broken":
+            raise ConnectionError("tracking server unavailable")
+
+    mlflow_logger = mock.Mock(log_model=mock.Mock(side_effect=log_model))
+    with pytest.raises(RuntimeError, match="1 run"):
+        with BackgroundMLflowLogger(
+            mlflow_logger, retries=2, retry_delay=0.0
+        ) as background:
+            for name in ["ok", "broken", "also_ok"]:
+                background.log_model(make_result(name), X_train=None)
+
+    assert [result.model_name for result in background.failed] == ["broken"]
+    assert mlflow_logger.log_model.call_count == 5
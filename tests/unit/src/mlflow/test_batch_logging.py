@@ -0,0 +1,92 @@
+from contextlib import ExitStack
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.store.tracking.file_store import FileStore
+from mlflow.tracking import MlflowClient
+from src.mlflow.service import MLflowService
+
+STORE_WRITES = ("log_batch", "log_param", "log_metric", "set_tag")
+
+
+@pytest.fixture
+def service(tmp_path):
+    mlflow.set_tracking_uri(tmp_path.joinpath("mlruns").as_uri())
+    mlflow.set_experiment("batch-logging")
+    yield MLflowService()
+    mlflow.set_tracking_uri(None)
+
+
+@pytest.fixture
+def store_writes():
+    """
+    Counts the write requests reaching the tracking store, by method name.
+    """
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(
+                mock.patch.object(
+                    FileStore,
+                    name,
+                    autospec=True,
+                    side_effect=getattr(FileStore, name),
+                )
+            )
+            for name in STORE_WRITES
+        }
+
+
+def reset(store_writes):
+    for write in store_writes.values():
+        write.reset_mock()
+
+
+def counts(store_writes):
+    return {name: write.call_count for name, write in store_writes.items()}
+
+
+def test_run_data_is_logged_in_one_batch(service, store_writes):
+    params = {f"param_{idx}": idx for idx in range(50)}
+    folds_scores = [0.81, 0.84, 0.79, 0.88, 0.83]
+    metrics = service.build_metrics(
+        {"train_r2": 0.9, "test_r2": 0.85}, folds_scores, 0.83
+    )
+    tags = {"stage": "test"}
+
+    with service.start_run("per-item"):
+        reset(store_writes)
+        for key, value in params.items():
+            mlflow.log_param(key, value)
+        for metric in metrics:
+            mlflow.log_metric(metric.key, metric.value, step=metric.step)
+        mlflow.set_tags(tags)
+        per_item = counts(store_writes)
+
+    with service.start_run("batched") as run:
+        reset(store_writes)
+        service.log_batch(params=params, metrics=metrics, tags=tags)
+        batched = counts(store_writes)
+
+    assert sum(per_item.values()) == len(params) + len(metrics) + len(tags)
+    assert batched == {"log_batch": 1, "log_param": 0, "log_metric": 0, "set_tag": 0}
+
+    logged = MlflowClient().get_run(run.info.run_id).data
+    assert logged.params == {key: str(value) for key, value in params.items()}
+    assert logged.tags["stage"] == "test"
+    assert logged.metrics["fold_3_r2"] == 0.79
+    assert logged.metrics["folds_r2_mean"] == 0.83
+    assert [metric.step for metric in metrics] == list(range(1, 9))
+
+
+def test_large_batches_are_split_within_server_limits(service, store_writes):
+    params = {f"param_{idx}": idx for idx in range(150)}
+
+    with service.start_run("large") as run:
+        reset(store_writes)
+        service.log_batch(params=params)
+
+    assert store_writes["log_batch"].call_count == 2
+    logged = MlflowClient().get_run(run.info.run_id).data
+    assert len(logged.params) == len(params)
@@ -0,0 +1,81 @@
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+import mlflow
+from src.mlflow.cache import ModelCache
+from src.mlflow.service import MLflowService
+
+
+def fake_download(content):
+    def download(dst):
+        model_dir = dst / "artifacts"
+        model_dir.mkdir()
+        (model_dir / "model.pkl").write_bytes(content)
+        (model_dir / "MLmodel").write_text("flavors: {}")
+        return model_dir
+
+    return mock.Mock(side_effect=download)
+
+
+def test_cache_hits_validates_and_evicts(tmp_path):
+    cache = ModelCache(tmp_path, max_entries=2)
+    download = fake_download(b"v1")
+
+    assert cache.get("model", 1) is None
+    model_dir = cache.put("model", 1, download)
+    assert (model_dir / "model.pkl").read_bytes() == b"v1"
+    assert cache.get("model", 1) == model_dir
+
+    (model_dir / "model.pkl").write_bytes(b"truncated")
+    assert cache.get("model", 1) is None
+    assert not model_dir.exists()
+
+    cache.put("model", 1, download)
+    cache.put("model", 2, fake_download(b"v2"))
+    os.utime(tmp_path / "model" / "2" / "checksums.json", (0, 0))
+    assert cache.get("model", 1) is not None
+    cache.put("model", 3, fake_download(b"v3"))
+
+    assert cache.get("model", 2) is None
+    assert cache.get("model", 1) is not None
+    assert cache.get("model", 3) is not None
+    assert download.call_count == 2
+
+
+@pytest.fixture
+def registry(tmp_path):
+    mlflow.set_tracking_uri(tmp_path.joinpath("mlruns").as_uri())
+    mlflow.set_experiment("model-cache")
+    X = pd.DataFrame({"age": [20.0, 30.0, 40.0], "bmi": [22.0, 28.0, 31.0]})
+    for coef in [1.0, 2.0]:
+        model = LinearRegression().fit(X, coef * X["age"])
+        with mlflow.start_run():
+            mlflow.sklearn.log_model(
+                model, name="model", registered_model_name="Regressor"
+            )
+    yield X, tmp_path / "cache"
+    mlflow.set_tracking_uri(None)
+
+
+def test_registry_loads_are_cached_across_restarts(registry):
+    X, cache_dir = registry
+    service = MLflowService(cache=ModelCache(cache_dir))
+    assert service.get_latest_model_version("Regressor") == 2
+
+    with mock.patch.object(
+        mlflow.artifacts,
+        "download_artifacts",
+        wraps=mlflow.artifacts.download_artifacts,
+    ) as download:
+        first = service.load_model("Regressor", version=2)
+        restarted = MLflowService(cache=ModelCache(cache_dir))
+        second = restarted.load_model("Regressor", version=2)
+
+    download.assert_called_once()
+    np.testing.assert_allclose(first.predict(X), 2.0 * X["age"])
+    np.testing.assert_allclose(second.predict(X), first.predict(X))
@@ -0,0 +1,181 @@
+import copy
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pytest
+from omegaconf import OmegaConf
+from sklearn.linear_model import LinearRegression
+
+from src.conf.schema import TrainingDir
+from src.containers.results import EstimatorHandle, StageResult
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+from src.models.loaders.run_loader import RunLoader
+from src.models.savers.run_saver import RunSaver
+from src.optuna.base import OptunaBasePipeline
+from src.serializers.stage_result import StageResultSerializer
+
+RUNS = [
+    ("2025-01-01_00-00-00", "LinearRegression", 0.70),
+    ("2025-01-01_00-00-01", "DecisionTreeRegressor", 0.85),
+    ("2025-01-01_00-00-02", "LinearRegression", 0.75),
+    ("2025-01-01_00-00-03", "RandomForestRegressor", 0.90),
+    ("2025-01-01_00-00-04", "DecisionTreeRegressor", 0.60),
+]
+
+
+def make_result(model_name, test_r2):
+    return StageResult(
+        model_name=model_name,
+        estimator=LinearRegression(),
+        params={},
+        param_grid={},
+        folds_scores=[test_r2],
+        folds_scores_mean=test_r2,
+        metrics={"test_r2": test_r2},
+        transformation="none",
+    )
+
+
+@pytest.fixture
+def training_dir(tmp_path):
+    return TrainingDir(
+        output_dir=tmp_path, model_file="pipeline.pkl", metrics_file="metrics.yaml"
+    )
+
+
+@pytest.fixture
+def saved_runs(training_dir):
+    saver = RunSaver(training_dir, DataSaver(IOFactory.create_writers()))
+    with mock.patch("src.models.savers.run_saver.datetime") as mock_datetime:
+        for run_id, model_name, test_r2 in RUNS:
+            mock_datetime.now.return_value.strftime.return_value = run_id
+            saver.save(make_result(model_name, test_r2))
+    return saver
+
+
+def test_runs_saved_within_a_second_are_kept(training_dir):
+    saver = RunSaver(training_dir, DataSaver(IOFactory.create_writers()))
+    with mock.patch("src.models.savers.run_saver.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2025, 1, 1, 0, 0, 0, 1)
+        saver.save(make_result("LinearRegression", 0.7))
+        mock_datetime.now.return_value = datetime(2025, 1, 1, 0, 0, 0, 2)
+        saver.save(make_result("LinearRegression", 0.8))
+
+        assert saver.index.run_ids() == {
+            "2025-01-01_00-00-00-000001",
+            "2025-01-01_00-00-00-000002",
+        }
+        assert len([p for p in training_dir.output_dir.iterdir() if p.is_dir()]) == 2
+
+        with pytest.raises(FileExistsError):
+            saver.save(make_result("LinearRegression", 0.9))
+
+
+def test_index_rejects_a_duplicate_run(saved_runs):
+    metrics = StageResultSerializer.to_metrics(make_result("X", 1.0))
+    with pytest.raises(sqlite3.IntegrityError):
+        saved_runs.index.add(RUNS[0][0], metrics)
+
+    assert saved_runs.index.best().test_r2 == 0.90
+
+
+def test_run_saver_updates_index(saved_runs):
+    assert saved_runs.index.run_ids() == {run_id for run_id, _, _ in RUNS}
+
+    best = saved_runs.index.best()
+    assert best.run_id == "2025-01-01_00-00-03"
+    assert best.run_dir == saved_runs.training_dir.output_dir / best.run_id
+
+    top = saved_runs.index.top(2)
+    assert [(run.model_name, run.test_r2) for run in top] == [
+        ("RandomForestRegressor", 0.90),
+        ("DecisionTreeRegressor", 0.85),
+    ]
+    assert [run.model_name for run in saved_runs.index.top(5)][-1] == (
+        "LinearRegression"
+    )
+    assert saved_runs.index.top(5)[-1].test_r2 == 0.75
+
+
+def test_select_best_run_loads_winner_lazily(saved_runs, training_dir):
+    run_loader = RunLoader(training_dir, DataLoader(IOFactory.create_readers()))
+    base = OptunaBasePipeline(dynamic_cfg=OmegaConf.create({}))
+
+    with mock.patch.object(
+        run_loader.data_loader, "load_model", wraps=run_loader.data_loader.load_model
+    ) as load_model:
+        best = base.select_best_run(run_loader)
+        load_model.assert_not_called()
+
+        assert best.model_name == "RandomForestRegressor"
+        assert best.metrics["test_r2"] == 0.90
+        assert isinstance(best.estimator, LinearRegression)
+        assert best.estimator is best.estimator
+        load_model.assert_called_once()
+
+
+def test_sync_index_backfills_and_prunes_runs(training_dir):
+    data_saver = DataSaver(IOFactory.create_writers())
+    for run_id, model_name, test_r2 in RUNS[:3]:
+        run_dir = training_dir.output_dir / run_id
+        run_dir.mkdir()
+        data_saver.save_metrics(
+            StageResultSerializer.to_metrics(make_result(model_name, test_r2)),
+            run_dir / training_dir.metrics_file,
+        )
+        data_saver.save_model(LinearRegression(), run_dir / training_dir.model_file)
+
+    run_loader = RunLoader(training_dir, DataLoader(IOFactory.create_readers()))
+    run_loader.index.add(
+        "2024-12-31_00-00-00", StageResultSerializer.to_metrics(make_result("X", 1.0))
+    )
+
+    with mock.patch.object(run_loader.data_loader, "load_model") as load_model:
+        run_loader.sync_index()
+
+    load_model.assert_not_called()
+    assert run_loader.index.run_ids() == {run_id for run_id, _, _ in RUNS[:3]}
+    assert run_loader.index.best().model_name == "DecisionTreeRegressor"
+
+
+def test_lazy_estimator_memory_mapped(training_dir, train_data):
+    X_train, y_train = train_data
+    run_dir = training_dir.output_dir / "run"
+    run_dir.mkdir()
+    result = make_result("LinearRegression", 0.5)
+    result.estimator = LinearRegression().fit(X_train, y_train)
+    data_saver = DataSaver(IOFactory.create_writers())
+    data_saver.save_metrics(
+        StageResultSerializer.to_metrics(result), run_dir / training_dir.metrics_file
+    )
+    data_saver.save_model(result.estimator, run_dir / training_dir.model_file)
+
+    run_loader = RunLoader(
+        training_dir, DataLoader(IOFactory.create_readers()), mmap_mode="r"
+    )
+    loaded = run_loader.load(run_dir)
+
+    assert not loaded.estimator_handle.loaded
+    assert isinstance(loaded.estimator.coef_, np.memmap)
+    assert loaded.estimator.predict(X_train) == pytest.approx(y_train)
+
+
+def test_lazy_result_accepts_a_refit_estimator_without_loading():
+    loader = mock.Mock()
+    result = StageResultSerializer.from_loader(
+        StageResultSerializer.to_metrics(make_result("LinearRegression", 0.5)),
+        EstimatorHandle(path=Path("model.joblib"), loader=loader),
+    )
+
+    repr(result)
+    assert result == copy.copy(result)
+    loader.assert_not_called()
+
+    refit = LinearRegression()
+    result.estimator = refit
+    assert result.estimator is refit
+    loader.assert_not_called()
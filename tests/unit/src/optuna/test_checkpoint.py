@@ -0,0 +1,113 @@
+from unittest import mock
+
+import optuna
+import pytest
+from optuna.distributions import CategoricalDistribution, IntDistribution
+from sklearn.linear_model import LinearRegression
+
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+from src.optuna.checkpoint import StudyCheckpoint
+
+optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return StudyCheckpoint(
+        model_name="LinearRegression",
+        models_dir=tmp_path,
+        data_saver=DataSaver(IOFactory.create_writers()),
+        data_loader=DataLoader(IOFactory.create_readers()),
+    )
+
+
+def test_checkpoint_saved_only_on_improvement(checkpoint):
+    values = iter([0.5, 0.3, 0.8, 0.1])
+    saves = []
+
+    def objective(trial):
+        trial.suggest_categorical("model__fit_intercept", [True, False])
+        return next(values)
+
+    study = optuna.create_study(direction="maximize")
+    with mock.patch.object(checkpoint, "save", wraps=checkpoint.save) as save:
+        study.optimize(objective, n_trials=4, callbacks=[checkpoint])
+        saves = [call.args[0].number for call in save.call_args_list]
+
+    assert saves == [0, 2]
+    saved = checkpoint.load()
+    assert saved["model_name"] == "LinearRegression"
+    assert saved["trial_number"] == 2
+    assert saved["best_value"] == 0.8
+    assert saved["best_params"] == study.best_params
+    assert [p.name for p in checkpoint.checkpoint_dir.iterdir()] == [
+        "linearregression.yml"
+    ]
+
+
+def test_checkpoint_saves_refitted_pipeline(checkpoint, train_data):
+    X_train, y_train = train_data
+    checkpoint.save_pipeline = True
+    checkpoint.refit = lambda params: LinearRegression(
+        fit_intercept=params["model__fit_intercept"]
+    ).fit(X_train, y_train)
+
+    study = optuna.create_study(direction="maximize")
+    study.optimize(
+        lambda trial: float(trial.suggest_categorical("model__fit_intercept", [True])),
+        n_trials=1,
+        callbacks=[checkpoint],
+    )
+
+    pipeline = checkpoint.data_loader.load_model(checkpoint.pipeline_path)
+    assert pipeline.predict(X_train).shape == (len(X_train),)
+
+
+def test_checkpoint_resume_enqueues_best_params(checkpoint):
+    study = optuna.create_study(direction="maximize")
+    study.optimize(
+        lambda trial: trial.suggest_int("model__max_depth", 2, 15),
+        n_trials=5,
+        callbacks=[checkpoint],
+    )
+
+    resumed = optuna.create_study(direction="maximize")
+    checkpoint.resume(resumed, [{"model__max_depth": IntDistribution(2, 15)}])
+    resumed.optimize(
+        lambda trial: trial.suggest_int("model__max_depth", 2, 15), n_trials=1
+    )
+
+    assert resumed.trials[0].params == study.best_params
+
+
+def test_checkpoint_resume_without_checkpoint(checkpoint):
+    study = optuna.create_study(direction="maximize")
+    checkpoint.resume(study, [{"model__max_depth": IntDistribution(2, 15)}])
+    assert study.trials == []
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        {"model__max_depth": CategoricalDistribution([2, 5, 7])},
+        {
+            "model__max_depth": IntDistribution(2, 15),
+            "model__min_samples_leaf": IntDistribution(1, 10),
+        },
+        {"model__min_samples_leaf": IntDistribution(1, 10)},
+    ],
+)
+def test_checkpoint_outside_the_search_space_is_ignored(checkpoint, space):
+    study = optuna.create_study(direction="maximize")
+    study.enqueue_trial({"model__max_depth": 4})
+    study.optimize(
+        lambda trial: trial.suggest_int("model__max_depth", 2, 15),
+        n_trials=1,
+        callbacks=[checkpoint],
+    )
+
+    resumed = optuna.create_study(direction="maximize")
+    checkpoint.resume(resumed, [space])
+
+    assert resumed.trials == []
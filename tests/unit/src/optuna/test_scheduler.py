@@ -0,0 +1,127 @@
+import optuna
+import pytest
+
+from src.conf.schema import OptunaConfig
+from src.containers.experiment import SchedulerArm
+from src.containers.results import ArmAllocation
+from src.optuna.scheduler import OptunaBudgetScheduler
+from src.optuna.tuning import OptunaOptimize
+
+optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+
+def make_arm(name, objective):
+    study = optuna.create_study(
+        direction="maximize", sampler=optuna.samplers.RandomSampler(seed=0)
+    )
+    return SchedulerArm(
+        name=name,
+        study=study,
+        optimize=lambda n_trials, timeout: study.optimize(
+            objective, n_trials=n_trials, timeout=timeout
+        ),
+    )
+
+
+def improving(trial):
+    return trial.suggest_float("x", 0.0, 1.0)
+
+
+def flat(trial):
+    trial.suggest_float("x", 0.0, 1.0)
+    return 0.1
+
+
+def test_scheduler_trials_budget_prefers_improving_arm():
+    cfg = OptunaConfig(trials=10, top_n=3, rounds=3)
+    arms = [
+        make_arm("good", improving),
+        make_arm("flat", flat),
+        make_arm("bad", lambda trial: flat(trial) - 1.0),
+    ]
+
+    scheduler = OptunaBudgetScheduler(cfg)
+    allocations = scheduler.run(arms)
+
+    assert scheduler.best(allocations) == "good"
+    assert sum(a.trials for a in allocations.values()) <= cfg.trials * len(arms) + 3
+    assert allocations["bad"].stopped_round == 1
+    assert allocations["good"].stopped_round is None
+    assert allocations["good"].trials > allocations["bad"].trials
+    assert allocations["good"].best_value == pytest.approx(
+        arms[0].study.best_value
+    )
+
+
+def test_scheduler_time_budget_runs_until_budget_spent():
+    cfg = OptunaConfig(trials=1000, top_n=2, budget=0.4, rounds=2)
+    arms = [make_arm("good", improving), make_arm("flat", flat)]
+
+    allocations = OptunaBudgetScheduler(cfg).run(arms)
+
+    total_seconds = sum(a.seconds for a in allocations.values())
+    assert 0.2 <= total_seconds <= 1.0
+    assert all(a.trials > 0 for a in allocations.values())
+    assert allocations["flat"].stopped_round == 1
+
+
+def test_scheduler_time_budget_is_not_capped_by_trials():
+    cfg = OptunaConfig(trials=2, budget=0.4, rounds=2)
+    optimizer = OptunaOptimize(cfg, pruner=optuna.pruners.NopPruner())
+    arm = SchedulerArm(
+        name="only",
+        study=optimizer.study,
+        optimize=lambda n_trials, timeout: optimizer.optimize(
+            improving, n_trials=n_trials, timeout=timeout
+        ),
+    )
+
+    allocations = OptunaBudgetScheduler(cfg).run([arm])
+
+    assert allocations["only"].seconds >= 0.3
+    assert allocations["only"].trials > cfg.trials * cfg.rounds
+
+
+def test_optimize_defaults_to_configured_trials():
+    optimizer = OptunaOptimize(
+        OptunaConfig(trials=3), pruner=optuna.pruners.NopPruner()
+    )
+
+    assert len(optimizer.optimize(improving).trials) == 3
+
+
+def test_scheduler_single_arm_is_never_stopped():
+    cfg = OptunaConfig(trials=4, rounds=2)
+    allocations = OptunaBudgetScheduler(cfg).run([make_arm("only", improving)])
+
+    assert allocations["only"].stopped_round is None
+    assert allocations["only"].trials == 4
+    assert len(allocations["only"].history) == 2
+
+
+def test_single_trial_leaves_the_rate_unknown():
+    arm = make_arm("one", improving)
+    allocation = ArmAllocation(name="one")
+
+    OptunaBudgetScheduler(OptunaConfig(trials=1))._run_arm(arm, allocation, 1)
+
+    assert allocation.trials == 1
+    assert allocation.rate is None
+
+
+@pytest.mark.parametrize(
+    "trials, rate, stopped", [(1, None, False), (2, 0.0, False), (5, 0.0, True)]
+)
+def test_arms_with_little_information_are_not_stopped(trials, rate, stopped):
+    arms = [make_arm("good", improving), make_arm("new", flat)]
+    allocations = {
+        "good": ArmAllocation(name="good", trials=5, best_value=0.9, rate=0.01),
+        "new": ArmAllocation(name="new", trials=trials, best_value=0.1, rate=rate),
+    }
+
+    kept = OptunaBudgetScheduler(OptunaConfig(trials=10))._stop_losers(
+        arms, allocations, remaining=10, round_idx=0
+    )
+
+    assert (arms[1] not in kept) is stopped
+    assert arms[0] in kept
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+from optuna.trial import FixedTrial
+from sklearn.model_selection import KFold
+
+from src.builders.optuna.optuna_experiment_builder import \
+    OptunaExperimentBuilder
+from src.conf.schema import (FeaturesConfig, ModelConfig, OptunaModelConfig,
+                             SingleTransformerConfig, TransformersConfig)
+from src.containers.experiment import ExperimentContext
+from src.optuna.runners import WrapperOptunaRunner
+from src.serializers.experiment import ExperimentSerializer
+from src.tuning.runners import CrossValidationRunner
+
+TRIALS = {
+    "none": {"transformation": "none"},
+    "log": {"transformation": "log", "transformer__validate": True},
+    "power": {
+        "transformation": "power",
+        "transformer__method": "yeo-johnson",
+        "transformer__standardize": True,
+    },
+}
+
+
+@pytest.fixture
+def linear_context():
+    rng = np.random.default_rng(42)
+    n = 400
+    X = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n).astype(float),
+            "sex": rng.integers(0, 2, n).astype(float),
+            "bmi": rng.normal(30.0, 6.0, n),
+            "children": rng.integers(0, 5, n).astype(float),
+            "smoker": rng.integers(0, 2, n).astype(float),
+            "region": rng.choice(["northeast", "northwest", "southeast"], n),
+        }
+    )
+    y = pd.Series(np.exp(8 + 0.02 * X["age"] + X["smoker"] + rng.normal(0, 0.2, n)))
+
+    return ExperimentContext(
+        model_cfg=ModelConfig(
+            name="linear",
+            preprocess_num_features=True,
+            target_transformations=True,
+            params={},
+        ),
+        features_cfg=FeaturesConfig(
+            categorical=["children", "region"],
+            numeric=["age", "bmi"],
+            binary=["sex", "smoker"],
+        ),
+        optuna_model_cfg=OptunaModelConfig(name="linear", params={}),
+        transformers_cfg=TransformersConfig(
+            log=SingleTransformerConfig(params={"validate": [True, False]}),
+            power=SingleTransformerConfig(
+                params={
+                    "method": ["box-cox", "yeo-johnson"],
+                    "standardize": [True, False],
+                }
+            ),
+            none=SingleTransformerConfig(params={}),
+        ),
+        X_train=X,
+        X_test=X,
+        y_train=y,
+    )
+
+
+@pytest.mark.parametrize("transformation", list(TRIALS))
+def test_build_from_compiled_matches_build(linear_context, transformation):
+    exp_config = ExperimentSerializer.to_experiment_config(linear_context)
+    compiled = OptunaExperimentBuilder.compile(exp_config)
+
+    expected = OptunaExperimentBuilder.build(
+        exp_config, trial=FixedTrial(TRIALS[transformation])
+    )
+    result = OptunaExperimentBuilder.build_from_compiled(
+        compiled, trial=FixedTrial(TRIALS[transformation])
+    )
+
+    assert result.params == expected.params
+    assert type(result.pipeline) is type(expected.pipeline)
+    assert result.pipeline.get_params().keys() == expected.pipeline.get_params().keys()
+
+
+@pytest.mark.parametrize("transformation", list(TRIALS))
+def test_compiled_objective_matches_legacy_objective(linear_context, transformation):
+    cross_runner = CrossValidationRunner(
+        cv=KFold(n_splits=5, shuffle=True, random_state=42)
+    )
+    runner = WrapperOptunaRunner(optimizer=None, runner=cross_runner)
+    exp_config = ExperimentSerializer.to_experiment_config(linear_context)
+    trial = FixedTrial(TRIALS[transformation])
+
+    exp_setup = OptunaExperimentBuilder.build(exp_config, trial=trial)
+    exp_setup.pipeline.set_params(**exp_setup.params)
+    expected = cross_runner.run(
+        estimator=exp_setup.pipeline,
+        X_train=linear_context.X_train,
+        X_test=linear_context.X_test,
+        y_train=linear_context.y_train,
+    ).folds_scores_mean
+
+    compiled = runner.compile(exp_config)
+    score = runner.objective(trial, linear_context, compiled)
+
+    np.testing.assert_allclose(score, expected)
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from src.builders.pipeline.pipeline_builder import PipelineBuilder
+from src.builders.training.training_builder import TrainingBuilder
+from src.builders.transformer.transformer_wrapper_builder import \
+    TransformerWrapperBuilder
+from src.conf.schema import (CVConfig, FeaturesConfig, ModelConfig,
+                             StreamingConfig, TrainingStageConfig)
+from src.data.core import DataLoader, DataSaver
+from src.factories.io_factory import IOFactory
+from src.factories.transformer_factory import TargetTransformerFactory
+from src.features.core import optimize_dtypes
+from src.tuning.runners import StreamingLinearRunner
+
+FEATURES = FeaturesConfig(
+    categorical=["children", "region"],
+    numeric=["age", "bmi"],
+    binary=["sex", "smoker"],
+)
+
+
+@pytest.fixture
+def splits(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 5000
+    X = pd.DataFrame(
+        {
+            "age": rng.integers(18, 65, n).astype(float),
+            "sex": rng.integers(0, 2, n).astype(float),
+            "bmi": rng.normal(30.0, 6.0, n),
+            "children": rng.integers(0, 5, n).astype(float),
+            "smoker": rng.integers(0, 2, n).astype(float),
+            "region": rng.choice(["northeast", "northwest", "southeast"], n),
+        }
+    )
+    y = np.exp(8 + 0.02 * X["age"] + X["smoker"] + rng.normal(0, 0.3, n))
+    X = optimize_dtypes(X)
+    DataSaver(IOFactory.create_writers()).save_splitted_data(
+        {
+            "X_train": X.iloc[:4000],
+            "X_test": X.iloc[4000:],
+            "y_train": y.iloc[:4000].to_frame("charges"),
+            "y_test": y.iloc[4000:].to_frame("charges"),
+        },
+        tmp_path,
+    )
+    return X, y, tmp_path
+
+
+def build_estimator(preprocess_num_features, transformation):
+    pipeline = PipelineBuilder.build(
+        model_cfg=ModelConfig(
+            name="linear",
+            preprocess_num_features=preprocess_num_features,
+            target_transformations=True,
+            params={},
+            model_class=LinearRegression,
+        ),
+        features_cfg=FEATURES,
+    )
+    if transformation == "none":
+        return pipeline
+    return TransformerWrapperBuilder.build(
+        pipeline, TargetTransformerFactory.create(transformation)
+    )
+
+
+@pytest.mark.parametrize("preprocess_num_features", [True, False])
+@pytest.mark.parametrize("transformation", ["none", "log", "power"])
+def test_streaming_fit_matches_in_memory_fit(
+    splits, preprocess_num_features, transformation
+):
+    X, y, processed_dir = splits
+    streaming = DataLoader(IOFactory.create_readers()).load_streaming_data(
+        processed_dir, batch_size=700
+    )
+    estimator = build_estimator(preprocess_num_features, transformation)
+
+    result = StreamingLinearRunner(FEATURES, n_splits=5, random_state=42).run(
+        estimator, streaming.X_train, streaming.X_test, streaming.y_train
+    )
+    expected = clone(estimator).fit(X.iloc[:4000], y.iloc[:4000])
+
+    assert type(result.trained) is type(estimator)
+    np.testing.assert_allclose(
+        result.train_predictions, expected.predict(X.iloc[:4000]), rtol=1e-9
+    )
+    np.testing.assert_allclose(
+        result.test_predictions, expected.predict(X.iloc[4000:]), rtol=1e-9
+    )
+    np.testing.assert_allclose(
+        result.trained.predict(X.iloc[4000:]), result.test_predictions
+    )
+    assert len(result.folds_scores) == 5
+    assert 0.5 < result.folds_scores_mean < 1.0
+
+
+def test_streaming_runner_requires_linear_regression():
+    cfg = TrainingStageConfig(
+        data_dir=None,
+        training_dir=None,
+        cv=CVConfig(n_splits=5, shuffle=True, scoring="r2", random_state=42),
+        features=FEATURES,
+        model=ModelConfig(
+            name="tree",
+            preprocess_num_features=False,
+            target_transformations=False,
+            params={},
+        ),
+        transformers=None,
+        streaming=StreamingConfig(enabled=True),
+    )
+
+    assert isinstance(
+        TrainingBuilder.build_streaming_runner(LinearRegression, cfg),
+        StreamingLinearRunner,
+    )
+    with pytest.raises(ValueError, match="LinearRegression"):
+        TrainingBuilder.build_streaming_runner(DecisionTreeRegressor, cfg)